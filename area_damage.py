@@ -0,0 +1,44 @@
+import math
+import pygame
+from settings import EXPLOSION_RADIUS, EXPLOSION_MIN_FALLOFF
+
+class AreaDamage:
+    """The blasts of one simulation step, applied together once the collision pass is done.
+
+    queue() records where and how hard each blast hit; resolve() asks the
+    broadphase for the enemies around each one, rejects them on squared
+    distance and scales the damage from full at the centre down to
+    EXPLOSION_MIN_FALLOFF at the edge. Enemies killed by an earlier blast of
+    the batch are skipped by the later ones.
+    """
+    def __init__(self, radius=EXPLOSION_RADIUS, min_falloff=EXPLOSION_MIN_FALLOFF):
+        self.radius = radius
+        self.min_falloff = min_falloff
+        self.pending = []  # (x, y, damage)
+
+    def queue(self, x, y, damage):
+        self.pending.append((x, y, damage))
+
+    def falloff_damage(self, damage, distance_sq):
+        """Damage dealt at sqrt(distance_sq) from the centre, None outside the radius."""
+        if distance_sq > self.radius * self.radius:
+            return None
+        return int(damage * max(self.min_falloff, 1.0 - math.sqrt(distance_sq) / self.radius))
+
+    def resolve(self, broadphase, enemies, boss=None):
+        """Applies and clears the queued blasts; returns how many there were."""
+        blasts, self.pending = self.pending, []
+        reach = self.radius * 2 + 1
+        for x, y, damage in blasts:
+            area = pygame.Rect(x - self.radius, y - self.radius, reach, reach)
+            for enemy in broadphase.query(enemies, area):
+                dx, dy = enemy.rect.centerx - x, enemy.rect.centery - y
+                hit = self.falloff_damage(damage, dx * dx + dy * dy)
+                if hit is not None:
+                    enemy.take_damage(hit)
+            if boss:
+                dx, dy = boss.rect.centerx - x, boss.rect.centery - y
+                hit = self.falloff_damage(damage, dx * dx + dy * dy)
+                if hit is not None:
+                    boss.take_damage(hit)
+        return len(blasts)
@@ -0,0 +1,137 @@
+import pygame
+
+def cut_frames(sheet, frame_size, size=None):
+    """Splits a horizontal strip into frame_size cells, each scaled to size."""
+    frame_width = frame_size[0]
+    sheet_height = sheet.get_height()
+    frames = []
+    for x in range(0, sheet.get_width(), frame_width):
+        frame = pygame.Surface((frame_width, sheet_height), pygame.SRCALPHA)
+        frame.blit(sheet, (0, 0), (x, 0, frame_width, sheet_height))
+        if size is not None:
+            frame = pygame.transform.scale(frame, size)
+        frames.append(frame)
+    return frames
+
+
+class AssetCache:
+    """Process-wide registry of decoded images and scaled animation frames.
+
+    Frames are keyed by (path, frame size, target size, flip) and loaded once;
+    every sprite instance shares the same read-only tuple of Surfaces. Tinted
+    variants (hit flashes) add the tint to that key.
+    decode() may run on a worker thread ahead of time (see preloader.py);
+    load_image() then only converts on the main thread. atlas.py fills
+    entries with subsurfaces of its packed pages under the same keys.
+    """
+    def __init__(self):
+        self.sheets = {}   # path -> converted source Surface
+        self.decoded = {}  # path -> Surface decoded by decode(), not converted yet
+        self.entries = {}  # key -> Surface or tuple of Surfaces
+        self.hits = 0
+        self.misses = 0
+        self.disk_loads = 0
+
+    def load_image(self, path):
+        """Returns the converted source image for path, reading the file only once."""
+        image = self.sheets.get(path)
+        if image is None:
+            image = self.decoded.pop(path, None)
+            if image is None:
+                image = pygame.image.load(path)
+            image = image.convert_alpha()
+            self.disk_loads += 1
+            self.sheets[path] = image
+            self.decoded.pop(path, None) # A worker may have decoded it meanwhile
+        return image
+
+    def decode(self, path):
+        """Reads and decodes path without converting it, safe off the main thread.
+
+        A file that fails to load is left to load_image(), which raises on the main thread.
+        """
+        if path in self.sheets or path in self.decoded:
+            return
+        try:
+            self.decoded[path] = pygame.image.load(path)
+        except (pygame.error, FileNotFoundError):
+            return
+        if path in self.sheets:
+            self.decoded.pop(path, None) # load_image() got there first; nothing would ever pop it
+
+    def get(self, key, build):
+        """Returns the cached entry for key, calling build() on the first request."""
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            return entry
+        self.misses += 1
+        entry = build()
+        self.entries[key] = entry
+        return entry
+
+    def get_image(self, path, size=None, flip=False, fallback=None):
+        """Single image, optionally scaled to size and flipped horizontally."""
+        def build():
+            unflipped = self.entries.get((path, None, size, False)) if flip else None
+            if unflipped is not None:
+                return pygame.transform.flip(unflipped, True, False)
+            try:
+                image = self.load_image(path)
+            except (pygame.error, FileNotFoundError):
+                if fallback is None:
+                    raise
+                return fallback()
+            if size is not None:
+                image = pygame.transform.scale(image, size)
+            if flip:
+                image = pygame.transform.flip(image, True, False)
+            return image
+        return self.get((path, None, size, flip), build)
+
+    def get_frames(self, path, frame_size, size=None, flip=False, fallback=None, tint=None):
+        """Horizontal strip of frame_size cells, each scaled to size and optionally flipped.
+
+        fallback() is called (once) when the sheet cannot be loaded and its frames are
+        cached under the same key, so a missing asset never hits the disk twice.
+        With tint, copies of those frames with the colour added (BLEND_ADD) are returned instead.
+        """
+        if tint is not None:
+            def build_tinted():
+                frames = []
+                for frame in self.get_frames(path, frame_size, size, flip, fallback):
+                    frame = frame.copy()
+                    frame.fill(tint, special_flags=pygame.BLEND_ADD)
+                    frames.append(frame)
+                return tuple(frames)
+            return self.get((path, tuple(frame_size), size, flip, tuple(tint)), build_tinted)
+
+        def build():
+            try:
+                sheet = self.load_image(path)
+            except (pygame.error, FileNotFoundError):
+                if fallback is None:
+                    raise
+                return tuple(fallback())
+            frames = cut_frames(sheet, frame_size, size)
+            if flip:
+                frames = [pygame.transform.flip(frame, True, False) for frame in frames]
+            return tuple(frames)
+        return self.get((path, tuple(frame_size), size, flip), build)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'disk_loads': self.disk_loads,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+    def clear(self):
+        self.sheets.clear()
+        self.decoded.clear()
+        self.entries.clear()
+
+
+ASSETS = AssetCache()
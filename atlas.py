@@ -0,0 +1,170 @@
+import json
+import os
+import sys
+import pygame
+from settings import CHARACTER_DATA, ATLAS_PAGE_SIZE
+from gun_data import GUN_DATA
+from asset_cache import ASSETS, cut_frames
+
+ATLAS_DIR = os.path.join('cache', 'atlas') # Generated, see load_atlas()
+INDEX_PATH = os.path.join(ATLAS_DIR, 'index.json')
+ATLAS_VERSION = 1 # Bump when the frame rules below change, so old atlases get rebuilt
+PLAYER_SIZE = (62, 62) # Body, hand and emote frames as drawn in game
+PLAYER_SHEET_FRAME = (48, 48) # Cell size of the body sprite sheets
+GUN_SCALE = 0.6 # Guns in hand, relative to their GUN_DATA size
+BULLET_SIZE = (20, 10)
+PADDING = 1 # Transparent pixels between packed frames
+
+
+def gun_size(size):
+    """Size of a gun in a player's hand, from its GUN_DATA size."""
+    return (max(1, int(size[0] * GUN_SCALE)), max(1, int(size[1] * GUN_SCALE)))
+
+
+def atlas_entries():
+    """(path, sheet cell size or None, size) of every image a Player draws, keyed as AssetCache keys them."""
+    entries = []
+    for character in CHARACTER_DATA.values():
+        for action in ('idle', 'run', 'jump', 'double_jump'):
+            path = character.get(action)
+            if isinstance(path, list):
+                entries.extend((p, None, PLAYER_SIZE) for p in path)
+            elif path:
+                entries.append((path, PLAYER_SHEET_FRAME, PLAYER_SIZE))
+        for paths in character.get('hand_animations', {}).values():
+            entries.extend((p, None, PLAYER_SIZE) for p in (paths if isinstance(paths, list) else [paths]))
+        entries.extend((p, None, PLAYER_SIZE) for p in character.get('emotes', []))
+    for gun in GUN_DATA.values():
+        if 'size' in gun:
+            entries.append((gun['image_path'], None, gun_size(gun['size'])))
+        entries.append((gun['bullet_path'], None, BULLET_SIZE))
+    return [entry for entry in dict.fromkeys(entries) if os.path.isfile(entry[0])]
+
+
+def sources(entries):
+    """What the atlas was built from; any change (a file edited, an entry added) means a rebuild."""
+    signature = []
+    for path, frame_size, size in entries:
+        stat = os.stat(path)
+        signature.append([path, frame_size and list(frame_size), list(size), stat.st_mtime_ns, stat.st_size])
+    return signature
+
+
+def to_rgba(image):
+    """What convert_alpha() makes of a decoded image, without a display: colorkeyed pixels turn transparent."""
+    if image.get_flags() & pygame.SRCALPHA:
+        return image
+    rgba = pygame.Surface(image.get_size(), pygame.SRCALPHA)
+    colorkey = image.get_colorkey()
+    if colorkey:
+        rgba.fill((*colorkey[:3], 0))
+    rgba.blit(image, (0, 0))
+    return rgba
+
+
+def pack(sizes, page_size=ATLAS_PAGE_SIZE):
+    """Shelf-packs (w, h) boxes, tallest first, into square pages; returns (page, x, y) per box and the page count."""
+    places = [None] * len(sizes)
+    page = x = y = shelf = 0
+    for i in sorted(range(len(sizes)), key=lambda i: sizes[i][1], reverse=True):
+        w, h = sizes[i]
+        if x + w > page_size:
+            x, y, shelf = 0, y + shelf + PADDING, 0
+        if y + h > page_size:
+            page, x, y, shelf = page + 1, 0, 0, 0
+        places[i] = (page, x, y)
+        x += w + PADDING
+        shelf = max(shelf, h)
+    return places, page + 1
+
+
+def build_atlas(entries=None):
+    """Scales every entry's frames, packs them into pages and saves pages and index under ATLAS_DIR.
+
+    Uses no display (nothing is converted), so it can run on a worker thread.
+    Returns (index, pages); if the cache directory can't be written the atlas
+    is still returned and simply rebuilt on the next launch.
+    """
+    entries = atlas_entries() if entries is None else entries
+    built = []
+    for path, frame_size, size in entries:
+        try:
+            image = to_rgba(pygame.image.load(path))
+        except (pygame.error, FileNotFoundError):
+            continue # Left to AssetCache, which falls back to a placeholder
+        frames = cut_frames(image, frame_size, size) if frame_size else [pygame.transform.scale(image, size)]
+        built.append((path, frame_size, size, frames))
+    boxes = [frame.get_size() for *_, frames in built for frame in frames]
+    places, page_count = pack(boxes)
+    extents = [[0, 0] for _ in range(page_count)]
+    for (page, x, y), (w, h) in zip(places, boxes):
+        extents[page][0] = max(extents[page][0], x + w)
+        extents[page][1] = max(extents[page][1], y + h)
+    pages = [pygame.Surface(extent, pygame.SRCALPHA) for extent in extents]
+    index = {'version': ATLAS_VERSION, 'sources': sources(entries), 'pages': [], 'frames': []}
+    placed = iter(places)
+    for path, frame_size, size, frames in built:
+        rects = []
+        for frame in frames:
+            page, x, y = next(placed)
+            pages[page].blit(frame, (x, y), special_flags=pygame.BLEND_RGBA_MAX) # An exact copy onto the clear page
+            rects.append([page, x, y, *frame.get_size()])
+        index['frames'].append([path, frame_size and list(frame_size), list(size), rects])
+    try:
+        os.makedirs(ATLAS_DIR, exist_ok=True)
+        for i, surface in enumerate(pages):
+            # Raw pixels: reading them back is a memcpy, where a PNG of the same page takes ~15x longer to inflate
+            name = f"atlas_{i}.rgba"
+            with open(os.path.join(ATLAS_DIR, name), 'wb') as f:
+                f.write(pygame.image.tobytes(surface, 'RGBA'))
+            index['pages'].append([name, *surface.get_size()])
+        with open(INDEX_PATH, 'w', encoding='utf-8') as f:
+            json.dump(index, f)
+    except (OSError, pygame.error) as e:
+        print(f"Could not save the texture atlas: {e}")
+    return index, pages
+
+
+def read_page(name, size):
+    with open(os.path.join(ATLAS_DIR, name), 'rb') as f:
+        return pygame.image.frombytes(f.read(), size, 'RGBA')
+
+
+def load_atlas():
+    """Reads the saved atlas, rebuilding it first if it is missing or out of date. Safe off the main thread."""
+    entries = atlas_entries()
+    try:
+        with open(INDEX_PATH, encoding='utf-8') as f:
+            index = json.load(f)
+        if index['version'] == ATLAS_VERSION and index['sources'] == sources(entries):
+            return index, [read_page(name, (w, h)) for name, w, h in index['pages']]
+    except (OSError, ValueError, KeyError, TypeError, pygame.error):
+        pass # Missing, out of date or unreadable: rebuild
+    return build_atlas(entries)
+
+
+def install_atlas(atlas, cache=ASSETS):
+    """Converts the pages and hands their frames to the cache as subsurfaces; returns how many entries were added."""
+    index, pages = atlas
+    pages = [page.convert_alpha() for page in pages]
+    added = 0
+    for path, frame_size, size, rects in index['frames']:
+        frames = tuple(pages[page].subsurface(rect) for page, *rect in rects)
+        if frame_size is None:
+            key, entry = (path, None, tuple(size), False), frames[0]
+        else:
+            key, entry = (path, tuple(frame_size), tuple(size), False), frames
+        if key not in cache.entries:
+            cache.entries[key] = entry
+            added += 1
+    return added
+
+
+if __name__ == "__main__":
+    # Offline step: python atlas.py rebuilds the atlas (the game also does it on first run)
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    index, pages = build_atlas()
+    frames = sum(len(rects) for *_, rects in index['frames'])
+    print(f"Packed {frames} frames from {len(index['frames'])} images into {len(pages)} page(s) in {ATLAS_DIR}: "
+          + ", ".join(f"{w}x{h}" for w, h in (page.get_size() for page in pages)))
+    sys.exit(0 if index['pages'] else 1)
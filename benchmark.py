@@ -1,6 +1,11 @@
 import pygame
 import psutil
 import os
+from asset_cache import ASSETS
+from text_cache import TEXT
+from profiler import PROFILER
+from pool import POOLS
+from overlay_cache import OVERLAYS
 
 class Benchmark:
     def __init__(self, screen_width, screen_height):
@@ -19,12 +24,21 @@ class Benchmark:
         self.font = pygame.font.SysFont("Arial", 12)
         self.process = psutil.Process(os.getpid())
         
+        # Draw-time culling counts for the last frame
+        self.sprites_drawn = 0
+        self.sprites_culled = 0
+        self.bullets_live = None # None while bullets are sprites, see bullets.py
+        self.bullets_drawn = 0
+        self.startup = None # (ms to the first frame, ms until every asset was loaded or None), see Game.run
+        self.background_blits = None # Parallax blits in the last frame, None on screens without it
+
         # Timers
         self.last_update = 0
         self.update_interval = 100 # Update data every 100ms
 
     def toggle(self):
         self.active = not self.active
+        PROFILER.set_enabled(self.active) # Phase timers only run while the overlay shows them
 
     def update(self, clock):
         if not self.active:
@@ -53,6 +67,20 @@ class Benchmark:
             
             self.last_update = current_time
 
+    def record_culling(self, drawn, culled):
+        self.sprites_drawn = drawn
+        self.sprites_culled = culled
+
+    def record_bullets(self, live, drawn):
+        self.bullets_live = live
+        self.bullets_drawn = drawn
+
+    def record_background(self, blits):
+        self.background_blits = blits
+
+    def record_startup(self, first_frame_ms, assets_ms):
+        self.startup = (first_frame_ms, assets_ms)
+
     def draw_graph(self, surface, data, color, y_offset, max_val, label):
         if not data: return
         
@@ -79,6 +107,12 @@ class Benchmark:
         text_surf = self.font.render(f"{label}: {current_val:.1f}", True, color)
         surface.blit(text_surf, (self.x + 5, self.y + y_offset + 5))
 
+    def draw_label(self, surface, text, color, y_offset):
+        # Single text strip below the graphs
+        pygame.draw.rect(surface, (0, 0, 0), (self.x, self.y + y_offset, self.width, 16))
+        text_surf = self.font.render(text, True, color)
+        surface.blit(text_surf, (self.x + 5, self.y + y_offset + 1))
+
     def draw(self, screen):
         if not self.active:
             return
@@ -91,3 +125,30 @@ class Benchmark:
         
         # Draw RAM (Blue) - Scale 0 to 500 MB (Adjust as needed)
         self.draw_graph(screen, self.ram_history, (50, 150, 255), 90, 500, "RAM (MB)")
+
+        # Asset cache counters: spawning sprites should only add hits, never disk loads
+        assets = ASSETS.stats()
+        self.draw_label(screen, f"Assets: {assets['hits']} hit / {assets['misses']} miss / {assets['disk_loads']} disk", (255, 215, 0), 135)
+        self.draw_label(screen, f"Text cache: {TEXT.hit_rate() * 100:.1f}% hit ({len(TEXT.surfaces)} surfs, {TEXT.used_bytes // 1024} KB)", (200, 200, 200), 151)
+        self.draw_label(screen, f"Sprites: {self.sprites_drawn} drawn / {self.sprites_culled} culled", (120, 255, 120), 167)
+        heaviest = ", ".join(f"{name} {ms:.1f}" for name, ms in PROFILER.averages()[:3])
+        self.draw_label(screen, f"ms: {heaviest} (F4 trace)", (255, 160, 80), 183)
+
+        # Pool occupancy: in use / allocated, high-water mark
+        pools = [f"{pool.label} {pool.in_use}/{pool.created} hw{pool.high_water}" for pool in POOLS.values()]
+        self.draw_label(screen, "Pools: " + "  ".join(pools[:2]), (180, 140, 255), 199)
+        self.draw_label(screen, "Pools: " + "  ".join(pools[2:]), (180, 140, 255), 215)
+        if self.bullets_live is not None:
+            self.draw_label(screen, f"Bullets (NumPy): {self.bullets_live} live / {self.bullets_drawn} drawn", (255, 120, 120), 231)
+        if self.startup and self.startup[0] is not None:
+            first_frame_ms, assets_ms = self.startup
+            assets = f"{assets_ms:.0f} ms" if assets_ms is not None else "loading"
+            self.draw_label(screen, f"Startup: first frame {first_frame_ms:.0f} ms, assets {assets}", (140, 220, 255), 247)
+        if self.background_blits is not None:
+            # Clearing the screen plus the parallax layers, averaged like the phases above
+            phases = dict(PROFILER.averages())
+            background_ms = phases.get('draw_background', 0.0) + phases.get('parallax', 0.0)
+            self.draw_label(screen, f"Background: {background_ms:.2f} ms ({self.background_blits} blits)", (170, 210, 170), 263)
+        # Surfaces created per frame; both caches should settle at 0
+        counts = PROFILER.count_averages()
+        self.draw_label(screen, f"Allocs/frame: overlay {counts.get('overlay allocs', 0):.2f}, text {counts.get('text allocs', 0):.2f} ({len(OVERLAYS.surfaces)} overlays, {OVERLAYS.used_bytes() // 1024} KB)", (230, 230, 140), 279)
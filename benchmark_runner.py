@@ -7,16 +7,63 @@ import random
 import webbrowser
 import json
 import platform
+import argparse
+import math
 from pathlib import Path
 from main import Game
+from benchmark import Benchmark
 from sprites import Player, Platform, Enemy, BossGate
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, SIMULATION_HZ
+from sim_clock import CLOCK
+from replay import Recording
+from profiler import PROFILER
+
+PHASE_COLORS = ['#e91e63', '#2196f3', '#ffc107', '#4caf50', '#9c27b0', '#00bcd4', '#ff5722', '#8bc34a',
+                '#3f51b5', '#cddc39', '#795548', '#607d8b', '#f44336', '#009688', '#ff9800']
+
+AIM_DIRECTIONS = ['left', 'up_left', 'up', 'up_right', 'right', 'down_right', 'down', 'down_left']
+
+class StressController:
+    """Synthetic input for the stress arena: sweeps left/right, rotates the aim and fires constantly.
+
+    Driven by its own seeded RNG and a tick counter, so every run presses the same buttons.
+    """
+    def __init__(self, seed=0):
+        self.rng = random.Random(seed)
+        self.tick = 0
+
+    def get_actions(self):
+        t = self.tick / SIMULATION_HZ
+        self.tick += 1
+        return {
+            'move_x': (math.sin(t * 3) + 1) / 2,
+            'jump': self.rng.random() < 0.08,
+            'dash': self.rng.random() < 0.03,
+            'shoot': True,
+            'shoot_direction': AIM_DIRECTIONS[int(t * 5) % 8],
+            'switch_weapon': False,
+            'activate_ultimate': self.rng.random() < 0.01
+        }
 
 class BenchmarkGame(Game):
-    def __init__(self, duration=20):
+    """Runs a fixed workload and writes an HTML report.
+
+    The default workload is a seeded stress arena; with a Recording it replays a
+    recorded session instead. Either way the simulation is identical from run to
+    run, so differences in the report come from the code and the machine only.
+    """
+    def __init__(self, duration=20, seed=0, recording=None, dynamic_resolution=False):
         super().__init__()
+        self.benchmark = Benchmark(SCREEN_WIDTH, SCREEN_HEIGHT) # Game only builds it on F3; the report reads its culling counts
         self.duration = duration
+        self.seed = seed
+        self.recording = recording
+        self.rng = random.Random(seed) # Enemy spawns
         self.start_time = None
+        self.start_step = CLOCK.steps
+        self.fps_cap = 0 # Measure how fast frames can be drawn; the simulation still steps at SIMULATION_HZ
+        self.render_scale.set_enabled(dynamic_resolution) # Native unless asked, whatever the saved setting
+        self.render_scale.changes = 0
         
         # Metrics Storage
         self.metrics = {
@@ -25,32 +72,46 @@ class BenchmarkGame(Game):
             'cpu': [],
             'ram': [],
             'sprites': [],
+            'culled': [],
+            'phases': [], # {phase: ms} of the last profiled frame
+            'render_scale': [], # % of native resolution the level was drawn at
             'timestamps': []
         }
         self.process = psutil.Process(os.getpid())
-        
+        PROFILER.set_enabled(True)
+
+        if recording:
+            self.replay_controllers = [c for c in recording.replay(self) if c]
+            self.duration = recording.ticks / SIMULATION_HZ
+            self.start_step = CLOCK.steps
+            print(f"--- Replaying level {recording.level} ({recording.ticks} ticks) ---")
+            return
+
         # Level Setup
+        random.seed(seed)
         self.all_sprites.empty()
         self.platforms.empty()
         self.enemies.empty()
         
         ground = Platform(-2000, 500, 10000, 50)
-        self.all_sprites.add(ground)
         self.platforms.add(ground)
 
         wall_width = 50
         left_wall = Platform(0, 0, wall_width, SCREEN_HEIGHT)
         right_wall = Platform(SCREEN_WIDTH - wall_width, 0, wall_width, SCREEN_HEIGHT)
-        self.all_sprites.add(left_wall, right_wall)
         self.platforms.add(left_wall, right_wall)
+        self.build_static_level()
         
         self.boss_gate = BossGate(5000, 400)
         self.all_sprites.add(self.boss_gate)
         self.boss_gate_group.add(self.boss_gate)
         
         self.player = Player(400, 400, self, upgrades=self.upgrades, character_id='cyborg')
+        self.player.player_index = 0
         self.player.health = 99999 
         self.all_sprites.add(self.player)
+        self.players = [self.player]
+        self.controller_manager.set_controllers(StressController(seed))
         
         self.player.unlocked_weapons.append('spread_shot')
         self.player.current_weapon_index = self.player.unlocked_weapons.index('spread_shot')
@@ -65,17 +126,29 @@ class BenchmarkGame(Game):
                 self.running = False
 
     def update_game_state(self):
-        current_time = time.time()
-        elapsed = current_time - self.start_time
+        # Workload progress is measured in simulated time so every run covers the same steps
+        elapsed = (CLOCK.steps - self.start_step) / SIMULATION_HZ
         
         if self.clock.get_fps() > 0:
             self.metrics['fps'].append(round(self.clock.get_fps(), 1))
             self.metrics['frametime'].append(round(self.clock.get_time(), 1))
             self.metrics['cpu'].append(psutil.cpu_percent(interval=None))
             self.metrics['ram'].append(round(self.process.memory_info().rss / (1024 * 1024), 1))
-            self.metrics['sprites'].append(len(self.all_sprites))
+            self.metrics['sprites'].append(len(self.all_sprites) + (self.bullets.live() if self.bullets else 0))
+            self.metrics['culled'].append(self.benchmark.sprites_culled)
+            self.metrics['phases'].append(PROFILER.last_frame)
+            self.metrics['render_scale'].append(round(self.render_scale.scale * 100))
             self.metrics['timestamps'].append(round(elapsed, 1))
 
+        if self.recording:
+            finished = all(c.finished for c in self.replay_controllers)
+            if finished or self.game_state not in ['platformer', 'boss_fight']:
+                self.running = False
+                self.generate_report()
+                return
+            super().update_game_state()
+            return
+
         if elapsed >= self.duration:
             self.running = False
             self.generate_report()
@@ -84,33 +157,16 @@ class BenchmarkGame(Game):
         # Ramp up intensity
         target_enemies = 10 + int(elapsed * 3) # Up to ~70 enemies
         if len(self.enemies) < target_enemies:
-            if random.random() < 0.3:
-                ex = random.randint(100, SCREEN_WIDTH - 100)
-                ey = random.randint(100, 400)
+            if self.rng.random() < 0.3:
+                ex = self.rng.randint(100, SCREEN_WIDTH - 100)
+                ey = self.rng.randint(100, 400)
                 enemy = Enemy(ex, ey, self.player, patrol_distance=200, speed=3)
                 self.all_sprites.add(enemy)
                 self.enemies.add(enemy)
 
-        self.controller.get_actions = self.mock_stress_actions
         if self.player.health < 1000: self.player.health = 99999
         super().update_game_state()
 
-    def mock_stress_actions(self):
-        import math
-        t = time.time()
-        move_val = (math.sin(t * 3) + 1) / 2 
-        directions = ['left', 'up_left', 'up', 'up_right', 'right', 'down_right', 'down', 'down_left']
-        aim_dir = directions[int(t * 5) % 8]
-        return {
-            'move_x': move_val, 
-            'jump': random.random() < 0.08,
-            'dash': random.random() < 0.03,
-            'shoot': True, 
-            'shoot_direction': aim_dir,
-            'switch_weapon': False,
-            'activate_ultimate': random.random() < 0.01
-        }
-
     def generate_report(self):
         if not self.metrics['fps']: return
 
@@ -135,6 +191,12 @@ class BenchmarkGame(Game):
         
         max_cpu = max(cpu_data)
         max_ram = max(self.metrics['ram'])
+        avg_culled = statistics.mean(self.metrics['culled'])
+        scale_data = self.metrics['render_scale']
+        if self.render_scale.enabled:
+            resolution = f"Dynamic resolution: {statistics.mean(scale_data):.0f}% avg, {scale_data[-1]}% final, {self.render_scale.changes} changes"
+        else:
+            resolution = "Native resolution"
 
         verdict_color = "#4caf50" if low_1_percent > 50 else "#ff9800" if low_1_percent > 30 else "#f44336"
         verdict_text = "EXCELLENT" if low_1_percent > 50 else "PLAYABLE" if low_1_percent > 30 else "POOR"
@@ -152,6 +214,20 @@ class BenchmarkGame(Game):
         cpu_json = json.dumps(cpu_data)
         time_json = json.dumps(time_data)
         pie_data_json = json.dumps([smooth, playable, stutter])
+        scale_json = json.dumps(scale_data)
+
+        # One stacked band per profiled phase, heaviest at the bottom
+        phase_names = sorted({name for frame in self.metrics['phases'] for name in frame},
+                             key=lambda name: -sum(frame.get(name, 0) for frame in self.metrics['phases']))
+        phases_json = json.dumps([{
+            'label': name,
+            'data': [round(frame.get(name, 0), 3) for frame in self.metrics['phases']],
+            'backgroundColor': PHASE_COLORS[i % len(PHASE_COLORS)],
+            'borderWidth': 0,
+            'pointRadius': 0,
+            'fill': True
+        } for i, name in enumerate(phase_names)])
+        workload = f"Replay: Level {self.recording.level}" if self.recording else f"Stress Test (seed {self.seed})"
 
         html = f"""
 <!DOCTYPE html>
@@ -197,7 +273,7 @@ class BenchmarkGame(Game):
         <header>
             <div>
                 <h1>SPOONHEAD BENCHMARK</h1>
-                <div class="subtitle">{time.strftime('%Y-%m-%d %H:%M:%S')} • Duration: {self.duration}s • Stress Test</div>
+                <div class="subtitle">{time.strftime('%Y-%m-%d %H:%M:%S')} • Duration: {self.duration:.1f}s • {workload} • {resolution}</div>
             </div>
         </header>
 
@@ -249,13 +325,18 @@ class BenchmarkGame(Game):
                     </div>
                     <div class="card">
                         <div class="metric-val">{max(self.metrics['sprites'])}</div>
-                        <div class="metric-lbl">Max Sprites</div>
+                        <div class="metric-lbl">Max Sprites ({avg_culled:.0f} culled avg)</div>
                     </div>
                 </div>
 
                 <div class="chart-box">
                     <canvas id="lineChart"></canvas>
                 </div>
+
+                <div class="chart-box">
+                    <h4 style="margin: 0 0 10px 0; text-align: center; color: #888;">Frame Time by Phase (ms)</h4>
+                    <canvas id="phaseChart"></canvas>
+                </div>
             </div>
 
             <!-- RIGHT COLUMN -->
@@ -304,6 +385,15 @@ class BenchmarkGame(Game):
                             pointRadius: 0,
                             tension: 0.4,
                             yAxisID: 'y1'
+                        }},
+                        {{
+                            label: 'Render scale %',
+                            data: {scale_json},
+                            borderColor: '#2196f3',
+                            borderWidth: 1,
+                            stepped: true,
+                            pointRadius: 0,
+                            yAxisID: 'y1'
                         }}
                     ]
                 }},
@@ -319,6 +409,22 @@ class BenchmarkGame(Game):
                 }}
             }});
 
+            // Stacked per-phase frame time
+            new Chart(document.getElementById('phaseChart'), {{
+                type: 'line',
+                data: {{ labels: {time_json}, datasets: {phases_json} }},
+                options: {{
+                    responsive: true,
+                    maintainAspectRatio: false,
+                    interaction: {{ mode: 'index', intersect: false }},
+                    scales: {{
+                        x: {{ grid: {{color: '#333'}} }},
+                        y: {{ stacked: true, min: 0, grid: {{color: '#333'}} }}
+                    }},
+                    plugins: {{ legend: {{ position: 'bottom', labels: {{ color: '#ccc', boxWidth: 12 }} }} }}
+                }}
+            }});
+
             // Pie Chart
             new Chart(document.getElementById('pieChart'), {{
                 type: 'doughnut',
@@ -355,7 +461,15 @@ class BenchmarkGame(Game):
             pass
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Spoonhead benchmark: runs a fixed workload and writes benchmark_report.html.")
+    parser.add_argument('--duration', type=float, default=20, help="stress test length in simulated seconds (default: 20)")
+    parser.add_argument('--seed', type=int, default=0, help="seed for the stress test's input and enemy spawns (default: 0)")
+    parser.add_argument('--replay', metavar='PATH', help="replay a recorded session (F5 in game) instead of the stress test")
+    parser.add_argument('--dynamic-resolution', action='store_true', help="let the render scale drop below native when frames run over budget")
+    args = parser.parse_args()
+
     print("Initializing Advanced Stress Test...")
     os.environ['SDL_AUDIODRIVER'] = 'dummy'
-    game = BenchmarkGame(duration=20)
+    recording = Recording.load(args.replay) if args.replay else None
+    game = BenchmarkGame(duration=args.duration, seed=args.seed, recording=recording, dynamic_resolution=args.dynamic_resolution)
     game.run()
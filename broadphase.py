@@ -0,0 +1,203 @@
+import math
+
+
+class SpatialGrid:
+    """Uniform grid keyed on world coordinates for broadphase collision queries.
+
+    Each body is bucketed into every cell its rect overlaps. update() only
+    re-buckets a body when it crosses into a different range of cells, so
+    bodies that move a few pixels per frame cost a tuple compare.
+    """
+    def __init__(self, cell_size=128):
+        self.cell_size = cell_size
+        self.cells = {}   # (cx, cy) -> {body: None}, insertion ordered
+        self.spans = {}   # body -> (cx0, cy0, cx1, cy1)
+
+    def _span(self, rect):
+        size = self.cell_size
+        return (rect.left // size, rect.top // size,
+                max(rect.left, rect.right - 1) // size, max(rect.top, rect.bottom - 1) // size)
+
+    def _add_to_cells(self, body, span):
+        cx0, cy0, cx1, cy1 = span
+        cells = self.cells
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                cell = cells.get((cx, cy))
+                if cell is None:
+                    cell = cells[(cx, cy)] = {}
+                cell[body] = None
+
+    def _remove_from_cells(self, body, span):
+        cx0, cy0, cx1, cy1 = span
+        cells = self.cells
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                cell = cells.get((cx, cy))
+                if cell is not None:
+                    cell.pop(body, None)
+                    if not cell:
+                        del cells[(cx, cy)]
+
+    def insert(self, body, rect=None):
+        span = self._span(rect or body.rect)
+        self.spans[body] = span
+        self._add_to_cells(body, span)
+
+    def remove(self, body):
+        span = self.spans.pop(body, None)
+        if span is not None:
+            self._remove_from_cells(body, span)
+
+    def update(self, body, rect=None):
+        """Incrementally moves body to the cells covering its current rect."""
+        span = self._span(rect or body.rect)
+        old_span = self.spans.get(body)
+        if span == old_span:
+            return
+        if old_span is not None:
+            self._remove_from_cells(body, old_span)
+        self.spans[body] = span
+        self._add_to_cells(body, span)
+
+    def sync(self, bodies):
+        """Makes the grid mirror bodies (e.g. a sprite Group): drops the missing, updates the rest."""
+        for body in [body for body in self.spans if body not in bodies]:
+            self.remove(body)
+        for body in bodies:
+            self.update(body)
+
+    def query(self, rect):
+        """Returns the bodies in cells overlapping rect, without duplicates, in a stable order."""
+        cx0, cy0, cx1, cy1 = self._span(rect)
+        cells = self.cells
+        if cx0 == cx1 and cy0 == cy1:
+            cell = cells.get((cx0, cy0))
+            return list(cell) if cell else []
+        found = {}
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                cell = cells.get((cx, cy))
+                if cell:
+                    found.update(cell)
+        return list(found)
+
+    def clear(self):
+        self.cells.clear()
+        self.spans.clear()
+
+    def __len__(self):
+        return len(self.spans)
+
+
+class Broadphase:
+    """One SpatialGrid per sprite group, synced once per tick and queried by the collision passes."""
+    def __init__(self, cell_size=128):
+        self.cell_size = cell_size
+        self.grids = {}  # group -> SpatialGrid
+
+    def sync(self, *groups):
+        for group in groups:
+            grid = self.grids.get(group)
+            if grid is None:
+                grid = self.grids[group] = SpatialGrid(self.cell_size)
+            grid.sync(group)
+
+    def query(self, group, rect):
+        """Candidates from group whose cells overlap rect; sprites killed since the last sync are skipped."""
+        grid = self.grids.get(group)
+        if grid is None:
+            return [sprite for sprite in group if sprite.rect.colliderect(rect)]
+        return [sprite for sprite in grid.query(rect) if sprite in group]
+
+    def collide(self, group, rect, test=None):
+        """Like pygame.sprite.spritecollide against a rect: candidates whose rect (or test) overlaps."""
+        if test is None:
+            return [sprite for sprite in self.query(group, rect) if rect.colliderect(sprite.rect)]
+        return [sprite for sprite in self.query(group, rect) if test(sprite)]
+
+    def clear(self):
+        self.grids.clear()
+
+
+class PlatformIndex:
+    """Immutable x-bucketed table of static platforms plus a short list of moving ones.
+
+    Built once per level. near(rect) yields exactly the platforms a full scan
+    of the group could find touching rect, in the same group order, so
+    collision resolution gives identical results while only visiting the
+    handful of platforms around the body.
+    """
+    def __init__(self, platforms, bucket_width=128):
+        self.bucket_width = bucket_width
+        self.platforms = tuple(platforms)
+        self.buckets = {}  # bucket -> [(order, platform)]
+        self.moving = []   # (order, platform, first bucket, last bucket) over the whole patrol
+        for order, platform in enumerate(self.platforms):
+            if hasattr(platform, 'move_axis'):
+                self.moving.append((order, platform) + self._sweep(platform))
+                continue
+            first, last = self._bucket_span(platform.rect)
+            for bucket in range(first, last + 1):
+                self.buckets.setdefault(bucket, []).append((order, platform))
+        self._spans = {}  # (first, last) -> candidates sorted by order
+
+    def _bucket_span(self, rect):
+        return rect.left // self.bucket_width, (rect.right - 1) // self.bucket_width
+
+    def _sweep(self, platform):
+        """Buckets a moving platform can reach; x movers patrol move_range (+ one step of overshoot) either side."""
+        left, right = platform.rect.left, platform.rect.right
+        if platform.move_axis == 'x':
+            reach = platform.move_range + math.ceil(abs(platform.speed)) + 1  # rect rounding can add a pixel per step
+            start = int(platform.start_pos.x)
+            left, right = min(left, start - reach), max(right, start + platform.rect.width + reach)
+        return left // self.bucket_width, (right - 1) // self.bucket_width
+
+    def _candidates(self, first, last):
+        candidates = self._spans.get((first, last))
+        if candidates is None:
+            found = {order: platform for order, platform, sweep_first, sweep_last in self.moving
+                     if sweep_first <= last and sweep_last >= first}
+            for bucket in range(first, last + 1):
+                found.update(self.buckets.get(bucket, ()))
+            candidates = self._spans[(first, last)] = sorted(found.items(), key=lambda item: item[0])
+        return candidates
+
+    def near(self, rect):
+        """Yields platforms that may overlap rect, in group order.
+
+        The caller may move rect between iterations (as collision resolution
+        does); if it leaves the buckets already covered the table is queried
+        again and iteration resumes after the last platform yielded.
+        """
+        bucket_width = self.bucket_width
+        x, width = rect.x, rect.width
+        first, last = x // bucket_width, (x + width - 1) // bucket_width
+        candidates = self._spans.get((first, last))
+        if candidates is None:
+            candidates = self._candidates(first, last)
+        for order, platform in candidates:
+            yield platform
+            if rect.x != x or rect.width != width:
+                break
+        else:
+            return
+        # rect moved mid-iteration: widen the query and carry on after the current platform
+        while True:
+            x, width = rect.x, rect.width
+            first, last = min(first, x // bucket_width), max(last, (x + width - 1) // bucket_width)
+            candidates = self._candidates(first, last)
+            index = next((i for i, item in enumerate(candidates) if item[0] > order), len(candidates))
+            for order, platform in candidates[index:]:
+                yield platform
+                if rect.x != x or rect.width != width:
+                    break
+            else:
+                return
+
+    def __iter__(self):
+        return iter(self.platforms)
+
+    def __len__(self):
+        return len(self.platforms)
@@ -0,0 +1,353 @@
+from settings import BULLET_ENGINE_MIN
+from sim_clock import CLOCK
+from sprites import PROJECTILE_BOUNDS, BOSS_PROJECTILE_BOUNDS
+
+try:
+    import numpy as np
+except ImportError: # Optional: without numpy the game keeps its bullets as sprites
+    np = None
+
+NUMPY_AVAILABLE = np is not None
+NO_PAIRS = (np.zeros(0, np.int64), np.zeros(0, np.int64)) if np is not None else None
+
+PLAYER_SHOT, ENEMY_SHOT, BOSS_SHOT = 0, 1, 2
+CELL = 128 # spatial hash cell; every bullet must fit in one cell
+KEY_STRIDE = 1 << 24 # hash key = cell x * KEY_STRIDE + cell y
+FRAME_TIME = 100 # ms per frame of the player shot animation, as in Projectile.update
+
+# One array per bullet attribute (name -> dtype). damage keeps the Python value the shot was fired with,
+# frames the animation list of the gun that fired it (equip_gun replaces the class-wide lists).
+COLUMNS = {
+    'x': 'i8', 'y': 'i8', 'w': 'i8', 'h': 'i8', 'prev_x': 'i8', 'prev_y': 'i8',
+    'vx': 'f8', 'vy': 'f8', 'gravity': 'f8', 'life': 'i8', 'explosive': '?',
+    'frame': 'i1', 'frame_count': 'i1', 'last_frame': 'i8', 'damage': 'O', 'image': 'O', 'frames': 'O',
+}
+
+
+class BulletArrays:
+    """Every live bullet of one kind as parallel arrays; rows [0, count) are live, in spawn order.
+
+    Positions stay integer like a sprite's rect and move by the truncated
+    velocity each step, exactly as Rect.move_ip does, so a bullet here goes
+    where its sprite would have gone.
+    """
+    def __init__(self, capacity=256):
+        self.count = 0
+        self.capacity = 0
+        self.grow(capacity)
+
+    def grow(self, capacity):
+        for name, dtype in COLUMNS.items():
+            column = np.zeros(capacity, dtype) if dtype != 'O' else np.full(capacity, None, dtype)
+            if self.capacity:
+                column[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, column)
+        self.capacity = capacity
+
+    def append(self, rect, vx, vy, damage=None, image=None, gravity=0.0, life=0, explosive=False, frames=None, frame=0, last_frame=0):
+        if self.count == self.capacity:
+            self.grow(self.capacity * 2)
+        i = self.count
+        self.x[i] = self.prev_x[i] = rect.x
+        self.y[i] = self.prev_y[i] = rect.y
+        self.w[i], self.h[i] = rect.size
+        self.vx[i], self.vy[i], self.gravity[i] = vx, vy, gravity
+        self.life[i], self.explosive[i], self.damage[i], self.image[i] = life, explosive, damage, image
+        self.frames[i], self.frame[i], self.last_frame[i] = frames, frame, last_frame
+        self.frame_count[i] = len(frames) if frames else 1
+        self.count += 1
+
+    def keep(self, mask):
+        """Drops the live rows where mask is False; the others keep their order."""
+        n = self.count
+        kept = int(np.count_nonzero(mask))
+        if kept == n:
+            return
+        for name in COLUMNS:
+            column = getattr(self, name)
+            column[:kept] = column[:n][mask]
+        self.damage[kept:n] = self.image[kept:n] = self.frames[kept:n] = None
+        self.count = kept
+
+    def clear(self):
+        self.damage[:self.count] = self.image[:self.count] = self.frames[:self.count] = None
+        self.count = 0
+
+    def move(self):
+        n = self.count
+        vy = self.vy[:n]
+        vy += self.gravity[:n]
+        self.x[:n] += self.vx[:n].astype(np.int64) # astype truncates toward zero like move_ip
+        self.y[:n] += vy.astype(np.int64)
+
+    def overlaps(self, rect):
+        """Mask of the live rows whose rect overlaps rect (Rect.colliderect)."""
+        n = self.count
+        x, y = self.x[:n], self.y[:n]
+        return (x < rect.right) & (x + self.w[:n] > rect.x) & (y < rect.bottom) & (y + self.h[:n] > rect.y)
+
+    def hashed(self):
+        return hash_cells(self.x[:self.count], self.y[:self.count])
+
+
+def hash_cells(x, y):
+    """Boxes at (x, y) sorted by the hash cell of their top-left corner: (box order, sorted keys)."""
+    keys = (x // CELL) * KEY_STRIDE + y // CELL
+    order = np.argsort(keys, kind='stable')
+    return order, keys[order]
+
+
+class Targets:
+    """A batch of rects filed in the bullet hash, to test a whole array of boxes against them at once.
+
+    A bullet is filed under the cell of its top-left corner and is no bigger
+    than a cell, so it can only overlap the targets filed under that cell:
+    each target goes into every cell from one cell up-left of its corner
+    to its far edge. pairs() joins the two by cell and checks the exact overlap.
+    """
+    def __init__(self, rects):
+        bounds = np.array([(r.x, r.y, r.right, r.bottom) for r in rects], np.int64).reshape(-1, 4)
+        self.x0, self.y0, self.x1, self.y1 = bounds.T
+        ids = np.flatnonzero((self.x1 > self.x0) & (self.y1 > self.y0)) # empty rects never collide
+        cx0 = (self.x0[ids] - CELL + 1) // CELL
+        cy0 = (self.y0[ids] - CELL + 1) // CELL
+        cols = (self.x1[ids] - 1) // CELL - cx0 + 1
+        rows = (self.y1[ids] - 1) // CELL - cy0 + 1
+        cells = cols * rows
+        self.ids = np.repeat(ids, cells)
+        k = np.arange(self.ids.size) - np.repeat(np.cumsum(cells) - cells, cells)
+        rows = np.repeat(rows, cells)
+        self.keys = (np.repeat(cx0, cells) + k // rows) * KEY_STRIDE + np.repeat(cy0, cells) + k % rows
+        by_key = np.argsort(self.keys, kind='stable')
+        self.sorted_keys, self.sorted_ids = self.keys[by_key], self.ids[by_key]
+
+    def pairs(self, boxes, hashed):
+        """(box rows, target indices) of every overlapping pair, by row and then target order.
+
+        boxes has x, y, w, h arrays (a BulletArrays) and hashed is hash_cells() of its rows.
+        The smaller side is looked up in the sorted keys of the other.
+        """
+        order, keys = hashed
+        if len(keys) < len(self.keys):
+            lo = np.searchsorted(self.sorted_keys, keys, 'left')
+            counts = np.searchsorted(self.sorted_keys, keys, 'right') - lo
+            total = int(counts.sum())
+            if not total:
+                return NO_PAIRS
+            b = np.repeat(order, counts)
+            t = self.sorted_ids[np.arange(total) - np.repeat(np.cumsum(counts) - counts - lo, counts)]
+        else:
+            lo = np.searchsorted(keys, self.keys, 'left')
+            counts = np.searchsorted(keys, self.keys, 'right') - lo
+            total = int(counts.sum())
+            if not total:
+                return NO_PAIRS
+            t = np.repeat(self.ids, counts)
+            b = order[np.arange(total) - np.repeat(np.cumsum(counts) - counts - lo, counts)]
+        x, y = boxes.x[b], boxes.y[b]
+        hit = (x < self.x1[t]) & (x + boxes.w[b] > self.x0[t]) & (y < self.y1[t]) & (y + boxes.h[b] > self.y0[t])
+        b, t = b[hit], t[hit]
+        order = np.lexsort((t, b))
+        return b[order], t[order]
+
+
+def group_pairs(rows, targets):
+    """{bullet row: [target index, ...]} from pairs()."""
+    grouped = {}
+    for row, target in zip(rows.tolist(), targets.tolist()):
+        grouped.setdefault(row, []).append(target)
+    return grouped
+
+
+class BulletEngine:
+    """Player, enemy and boss bullets kept in NumPy arrays instead of one sprite each.
+
+    Shots are still fired as pooled sprites; once BULLET_ENGINE_MIN of a kind
+    are in flight Game hands them over with absorb(), and from then on they
+    are moved, culled and hit tested in vectorized batches until the last
+    one is gone. Fewer stay sprites, which step faster than the array setup. The rules are those of the sprite classes
+    and the collision passes in Game.update_game_state, applied in the same
+    order, so a run gives the same result with or without the engine.
+    """
+    def __init__(self):
+        self.stores = {kind: BulletArrays() for kind in (PLAYER_SHOT, ENEMY_SHOT, BOSS_SHOT)}
+        self.static_platforms = Targets([])
+        self.moving_platforms = []
+
+    def live(self):
+        return sum(store.count for store in self.stores.values())
+
+    def set_level(self, platforms):
+        """Drops every bullet and files the new level's static platforms in the hash once."""
+        self.clear()
+        self.static_platforms = Targets([p.rect for p in platforms if not hasattr(p, 'move_axis')])
+        self.moving_platforms = [p for p in platforms if hasattr(p, 'move_axis')]
+
+    def clear(self):
+        for store in self.stores.values():
+            store.clear()
+
+    def handles(self, kind):
+        """True while bullets of kind live here rather than as sprites in their group."""
+        return self.stores[kind].count > 0
+
+    def absorb(self, group, kind):
+        """Takes over the sprites of group as bullets of kind and kills them back to their pool.
+
+        Returns False, leaving them sprites, while the engine holds none of kind
+        and the group has fewer than BULLET_ENGINE_MIN; then the group steps itself.
+        """
+        store = self.stores[kind]
+        if not store.count and len(group) < BULLET_ENGINE_MIN:
+            return False
+        for sprite in group.sprites():
+            if kind == PLAYER_SHOT:
+                custom = sprite.image is not sprite.anim_frames[sprite.frame_index] # ultimates draw their own shot
+                store.append(sprite.rect, sprite.vx, sprite.vy, sprite.damage, sprite.image if custom else None,
+                             gravity=sprite.gravity, explosive=sprite.is_explosive, frames=sprite.anim_frames,
+                             frame=sprite.frame_index, last_frame=sprite.last_frame_update)
+            else:
+                store.append(sprite.rect, sprite.vx, sprite.vy, image=sprite.image, life=getattr(sprite, 'lifetime', 0))
+            sprite.kill()
+        return True
+
+    def snapshot(self):
+        for store in self.stores.values():
+            store.prev_x[:store.count] = store.x[:store.count]
+            store.prev_y[:store.count] = store.y[:store.count]
+
+    def hits_platforms(self, store, hashed):
+        hit = np.zeros(store.count, bool)
+        rows, _ = self.static_platforms.pairs(store, hashed)
+        hit[rows] = True
+        for platform in self.moving_platforms:
+            hit |= store.overlaps(platform.rect)
+        return hit
+
+    def update_enemy_bullets(self):
+        """EnemyProjectile.update for every enemy shot."""
+        store = self.stores[ENEMY_SHOT]
+        if not store.count:
+            return
+        store.move()
+        life = store.life[:store.count]
+        life -= 1
+        store.keep((life > 0) & store.overlaps(PROJECTILE_BOUNDS) & ~self.hits_platforms(store, store.hashed()))
+
+    def update_boss_bullets(self):
+        """BossProjectile.update for every boss shot."""
+        store = self.stores[BOSS_SHOT]
+        if not store.count:
+            return
+        store.move()
+        store.keep(store.overlaps(BOSS_PROJECTILE_BOUNDS) & ~self.hits_platforms(store, store.hashed()))
+
+    def hit(self, kind, rect):
+        """Removes the bullets of kind overlapping rect; returns how many there were."""
+        store = self.stores[kind]
+        if not store.count:
+            return 0
+        hit = store.overlaps(rect)
+        count = int(np.count_nonzero(hit))
+        if count:
+            store.keep(~hit)
+        return count
+
+    def update_player_bullets(self, game):
+        """Projectile.update plus the projectile collision passes of Game.update_game_state."""
+        store = self.stores[PLAYER_SHOT]
+        if not store.count:
+            return
+        n = store.count
+        now = CLOCK.get_ticks()
+        due = now - store.last_frame[:n] > FRAME_TIME
+        if due.any():
+            frame = store.frame[:n]
+            frame[due] = (frame[due] + 1) % store.frame_count[:n][due]
+            store.last_frame[:n][due] = now
+            store.image[:n][due] = None
+        store.move()
+        store.keep(store.overlaps(PROJECTILE_BOUNDS))
+        if store.count:
+            self.collide_player_bullets(game, store)
+
+    def collide_player_bullets(self, game, store):
+        hashed = store.hashed()
+        enemies, boxes = game.enemies.sprites(), game.power_up_boxes.sprites()
+        enemy_hits = group_pairs(*Targets([enemy.hitbox for enemy in enemies]).pairs(store, hashed))
+        box_hits = group_pairs(*Targets([box.rect for box in boxes]).pairs(store, hashed))
+        on_platform = self.hits_platforms(store, hashed)
+        dead = np.zeros(store.count, bool)
+
+        def detonate(i):
+            if not dead[i]: # Already went off this step
+                dead[i] = True
+                game.detonate(int(store.x[i] + store.w[i] // 2), int(store.y[i] + store.h[i] // 2), store.damage[i])
+
+        # Sequential over the few rows that hit anything: earlier shots can kill what later ones would hit
+        for i in sorted(enemy_hits.keys() | box_hits.keys() | set(np.flatnonzero(on_platform).tolist())):
+            explosive, damage = store.explosive[i], store.damage[i]
+            hit_enemies = [enemies[t] for t in enemy_hits.get(i, ()) if enemies[t].alive()]
+            if hit_enemies:
+                if explosive:
+                    detonate(i)
+                else:
+                    dead[i] = True
+                    for enemy in hit_enemies:
+                        enemy.take_damage(damage)
+            hit_boxes = [boxes[t] for t in box_hits.get(i, ()) if boxes[t].alive()]
+            if hit_boxes:
+                if explosive:
+                    detonate(i)
+                    if game.game_state == 'boss_fight':
+                        hit_boxes = []
+                else:
+                    dead[i] = True
+                for box in hit_boxes:
+                    game.damage_box(box, damage)
+            if on_platform[i]:
+                if explosive:
+                    detonate(i)
+                else:
+                    dead[i] = True
+
+        if game.game_state == 'boss_fight' and game.boss:
+            for i in np.flatnonzero(~dead & store.overlaps(game.boss.rect)).tolist():
+                if store.explosive[i]:
+                    detonate(i)
+                else:
+                    dead[i] = True
+                    game.boss.take_damage(store.damage[i])
+        store.keep(~dead)
+
+    def positions(self, kind):
+        """(x, y) of each live bullet of kind, in spawn order."""
+        store = self.stores[kind]
+        return list(zip(store.x[:store.count].tolist(), store.y[:store.count].tolist()))
+
+    def draw(self, surface, camera_x, camera_y, alpha, view, scaler=None):
+        """Blits the bullets overlapping view, interpolated like sprites; returns how many were drawn.
+
+        With a RenderScale, surface is its smaller target and positions and images are scaled to match.
+        """
+        blits = []
+        for kind, store in self.stores.items():
+            if not store.count:
+                continue
+            rows = np.flatnonzero(store.overlaps(view))
+            x, y = store.x[rows], store.y[rows]
+            screen_x = (x - camera_x + (store.prev_x[rows] - x) * (1 - alpha)).tolist()
+            screen_y = (y - camera_y + (store.prev_y[rows] - y) * (1 - alpha)).tolist()
+            images = store.image[rows].tolist()
+            if kind == PLAYER_SHOT:
+                images = [image if image is not None else frames[frame]
+                          for image, frames, frame in zip(images, store.frames[rows].tolist(), store.frame[rows].tolist())]
+            if scaler:
+                scale = scaler.scale
+                images = [scaler.image(image) for image in images]
+                screen_x = [int(x * scale) for x in screen_x]
+                screen_y = [int(y * scale) for y in screen_y]
+            blits.extend(zip(images, zip(screen_x, screen_y)))
+        if blits:
+            surface.blits(blits, doreturn=False)
+        return len(blits)
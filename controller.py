@@ -1,6 +1,6 @@
 import pygame
-import time
 import math
+from sim_clock import CLOCK
 
 class KeyboardController:
     """Handles keyboard input for a player."""
@@ -35,7 +35,7 @@ class KeyboardController:
         }
         
         keys = pygame.key.get_pressed()
-        current_time = time.time()
+        current_time = CLOCK.time()
 
         # Join detection (Enter or Space)
         if keys[pygame.K_RETURN] or keys[pygame.K_SPACE]:
@@ -156,7 +156,7 @@ class XboxController:
         if not self.connected:
             return actions
 
-        current_time = time.time()
+        current_time = CLOCK.time()
         
         # Join detection (Start or A)
         if self.joystick.get_button(self.BUTTON_START) or self.joystick.get_button(self.BUTTON_A):
@@ -259,6 +259,11 @@ class ControllerManager:
             self.p2_input = XboxController(1)
             print("P1: Controller 0, P2: Controller 1")
             
+    def set_controllers(self, p1_input, p2_input=None):
+        """Overrides the device assignment, e.g. with replay or scripted controllers."""
+        self.p1_input = p1_input
+        self.p2_input = p2_input
+
     def get_p1_controller(self):
         return self.p1_input
         
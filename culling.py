@@ -0,0 +1,55 @@
+import pygame
+
+class CullingGroup(pygame.sprite.Group):
+    """Sprite group that can list the members near the camera without visiting the rest.
+
+    Members whose class sets `static = True` never move horizontally, so they are
+    bucketed by x once when added. Everything else (players, enemies, projectiles,
+    explosions) is few enough to test directly. visible() returns members in
+    insertion order, the same order a plain Group draws in, so layering is unchanged.
+    """
+    def __init__(self, *sprites, bucket_width=256):
+        self.bucket_width = bucket_width
+        self.sequence = 0
+        self.order = {}    # sprite -> insertion sequence
+        self.buckets = {}  # x bucket -> {sprite: None}
+        self.spans = {}    # static sprite -> (first bucket, last bucket)
+        self.dynamic = {}  # non-static members, insertion ordered
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite)
+        self.order[sprite] = self.sequence
+        self.sequence += 1
+        if getattr(sprite, 'static', False):
+            first, last = sprite.rect.left // self.bucket_width, (sprite.rect.right - 1) // self.bucket_width
+            self.spans[sprite] = (first, last)
+            for bucket in range(first, last + 1):
+                self.buckets.setdefault(bucket, {})[sprite] = None
+        else:
+            self.dynamic[sprite] = None
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        del self.order[sprite]
+        span = self.spans.pop(sprite, None)
+        if span is None:
+            del self.dynamic[sprite]
+            return
+        for bucket in range(span[0], span[1] + 1):
+            cell = self.buckets[bucket]
+            del cell[sprite]
+            if not cell:
+                del self.buckets[bucket]
+
+    def visible(self, view):
+        """Members whose rect overlaps view, in draw order."""
+        found = {}
+        for bucket in range(view.left // self.bucket_width, (view.right - 1) // self.bucket_width + 1):
+            cell = self.buckets.get(bucket)
+            if cell:
+                found.update(cell)
+        drawn = [sprite for sprite in found if view.colliderect(sprite.rect)]
+        drawn.extend(sprite for sprite in self.dynamic if view.colliderect(sprite.rect))
+        drawn.sort(key=self.order.__getitem__)
+        return drawn
@@ -4,6 +4,7 @@ import math
 import os
 from settings import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, BLACK, GOLD, BLUE, PURPLE, RED, GREEN, YELLOW, GRAY
 from inventory import TIER_COLORS
+from overlay_cache import OVERLAYS
 
 class ConfettiParticle:
     def __init__(self, x, y, color, vx, vy, rotation_speed):
@@ -207,9 +208,7 @@ def play_gacha_animation(screen, revealed_item_info, gun_images, font):
             reveal_progress = (elapsed_time - reveal_time) / 500  # Flash lasts 0.5s
             if reveal_progress < 1.0:
                 flash_alpha = 255 * (1 - reveal_progress)
-                flash_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-                flash_surface.fill((255, 255, 255, flash_alpha))
-                screen.blit(flash_surface, (0, 0))
+                screen.blit(OVERLAYS.get((SCREEN_WIDTH, SCREEN_HEIGHT), (255, 255, 255, flash_alpha)), (0, 0))
 
             # 2. Scale up the item
             scale_progress = min(1.0, (elapsed_time - reveal_time) / 1000) # Scale over 1s
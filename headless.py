@@ -0,0 +1,150 @@
+import os
+import sys
+import time
+import hashlib
+import argparse
+
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+import pygame
+from main import Game
+from level_data import ALL_LEVELS
+from settings import SIMULATION_HZ, BULLET_ENGINE, ENEMY_HORDE, SIMULATION_LOD, LEVEL_STREAMING
+from sim_clock import CLOCK
+from replay import Recorder, Recording
+from bullets import PLAYER_SHOT, ENEMY_SHOT
+
+
+class ScriptedController:
+    """Deterministic stand-in for a pad: runs right, double-jumps every second, fires and dashes on a beat."""
+    def __init__(self, jump_every=60, dash_every=150, ultimate_every=600):
+        self.jump_every = jump_every
+        self.dash_every = dash_every
+        self.ultimate_every = ultimate_every
+        self.tick = 0
+
+    def get_actions(self):
+        self.tick += 1
+        return {
+            'move_x': 1.0,
+            'shoot': self.tick % 10 == 0,
+            'shoot_direction': 'horizontal',
+            'dash': self.tick % self.dash_every == 0,
+            'jump': self.tick % self.jump_every in (0, 12),
+            'switch_weapon': False,
+            'activate_ultimate': self.tick % self.ultimate_every == 0,
+            'join': False
+        }
+
+
+class HeadlessGame(Game):
+    """Game logic on the dummy SDL drivers: no window, no sound, no draw(), stepped as fast as the CPU allows.
+
+    Used to measure pure simulation throughput (ticks per second) and for soak
+    runs of thousands of ticks. Players are kept alive by default so a run
+    exercises the whole level instead of stopping at the first game over.
+    """
+    music_enabled = False
+    preload_assets = False
+
+    def __init__(self, invincible=True, bullet_engine=BULLET_ENGINE, enemy_horde=ENEMY_HORDE, simulation_lod=SIMULATION_LOD,
+                 level_streaming=LEVEL_STREAMING):
+        self.bullet_engine = bullet_engine
+        self.enemy_horde = enemy_horde
+        self.simulation_lod = simulation_lod
+        self.level_streaming = level_streaming
+        super().__init__()
+        self.sfx = {}
+        self.death_sound = None
+        self.invincible = invincible
+        self.controller_manager.set_controllers(None)
+
+    def save_game_data(self):
+        pass # Headless runs must never touch the player's save file
+
+    def draw(self, alpha=1.0):
+        pass
+
+    def update_game_state(self):
+        if self.invincible:
+            for player in self.players:
+                player.health = player.max_health
+        super().update_game_state()
+
+    def run_level(self, level_number, ticks, controller=None, seed=0, record_to=None):
+        """Plays level_number for `ticks` simulation steps; returns the achieved ticks per wall-clock second.
+
+        The RNG is seeded first, so the same controller and seed always play the
+        same game. With record_to the inputs are saved there as a replay.
+        """
+        self.controller_manager.set_controllers(controller or ScriptedController())
+        if record_to:
+            recorder = Recorder(self, level_number, seed)
+            recorder.recording.loadout['invincible'] = self.invincible
+        else:
+            Recording(level_number, seed, CLOCK.steps).restart(self)
+        rate = self.step(ticks)
+        if record_to:
+            recorder.stop(record_to)
+        return rate
+
+    def run_replay(self, recording):
+        """Plays a Recording back to its last tick; returns ticks per wall-clock second."""
+        self.invincible = recording.loadout.get('invincible', False)
+        recording.replay(self)
+        return self.step(recording.ticks)
+
+    def step(self, ticks):
+        start = time.perf_counter()
+        for _ in range(ticks):
+            self.update_game_state()
+        return ticks / (time.perf_counter() - start)
+
+    def fingerprint(self):
+        """Short hash of the simulation state; two runs of the same replay must print the same one."""
+        state = [CLOCK.steps, self.game_state, self.current_level, round(self.camera_x, 3)]
+        for group in (self.players, self.enemies, self.projectiles, self.enemy_projectiles, self.coins):
+            state.extend((type(s).__name__, s.rect.x, s.rect.y, getattr(s, 'health', None)) for s in group)
+            if self.bullets and group in (self.projectiles, self.enemy_projectiles):
+                # Same entries the sprites would have left, so runs with and without the engine compare
+                kind, name = (PLAYER_SHOT, 'Projectile') if group is self.projectiles else (ENEMY_SHOT, 'EnemyProjectile')
+                state.extend((name, x, y, None) for x, y in self.bullets.positions(kind))
+        if self.boss:
+            state.append(('boss', self.boss.rect.x, self.boss.rect.y, self.boss.health))
+        return hashlib.sha1(repr(state).encode()).hexdigest()[:12]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the Spoonhead simulation without a display and report ticks per second.")
+    parser.add_argument('levels', nargs='*', type=int, default=list(ALL_LEVELS), help="levels to run (default: all)")
+    parser.add_argument('--ticks', type=int, default=3000, help="simulation steps per level (default: 3000)")
+    parser.add_argument('--mortal', action='store_true', help="let players die instead of keeping them at full health")
+    parser.add_argument('--seed', type=int, default=0, help="RNG seed for each level (default: 0)")
+    parser.add_argument('--record', metavar='PATH', help="save the scripted inputs of the (single) level run as a replay")
+    parser.add_argument('--replay', metavar='PATH', help="play back a recorded replay instead of the scripted run")
+    parser.add_argument('--sprite-bullets', action='store_true', help="keep bullets as sprites instead of the NumPy bullet engine")
+    parser.add_argument('--sprite-enemies', action='store_true', help="update enemies one by one instead of as a NumPy horde")
+    parser.add_argument('--no-streaming', action='store_true', help="build every coin, enemy and power-up box when the level starts")
+    parser.add_argument('--lod', action='store_true', help="sleep enemies and coins far from the camera (SimulationLOD)")
+    args = parser.parse_args(argv)
+    if args.record and len(args.levels) != 1:
+        parser.error("--record needs exactly one level")
+
+    game = HeadlessGame(invincible=not args.mortal, bullet_engine=not args.sprite_bullets, enemy_horde=not args.sprite_enemies,
+                        simulation_lod=args.lod, level_streaming=not args.no_streaming)
+    print(f"{'level':>6} {'ticks':>8} {'ticks/s':>10} {'realtime':>9}  {'state':<12}  end state")
+    if args.replay:
+        recording = Recording.load(args.replay)
+        runs = [(recording.level, recording.ticks, lambda: game.run_replay(recording))]
+    else:
+        runs = [(level, args.ticks, lambda level=level: game.run_level(level, args.ticks, seed=args.seed, record_to=args.record))
+                for level in args.levels]
+    for level, ticks, run in runs:
+        rate = run()
+        print(f"{level:>6} {ticks:>8} {rate:>10.0f} {rate / SIMULATION_HZ:>8.1f}x  {game.fingerprint():<12}  {game.game_state} (level {game.current_level})")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,208 @@
+import pygame
+from sim_clock import CLOCK
+from bullets import np, Targets, hash_cells
+from sim_lod import FULL, PHYSICS, FROZEN
+
+MAX_FALL_SPEED = 15 # as clamped in Enemy.update
+FRAME_TIME = 120 # ms per animation frame, as in Enemy.animate
+BATCH_MIN = 128 # below this many members the NumPy overhead outweighs stepping each sprite
+
+# One array per enemy attribute the horde steps (name -> dtype); x, y, w, h are the hitbox
+COLUMNS = {
+    'x': 'i8', 'y': 'i8', 'w': 'i8', 'h': 'i8', 'rect_w': 'i8', 'rect_h': 'i8',
+    'speed': 'f8', 'direction': 'i8', 'start_x': 'f8', 'patrol': 'f8', 'vy': 'f8', 'gravity': 'f8',
+    'last_shot': 'f8', 'cooldown': 'f8', 'detection': 'f8', 'on_ground': '?', 'last_frame': 'i8',
+}
+
+
+def round_rect(values):
+    """What a Rect attribute becomes when assigned these floats: rounded half away from zero."""
+    whole = np.trunc(values)
+    return (whole + np.sign(values) * (np.abs(values - whole) >= 0.5)).astype(np.int64)
+
+
+class EnemyHorde(pygame.sprite.Group):
+    """Group of Enemy sprites that steps them all at once from parallel arrays.
+
+    Patrol, gravity, platform landing and the shoot timer of every member run
+    as NumPy batches with the same rules and rounding as Enemy.update. Per
+    sprite, only what changed is written back (mostly hitbox and rect x),
+    animate() runs only when a frame is due or the enemy is flashing, and
+    the shot itself is fired by the sprite. Rows follow the group order, so
+    enemies shoot in the order a plain Group would update them. The horde
+    owns its members' movement and action, which is fixed by their speed.
+    Hitboxes must fit in one cell of the bullet hash (bullets.CELL).
+    Small groups (under BATCH_MIN) just run Enemy.update on each member;
+    the arrays are reloaded from the sprites when the group grows again.
+    With a SimulationLOD, frozen rows keep their state and only FULL rows
+    are animated, as Enemy.update does; PHYSICS rows still run out their flash.
+    """
+    def __init__(self, *sprites, capacity=64):
+        self.members = []  # row -> sprite
+        self.rows = {}     # sprite -> row
+        self.removed = 0   # rows of sprites that left the group, dropped on the next update
+        self.flashing = set() # members hit recently, animated every step until the flash ends
+        self.stale = False # the sprites were stepped one by one since the arrays were loaded
+        self.count = 0
+        self.capacity = 0
+        self.index = None  # PlatformIndex the platform targets below were built from
+        self.grow(capacity)
+        super().__init__(*sprites)
+
+    def grow(self, capacity):
+        for name, dtype in COLUMNS.items():
+            column = np.zeros(capacity, dtype)
+            if self.capacity:
+                column[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, column)
+        self.capacity = capacity
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite)
+        if self.count == self.capacity:
+            self.grow(self.capacity * 2)
+        self.load(self.count, sprite)
+        sprite.horde = self
+        self.members.append(sprite)
+        self.rows[sprite] = self.count
+        self.count += 1
+
+    def load(self, i, sprite):
+        """Fills row i from the sprite's own state."""
+        self.x[i], self.y[i], self.w[i], self.h[i] = sprite.hitbox
+        self.rect_w[i], self.rect_h[i] = sprite.rect.size
+        self.speed[i], self.direction[i], self.start_x[i], self.patrol[i] = sprite.speed, sprite.direction, sprite.start_x, sprite.patrol_distance
+        self.vy[i], self.gravity[i], self.on_ground[i] = sprite.vy, sprite.gravity, sprite.on_ground
+        self.last_shot[i], self.cooldown[i], self.detection[i] = sprite.last_shot_time, sprite.shoot_cooldown, sprite.detection_range
+        self.last_frame[i] = sprite.last_frame_update
+        sprite.action = 'walk' if sprite.speed > 0 else 'idle'
+        if sprite.flash_timer > 0:
+            self.flashing.add(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        del self.rows[sprite]
+        self.flashing.discard(sprite)
+        sprite.horde = None
+        self.removed += 1
+
+    def compact(self):
+        keep = np.array([self.rows.get(sprite) == i for i, sprite in enumerate(self.members)], bool)
+        kept = int(np.count_nonzero(keep))
+        for name in COLUMNS:
+            column = getattr(self, name)
+            column[:kept] = column[:self.count][keep]
+        self.members = [sprite for sprite, alive in zip(self.members, keep.tolist()) if alive]
+        self.rows = {sprite: i for i, sprite in enumerate(self.members)}
+        self.count = kept
+        self.removed = 0
+
+    def platform_targets(self, platforms):
+        """The PlatformIndex's static platforms in the hash, with their group order, rebuilt when the index changes."""
+        if platforms is not self.index:
+            self.index = platforms
+            static = [(order, p) for order, p in enumerate(platforms.platforms) if not hasattr(p, 'move_axis')]
+            self.static = Targets([p.rect for _, p in static])
+            self.static_order = np.array([order for order, _ in static], np.int64)
+            self.tops = np.array([p.rect.top for p in platforms.platforms] or [0], np.int64)
+        return self.static
+
+    def land(self, platforms, falling):
+        """Rows whose hitbox overlaps a platform, and the first such platform in group order (Enemy.update's landing)."""
+        n = self.count
+        first = np.full(n, len(platforms.platforms), np.int64)
+        hashed = hash_cells(self.x[:n], self.y[:n])
+        rows, targets = self.platform_targets(platforms).pairs(self, hashed)
+        rows, start = np.unique(rows, return_index=True) # pairs come by row, then platform order
+        first[rows] = self.static_order[targets[start]]
+        if platforms.moving:
+            # Moving platforms are hashed where they are this step
+            moving = [platform for _, platform, *_ in platforms.moving]
+            order = np.array([entry[0] for entry in platforms.moving], np.int64)
+            self.tops[order] = [platform.rect.top for platform in moving]
+            rows, targets = Targets([platform.rect for platform in moving]).pairs(self, hashed)
+            rows, start = np.unique(rows, return_index=True)
+            first[rows] = np.minimum(first[rows], order[targets[start]])
+        landed = falling & (first < len(platforms.platforms))
+        return landed, first
+
+    def update(self, player, all_sprites_group, enemy_projectiles_group, platforms, lod=None):
+        """Enemy.update for every member, in one pass per step."""
+        if self.removed:
+            self.compact()
+        n = self.count
+        if n < BATCH_MIN:
+            for enemy in self.members:
+                enemy.update(player, all_sprites_group, enemy_projectiles_group, platforms, lod)
+            self.stale = True
+            return
+        if self.stale:
+            self.flashing.clear()
+            for i, enemy in enumerate(self.members):
+                self.load(i, enemy)
+            self.stale = False
+        x, y, w, h, vy, direction = self.x[:n], self.y[:n], self.w[:n], self.h[:n], self.vy[:n], self.direction[:n]
+        old_x, old_y, old_vy, old_ground = x.copy(), y.copy(), vy.copy(), self.on_ground[:n].copy()
+        rect_x = x + w // 2 - self.rect_w[:n] // 2
+        tiers = lod.tiers(rect_x, rect_x + self.rect_w[:n]) if lod else np.zeros(n, 'i1')
+        awake = tiers != FROZEN
+
+        # Horizontal patrol
+        np.copyto(x, round_rect(x + self.speed[:n] * direction), where=awake)
+        turned = awake & (np.abs(x + w // 2 - self.start_x[:n]) > self.patrol[:n])
+        direction[turned] *= -1
+
+        # Gravity, then landing on the first platform touched
+        np.copyto(vy, np.minimum(vy + self.gravity[:n], MAX_FALL_SPEED), where=awake)
+        np.copyto(y, round_rect(y + vy), where=awake)
+        landed, first = self.land(platforms, awake & (vy > 0))
+        y[landed] = self.tops[first[landed]] - h[landed]
+        vy[landed] = 0
+        on_ground = self.on_ground[:n]
+        np.copyto(on_ground, landed, where=awake)
+        rect_x = x + w // 2 - self.rect_w[:n] // 2
+        rect_y = y + h - self.rect_h[:n]
+
+        # Write back only what changed: most steps that is just x of the walkers
+        members = self.members
+        moved = np.flatnonzero((x != old_x) | (y != old_y))
+        for i, hx, hy, rx, ry in zip(moved.tolist(), x[moved].tolist(), y[moved].tolist(), rect_x[moved].tolist(), rect_y[moved].tolist()):
+            enemy = members[i]
+            enemy.hitbox.topleft = (hx, hy)
+            enemy.rect.topleft = (rx, ry)
+        for i in np.flatnonzero(turned).tolist():
+            members[i].direction = int(direction[i])
+        for i in np.flatnonzero((vy != old_vy) | (on_ground != old_ground)).tolist():
+            members[i].vy, members[i].on_ground = float(vy[i]), bool(on_ground[i])
+
+        # Animation: only the FULL enemies whose frame is due or that are flashing; PHYSICS ones just count the flash down
+        now = CLOCK.get_ticks()
+        full = tiers == FULL
+        due = full & (now - self.last_frame[:n] > FRAME_TIME)
+        self.last_frame[:n][due] = now
+        animated = set(np.flatnonzero(due).tolist())
+        for enemy in list(self.flashing):
+            i = self.rows[enemy]
+            if full[i]:
+                animated.add(i)
+            elif tiers[i] == PHYSICS:
+                enemy.fade_flash()
+                if enemy.flash_timer <= 0:
+                    self.flashing.discard(enemy)
+        for i in sorted(animated):
+            enemy = members[i]
+            enemy.animate()
+            if enemy.flash_timer <= 0:
+                self.flashing.discard(enemy)
+
+        # Shoot timers and the detection range against the target, for everyone at once
+        if player is None:
+            return
+        now = CLOCK.time()
+        last_shot = self.last_shot[:n]
+        due = awake & (np.abs(player.rect.centerx - (rect_x + self.rect_w[:n] // 2)) < self.detection[:n]) & (now - last_shot > self.cooldown[:n])
+        for i in np.flatnonzero(due).tolist():
+            enemy = members[i]
+            enemy.shoot_at_player(player, all_sprites_group, enemy_projectiles_group)
+            enemy.last_shot_time = now
+        last_shot[due] = now
@@ -2,6 +2,10 @@ import pygame
 from ui import Button
 from settings import *
 from sprites import SpriteSheet
+from asset_cache import ASSETS
+from text_cache import TEXT
+from menu_renderer import MENUS
+from overlay_cache import OVERLAYS
 import random
 
 def get_scaled_size(original_size, max_size):
@@ -35,7 +39,7 @@ TIER_COLORS = {
 }
 
 class InventoryScreen:
-    def __init__(self, screen, selected_characters, unlocked_guns, gun_data, character_data, equipped_guns, unlocked_characters, connected_players=[0]):
+    def __init__(self, screen, selected_characters, unlocked_guns, gun_data, character_data, equipped_guns, unlocked_characters, connected_players=[0], preloader=None):
         self.screen = screen
         self.selected_characters = selected_characters # Dict: {0: 'id', 1: 'id'}
         self.unlocked_guns = unlocked_guns
@@ -43,9 +47,9 @@ class InventoryScreen:
         self.character_data = character_data
         self.equipped_guns = equipped_guns # Dict: {0: 'id', 1: 'id'}
         
-        self.font = pygame.font.Font(PIXEL_FONT, 24)
-        self.item_font = pygame.font.Font(PIXEL_FONT, 16)
-        self.tier_font = pygame.font.Font(PIXEL_FONT, 12)
+        self.font = TEXT.get_font(24)
+        self.item_font = TEXT.get_font(16)
+        self.tier_font = TEXT.get_font(12)
 
         self.back_button = Button(20, 20, 150, 50, "Back", RED, PURPLE)
         self.player_toggle_button = Button(SCREEN_WIDTH - 170, 20, 150, 50, "Edit: P1", GREEN, DARK_GRAY)
@@ -54,14 +58,29 @@ class InventoryScreen:
         self.connected_players = connected_players
         self.active_player_idx = 0
         
-        # Load images
-        self.character_animations = self._load_character_animations()
-        self.gun_images = self._load_gun_images()
+        # Load images; with a preloader the files are decoded on its workers first
+        self.character_animations = {}
+        self.gun_images = {}
         self.lock_icon = self._create_lock_icon()
+        if preloader:
+            preloader.add('inventory', lambda: [ASSETS.decode(path) for path in self._image_paths()], lambda _: self.load_images())
+        else:
+            self.load_images()
 
         self.scroll_y = 0
         self.gun_grid_rects = {}
 
+    def _image_paths(self):
+        for char_data in self.character_data.values():
+            yield char_data['idle']
+            yield from char_data.get('emotes', ())
+        for gun_data in self.gun_data.values():
+            yield gun_data['image_path']
+
+    def load_images(self):
+        self.character_animations = self._load_character_animations()
+        self.gun_images = self._load_gun_images()
+
     def _load_character_animations(self):
         animations = {}
         player_size = (80, 80) # Size for inventory display
@@ -84,7 +103,7 @@ class InventoryScreen:
                 for i, emote_path in enumerate(char_data['emotes']):
                     emote_key = f'emote_{i}'
                     try:
-                        img = pygame.image.load(emote_path).convert_alpha()
+                        img = ASSETS.load_image(emote_path)
                         animations[char_id][emote_key] = [pygame.transform.scale(img, player_size)] # Single frame
                     except (pygame.error, FileNotFoundError):
                         print(f"Warning: Could not load emote animation for {char_id}: {emote_path}")
@@ -98,7 +117,7 @@ class InventoryScreen:
         max_size = (80, 80) # Bounding box for gun images in inventory
         for gun_id, gun_data in self.gun_data.items():
             try:
-                img = pygame.image.load(gun_data['image_path']).convert_alpha()
+                img = ASSETS.load_image(gun_data['image_path'])
                 original_size = gun_data.get('size', (img.get_width(), img.get_height()))
                 
                 scaled_size = get_scaled_size(original_size, max_size)
@@ -180,15 +199,14 @@ class InventoryScreen:
             frame_index = (pygame.time.get_ticks() // 150) % len(current_animation_frames)
             char_img = current_animation_frames[frame_index]
             self.screen.blit(char_img, (char_rect.x + 10, char_rect.y + 10))
+            MENUS.animate(char_img.get_rect(topleft=(char_rect.x + 10, char_rect.y + 10)), 150)
 
             # Name
             self.draw_text(char_data['name'], 20, char_rect.x + 180, char_rect.y + 40, WHITE)
 
             # Locked overlay
             if not is_unlocked:
-                overlay = pygame.Surface(char_rect.size, pygame.SRCALPHA)
-                overlay.fill((0, 0, 0, 180))
-                self.screen.blit(overlay, char_rect.topleft)
+                self.screen.blit(OVERLAYS.get(char_rect.size, (0, 0, 0, 180)), char_rect.topleft)
                 self.screen.blit(self.lock_icon, (char_rect.centerx - 15, char_rect.centery - 20))
             
             char_y += 120
@@ -251,9 +269,7 @@ class InventoryScreen:
 
             # Locked overlay
             if not is_unlocked:
-                overlay = pygame.Surface(gun_rect.size, pygame.SRCALPHA)
-                overlay.fill((0, 0, 0, 180))
-                self.screen.blit(overlay, gun_rect.topleft)
+                self.screen.blit(OVERLAYS.get(gun_rect.size, (0, 0, 0, 180)), gun_rect.topleft)
                 self.screen.blit(self.lock_icon, (gun_rect.centerx - 15, gun_rect.centery - 20))
         
         # Back button
@@ -263,8 +279,6 @@ class InventoryScreen:
         # Actually, let's allow toggling if P2 is connected.
         if len(self.connected_players) > 1:
             self.player_toggle_button.draw(self.screen, mouse_pos)
-            
-        pygame.display.flip()
 
     def handle_event(self, event):
         # Default mouse handling
@@ -321,7 +335,6 @@ class InventoryScreen:
         return None
 
     def draw_text(self, text, size, x, y, color):
-        font = pygame.font.Font(PIXEL_FONT, size)
-        text_surface = font.render(text, True, color)
+        text_surface = TEXT.render(text, size, color)
         text_rect = text_surface.get_rect(center=(x, y))
         self.screen.blit(text_surface, text_rect)
\ No newline at end of file
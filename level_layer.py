@@ -0,0 +1,78 @@
+import math
+import pygame
+
+COLORKEY = (255, 0, 255)
+
+class LevelLayer:
+    """Static platforms pre-rendered into fixed-width chunk Surfaces.
+
+    Chunks are painted on demand as the camera approaches and dropped once it
+    is far away, so drawing the level geometry costs one or two blits a frame
+    regardless of how many platforms it has.
+    """
+    def __init__(self, platforms, chunk_width=1024, keep_distance=2):
+        self.chunk_width = chunk_width
+        self.keep_distance = keep_distance  # chunks kept either side of the visible ones
+        self.platforms = [p for p in platforms if getattr(p, 'static', False)]
+        self.chunks = {}  # chunk index -> Surface, None for empty chunks
+        self.chunks_built = 0
+        if self.platforms:
+            self.top = min(p.rect.top for p in self.platforms)
+            self.height = max(p.rect.bottom for p in self.platforms) - self.top
+        else:
+            self.top, self.height = 0, 0
+
+        # Which platforms touch each chunk, in draw order
+        self.chunk_platforms = {}
+        for platform in self.platforms:
+            for index in range(platform.rect.left // chunk_width, (platform.rect.right - 1) // chunk_width + 1):
+                self.chunk_platforms.setdefault(index, []).append(platform)
+
+    def build_chunk(self, index):
+        platforms = self.chunk_platforms.get(index)
+        if not platforms:
+            return None
+        left = index * self.chunk_width
+        chunk = pygame.Surface((self.chunk_width, self.height))
+        chunk.fill(COLORKEY)
+        for platform in platforms:
+            platform.paint(chunk, -left, -self.top)
+        chunk.set_colorkey(COLORKEY, pygame.RLEACCEL)
+        self.chunks_built += 1
+        return chunk
+
+    def get_chunk(self, index):
+        if index not in self.chunks:
+            self.chunks[index] = self.build_chunk(index)
+        return self.chunks[index]
+
+    def draw(self, surface, camera_x, camera_y, margin=0, scaler=None):
+        """Blits the chunks overlapping the view; chunks within margin are built ahead of time.
+
+        With a RenderScale, surface is its smaller target and the chunks are drawn scaled to match.
+        """
+        if not self.platforms:
+            return 0
+        # Sprites land at int(rect.x - camera_x); rounding the camera up keeps chunks on the same pixels
+        camera_x, camera_y = math.ceil(camera_x), math.ceil(camera_y)
+        scale = scaler.scale if scaler else 1
+        view_left = camera_x
+        view_right = view_left + round(surface.get_width() / scale)
+        first, last = view_left // self.chunk_width, (view_right - 1) // self.chunk_width
+        for index in range((view_left - margin) // self.chunk_width, (view_right + margin - 1) // self.chunk_width + 1):
+            self.get_chunk(index)
+
+        blits = 0
+        for index in range(first, last + 1):
+            chunk = self.chunks[index]
+            if chunk is not None:
+                x, y = index * self.chunk_width - camera_x, self.top - camera_y
+                if scaler:
+                    surface.blit(scaler.image(chunk), (int(x * scale), int(y * scale)))
+                else:
+                    surface.blit(chunk, (x, y))
+                blits += 1
+
+        for index in [i for i in self.chunks if i < first - self.keep_distance or i > last + self.keep_distance]:
+            del self.chunks[index]
+        return blits
@@ -1,24 +1,43 @@
+from startup import STARTUP # First, so that --profile-startup times every import below
 import pygame
 import os
 import json
 import random
 import subprocess
 import sys
-import math
+import time
 from settings import *
 from controller import ControllerManager
-from sprites import Player, Boss, Projectile, BossProjectile, Platform, MovingPlatform, Coin, Enemy, BossGate, PowerUpBox, PowerUp, EnemyProjectile, Explosion
+from sprites import Player, Boss, Projectile, BossProjectile, Platform, MovingPlatform, Coin, Enemy, BossGate, PowerUpBox, PowerUp, EnemyProjectile
+from sprites import PROJECTILE_POOL, ENEMY_PROJECTILE_POOL, BOSS_PROJECTILE_POOL, EXPLOSION_POOL
+from pool import reclaim_all, release_all
 from ui import Button
 from level_data import ALL_LEVELS
 from shop_data import SHOP_ITEMS
-from shop import ShopScreen
 from gun_data import GUN_DATA
 from inventory import InventoryScreen, TIER_COLORS
-from benchmark import Benchmark
 from parallax import Parallax
-from gacha import play_gacha_animation
+from text_cache import TEXT
+from broadphase import Broadphase, PlatformIndex
+from area_damage import AreaDamage
+from culling import CullingGroup
+from level_layer import LevelLayer
+from sim_clock import CLOCK
+from replay import Recorder
+from profiler import PROFILER
+from bullets import BulletEngine, NUMPY_AVAILABLE, PLAYER_SHOT, ENEMY_SHOT, BOSS_SHOT
+from horde import EnemyHorde
+from sim_lod import SimulationLOD
+from streaming import LevelStream
+from preloader import Preloader
+from atlas import load_atlas, install_atlas
+from render_scale import RenderScale
+from menu_renderer import MENUS
+from overlay_cache import OVERLAYS
 
 SAVE_FILE = 'save.json'
+RECORDINGS_DIR = 'recordings'
+PROFILES_DIR = 'profiles'
 
 def get_scaled_size(original_size, max_size):
     """
@@ -47,15 +66,43 @@ def get_scaled_size(original_size, max_size):
 def collide_hitbox(sprite1, sprite2):
     return sprite1.hitbox.colliderect(sprite2.hitbox)
 
+def load_sound(path):
+    """Decodes a sound effect, safe off the main thread; None if it can't be loaded."""
+    try:
+        return pygame.mixer.Sound(path)
+    except (pygame.error, FileNotFoundError):
+        return None
+
+def load_gun_display_image(path):
+    """A gun image at the gacha's display size, not converted yet (safe off the main thread)."""
+    try:
+        return pygame.transform.scale(pygame.image.load(path), (100, 100)) # Larger scale for display
+    except pygame.error:
+        image = pygame.Surface((100, 100), pygame.SRCALPHA)
+        image.fill(GRAY)
+        return image
+
 class Game:
     """Main game class with a multi-level structure and persistence."""
+    music_enabled = True # HeadlessGame runs without a mixer device or music files
+    bullet_engine = BULLET_ENGINE # False keeps every bullet a sprite, e.g. to compare against the engine
+    enemy_horde = ENEMY_HORDE # False updates enemies one sprite at a time
+    simulation_lod = SIMULATION_LOD # False steps every enemy and coin of the level in full
+    level_streaming = LEVEL_STREAMING # False builds all of a level's entities when it starts
+    preload_assets = True # False loads every asset in __init__ instead of on background threads
+    menu_states = ('home_screen', 'level_selection') # Screens that run while the other assets still load
+    level_states = ('platformer', 'boss_fight', 'victory', 'game_over') # Screens that draw a level, see RenderScale
+    static_states = ('home_screen', 'settings', 'settings_ingame', 'level_selection', 'shop_screen', 'inventory') # Screens drawn through MENUS
 
     def __init__(self):
-        pygame.init()
-        pygame.mixer.init()
-        pygame.mixer.set_num_channels(16)
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.DOUBLEBUF)
-        Projectile.load_images()
+        self.first_frame_ms = None # Since launch, see startup.py
+        with STARTUP.section('display and mixer'):
+            pygame.init()
+            pygame.mixer.init()
+            pygame.mixer.set_num_channels(16)
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.DOUBLEBUF)
+        # Sounds and images are decoded on background threads; the home screen only waits for its backdrop
+        self.preloader = Preloader(PRELOAD_WORKERS if self.preload_assets else 0, started=STARTUP.started)
         pygame.display.set_caption("Spoonhead")
         self.clock = pygame.time.Clock()
         self.running = True 
@@ -66,6 +113,8 @@ class Game:
         # Game settings
         self.volume = 1.0
         self.fullscreen = False
+        self.fps_cap = FPS_CAP
+        self.dynamic_resolution = DYNAMIC_RESOLUTION
         self.paused = False
         self.walking_sound_playing = False
         self.u_pressed = False
@@ -90,17 +139,20 @@ class Game:
         self.unlocked_guns = ['pistol_1'] 
         self.equipped_guns = {0: 'pistol_1', 1: 'pistol_1'} 
         
-        self.load_game_data()
+        with STARTUP.section('save data'):
+            self.load_game_data()
 
         self.camera_x = 0
+        self.previous_camera_x = 0
+        self.previous_positions = {} # sprite -> rect.topleft before the latest simulation step
         self.players = [] 
         self.player = None 
         
-        self.all_sprites = pygame.sprite.Group()
+        self.all_sprites = CullingGroup()
         self.platforms = pygame.sprite.Group()
         self.moving_platforms = pygame.sprite.Group()
         self.coins = pygame.sprite.Group()
-        self.enemies = pygame.sprite.Group()
+        self.enemies = self.new_enemy_group()
         self.projectiles = pygame.sprite.Group()
         self.enemy_projectiles = pygame.sprite.Group()
         self.boss_projectiles = pygame.sprite.Group()
@@ -110,22 +162,70 @@ class Game:
         self.power_ups = pygame.sprite.Group()
         self.effects = pygame.sprite.Group()  # For visual effects like explosions
         self.boss = None
+        self.broadphase = Broadphase() # Spatial grids for the collision passes
+        self.area_damage = AreaDamage() # Blasts of the current step, resolved after the collision pass
+        self.lod = SimulationLOD() # How much of the simulation far-away enemies and coins get
+        self.lod.enabled = self.simulation_lod
+        self.level_stream = None # The current level's coins, enemies and power-up boxes, see streaming.py
+        self.bullets = BulletEngine() if self.bullet_engine and NUMPY_AVAILABLE else None # Shots as NumPy arrays, see bullets.py
+        self.platform_index = PlatformIndex(()) # Rebuilt whenever the level's platforms change
+        self.level_layer = LevelLayer(()) # Pre-rendered static platforms, rebuilt with the index
+        self.recorder = None # Active input recording (F5), see replay.py
+        self.render_rng = random.Random() # Cosmetic randomness in draw(); keeps the simulation's RNG stream reproducible
+        self.render_scale = RenderScale((SCREEN_WIDTH, SCREEN_HEIGHT)) # Lower internal resolution for levels when frames run slow
+        self.draw_ms = 0.0 # Time the last draw() took, which is all the render scale can cut
+        self.render_scale.set_enabled(self.dynamic_resolution)
 
         # Level selection
         self.scroll_x = 0
         self.level_cards = []
         
-        self.shop_screen = ShopScreen(self.screen, self.total_coins, self.upgrades, SHOP_ITEMS)
-        self.inventory_screen = InventoryScreen(self.screen, self.selected_characters, self.unlocked_guns, GUN_DATA, CHARACTER_DATA, self.equipped_guns, self.unlocked_characters, self.connected_players)
-        self.benchmark = Benchmark(SCREEN_WIDTH, SCREEN_HEIGHT)
-        self.parallax = Parallax(SCREEN_WIDTH, SCREEN_HEIGHT)
-
-        self.load_assets()
-        self.apply_settings()
+        self.menu_bg_image = None
+        self._shop_screen = None # Built when the shop is first opened, see shop_screen
+        self.benchmark = None # F3 overlay; psutil and benchmark.py load the first time it is toggled
+        # Queued first so that a worker picks up the home screen's backdrop right away
+        with STARTUP.section('assets and buttons'):
+            self.load_assets()
+        with STARTUP.section('inventory screen'):
+            self.inventory_screen = InventoryScreen(self.screen, self.selected_characters, self.unlocked_guns, GUN_DATA, CHARACTER_DATA, self.equipped_guns, self.unlocked_characters, self.connected_players, preloader=self.preloader)
+        with STARTUP.section('parallax'):
+            self.parallax = Parallax(SCREEN_WIDTH, SCREEN_HEIGHT, preloader=self.preloader)
+        # Shots are only fired in a level, so their images and pools come in the background too
+        self.preloader.add('gameplay', Projectile.decode_images, lambda _: self.prepare_shots())
+        self.preloader.add('gameplay', Enemy.decode_images, lambda _: Enemy.frame_variants()) # Facing and flash variants of every enemy frame
+        if TEXTURE_ATLAS:
+            # Player, gun and bullet frames from the packed atlas, built and saved on the first run
+            self.preloader.add('atlas', load_atlas, install_atlas)
+        with STARTUP.section('settings'):
+            self.apply_settings()
 
         # Start theme music
-        pygame.mixer.music.load(THEME_MUSIC)
-        pygame.mixer.music.play(-1)
+        with STARTUP.section('music'):
+            self.play_music(THEME_MUSIC)
+
+    @property
+    def shop_screen(self):
+        """The shop UI, imported and built the first time it is needed."""
+        if self._shop_screen is None:
+            from shop import ShopScreen
+            self._shop_screen = ShopScreen(self.screen, self.total_coins, self.upgrades, SHOP_ITEMS)
+        return self._shop_screen
+
+    def prepare_shots(self):
+        Projectile.load_images()
+        # Enough pooled shots and blasts for sustained firing, so the first volleys don't allocate
+        PROJECTILE_POOL.preallocate(64, 0, 0, 0, 0)
+        ENEMY_PROJECTILE_POOL.preallocate(32, 0, 0, 0, 0)
+        BOSS_PROJECTILE_POOL.preallocate(32, 0, 0, 0, 0)
+        EXPLOSION_POOL.preallocate(8, 0, 0)
+
+    def toggle_benchmark(self):
+        """Shows or hides the F3 overlay, importing it (and psutil) on first use."""
+        if self.benchmark is None:
+            from benchmark import Benchmark
+            self.benchmark = Benchmark(SCREEN_WIDTH, SCREEN_HEIGHT)
+            self.benchmark.record_startup(self.first_frame_ms, self.preloader.finished_ms)
+        self.benchmark.toggle()
 
     def load_game_data(self):
         try:
@@ -135,6 +235,8 @@ class Game:
                 self.total_coins = data.get('total_coins', 0)
                 self.volume = data.get('volume', 1.0)
                 self.fullscreen = data.get('fullscreen', False)
+                self.fps_cap = data.get('fps_cap', FPS_CAP)
+                self.dynamic_resolution = data.get('dynamic_resolution', DYNAMIC_RESOLUTION)
                 loaded_upgrades = data.get('upgrades', {})
                 for item_id in SHOP_ITEMS:
                     if item_id in loaded_upgrades:
@@ -167,6 +269,8 @@ class Game:
             self.equipped_guns = {0: 'pistol_1', 1: 'pistol_1'}
             self.volume = 1.0
             self.fullscreen = False
+            self.fps_cap = FPS_CAP
+            self.dynamic_resolution = DYNAMIC_RESOLUTION
 
 
     def save_game_data(self):
@@ -176,6 +280,8 @@ class Game:
             'upgrades': self.upgrades,
             'volume': self.volume,
             'fullscreen': self.fullscreen,
+            'fps_cap': self.fps_cap,
+            'dynamic_resolution': self.dynamic_resolution,
             'unlocked_characters': self.unlocked_characters,
             'selected_character': self.selected_characters[0], # Save P1 selection
             'unlocked_guns': self.unlocked_guns,
@@ -190,10 +296,12 @@ class Game:
             for sound in self.sfx.values():
                 sound.set_volume(self.volume)
 
-        if self.fullscreen:
-            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN)
-        else:
-            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.DOUBLEBUF)
+        # Only rebuild the window when the mode actually changes (not at startup or on volume changes)
+        if self.fullscreen != bool(self.screen.get_flags() & pygame.FULLSCREEN):
+            if self.fullscreen:
+                self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN)
+            else:
+                self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.DOUBLEBUF)
 
         # After changing display mode, mixer might be uninitialized.
         # Re-initialize only if it's not already initialized.
@@ -204,38 +312,36 @@ class Game:
 
         pygame.mixer.music.set_volume(self.volume)  # Re-apply volume settings
         if self.game_state == 'platformer':
-            pygame.mixer.music.load(LEVEL_MUSIC)
-            pygame.mixer.music.play(-1)
+            self.play_music(LEVEL_MUSIC)
         elif self.game_state == 'boss_fight':
-            pygame.mixer.music.load(BOSS_THEME)
-            pygame.mixer.music.play(-1)
+            self.play_music(BOSS_THEME)
         elif self.game_state in ['home_screen', 'level_selection', 'shop_screen', 'inventory', 'settings']:
-            pygame.mixer.music.load(THEME_MUSIC)
-            pygame.mixer.music.play(-1)
+            self.play_music(THEME_MUSIC)
 
     def load_assets(self):
-        try:
-            self.menu_bg_image = pygame.transform.scale(pygame.image.load(os.path.join("assets", "Background", "menu.png")), (SCREEN_WIDTH, SCREEN_HEIGHT))
-            self.sfx = {
-                'default_shot': pygame.mixer.Sound(DEFAULT_SHOT_SOUND),
-                'spread_shot': pygame.mixer.Sound(SPREAD_SHOT_SOUND),
-                'burst_shot': pygame.mixer.Sound(BURST_SHOT_SOUND),
-                'walk': pygame.mixer.Sound(WALK_SOUND),
-                'death': pygame.mixer.Sound(DEATH_SOUND),
-                'jump': pygame.mixer.Sound(JUMP_SOUND),
-                'landing': pygame.mixer.Sound(LANDING_SOUND),
-                'coin': pygame.mixer.Sound(COIN_SOUND),
-                'victory': pygame.mixer.Sound(VICTORY_SOUND),
-                'explosion': pygame.mixer.Sound("assets/audio/explosion.mp3"), # Actual explosion sound
-                'punk_ultimate1': pygame.mixer.Sound("assets/audio/punk_ultimate1.mp3"), # Punk ultimate shot
-                'cyborg_ultimate': pygame.mixer.Sound("assets/audio/cyborg_ultimate.mp3"), # Cyborg ultimate
-                'biker_ultimate': pygame.mixer.Sound("assets/audio/biker_ultimate.mp3"), # Biker ultimate
-                'generic_ultimate': pygame.mixer.Sound("assets/audio/burst.mp3"), # Generic ultimate (use burst)
-            }
-            self.death_sound = self.sfx['death'] # Keep separate reference for existing logic
-        except pygame.error as e:
-            self.sfx = {}
-            self.death_sound = None
+        # The menu backdrop comes first: the home screen shows once it is in
+        menu_path = os.path.join("assets", "Background", "menu.png")
+        self.preloader.add('home', lambda: pygame.transform.scale(pygame.image.load(menu_path), (SCREEN_WIDTH, SCREEN_HEIGHT)), self.set_menu_background)
+        self.sfx = {}
+        self.death_sound = None
+        sounds = {
+            'default_shot': DEFAULT_SHOT_SOUND,
+            'spread_shot': SPREAD_SHOT_SOUND,
+            'burst_shot': BURST_SHOT_SOUND,
+            'walk': WALK_SOUND,
+            'death': DEATH_SOUND,
+            'jump': JUMP_SOUND,
+            'landing': LANDING_SOUND,
+            'coin': COIN_SOUND,
+            'victory': VICTORY_SOUND,
+            'explosion': "assets/audio/explosion.mp3", # Actual explosion sound
+            'punk_ultimate1': "assets/audio/punk_ultimate1.mp3", # Punk ultimate shot
+            'cyborg_ultimate': "assets/audio/cyborg_ultimate.mp3", # Cyborg ultimate
+            'biker_ultimate': "assets/audio/biker_ultimate.mp3", # Biker ultimate
+            'generic_ultimate': "assets/audio/burst.mp3", # Generic ultimate (use burst)
+        }
+        for name, path in sounds.items():
+            self.preloader.add('sfx', lambda path=path: load_sound(path), lambda sound, name=name: self.set_sound(name, sound))
         self.start_button = Button(SCREEN_WIDTH/2 - 100, SCREEN_HEIGHT/2 - 50, 200, 50, "Start Game", BLUE, PURPLE)
         self.settings_button = Button(SCREEN_WIDTH/2 - 100, SCREEN_HEIGHT/2 + 20, 200, 50, "Settings", GRAY, PURPLE)
         self.quit_button = Button(SCREEN_WIDTH/2 - 100, SCREEN_HEIGHT/2 + 90, 200, 50, "Quit Game", RED, PURPLE)
@@ -255,6 +361,8 @@ class Game:
         self.volume_down_button = Button(SCREEN_WIDTH/2 - 150, 275, 50, 50, "-", RED, PURPLE)
         self.volume_up_button = Button(SCREEN_WIDTH/2 + 100, 275, 50, 50, "+", GREEN, PURPLE)
         self.fullscreen_button = Button(SCREEN_WIDTH/2 - 150, 350, 300, 50, "Toggle Fullscreen", BLUE, PURPLE)
+        self.fps_cap_button = Button(SCREEN_WIDTH/2 - 150, 425, 300, 50, "FPS Cap", BLUE, PURPLE, font_size=16)
+        self.resolution_button = Button(SCREEN_WIDTH/2 - 150, 500, 300, 50, "Resolution", BLUE, PURPLE, font_size=16)
 
         # Pause menu buttons
         self.resume_button = Button(SCREEN_WIDTH/2 - 100, SCREEN_HEIGHT/2 - 120, 200, 50, "Resume", BLUE, PURPLE)
@@ -264,19 +372,53 @@ class Game:
         
         
         # Load gacha font and gun display images
-        self.gacha_font = pygame.font.Font(PIXEL_FONT, 30)
+        self.gacha_font = TEXT.get_font(30)
         for gun_id, gun_info in GUN_DATA.items():
-            try:
-                img = pygame.image.load(gun_info['image_path']).convert_alpha()
-                self.gacha_gun_display_images[gun_id] = pygame.transform.scale(img, (100, 100)) # Larger scale for display
-            except pygame.error:
-                self.gacha_gun_display_images[gun_id] = pygame.Surface((100, 100), pygame.SRCALPHA)
-                self.gacha_gun_display_images[gun_id].fill(GRAY)
+            self.preloader.add('gacha', lambda path=gun_info['image_path']: load_gun_display_image(path), lambda image, gun_id=gun_id: self.set_gun_display_image(gun_id, image))
+
+    def set_menu_background(self, image):
+        self.menu_bg_image = image.convert_alpha()
+
+    def set_sound(self, name, sound):
+        if sound is None:
+            return
+        sound.set_volume(self.volume)
+        self.sfx[name] = sound
+        if name == 'death':
+            self.death_sound = sound # Keep separate reference for existing logic
+
+    def set_gun_display_image(self, gun_id, image):
+        self.gacha_gun_display_images[gun_id] = image.convert_alpha()
+
+    def pump_assets(self):
+        """Hands finished background loads to the main thread, or waits for all of them outside the menus."""
+        if self.preloader.done:
+            return
+        if self.game_state in self.menu_states and not self.paused:
+            self.preloader.pump()
+            if self.game_state != 'home_screen':
+                self.preloader.wait('home') # Only the home screen has a loading view
+        else:
+            self.preloader.wait()
+        if self.preloader.done:
+            print(f"Assets loaded in {self.preloader.finished_ms:.0f} ms")
+            STARTUP.mark('assets loaded')
+            if 'home interactive' in STARTUP.marks:
+                STARTUP.report(self.preloader)
+            if self.benchmark:
+                self.benchmark.record_startup(self.first_frame_ms, self.preloader.finished_ms)
+
+    def draw_loading_screen(self):
+        """Progress bar shown until the home screen's own assets are in."""
+        bar = pygame.Rect(SCREEN_WIDTH / 4, SCREEN_HEIGHT / 2, SCREEN_WIDTH / 2, 20)
+        pygame.draw.rect(self.screen, DARK_GRAY, bar)
+        pygame.draw.rect(self.screen, GOLD, (bar.x, bar.y, bar.width * self.preloader.progress(), bar.height))
+        pygame.draw.rect(self.screen, WHITE, bar, 2)
+        self.draw_text("Loading...", 20, SCREEN_WIDTH / 2, bar.y - 30)
 
 
     def draw_text(self, text, size, x, y, color=WHITE, align="center"):
-        font = pygame.font.Font(PIXEL_FONT, size)
-        text_surface = font.render(text, True, color)
+        text_surface = TEXT.render(text, size, color)
         text_rect = text_surface.get_rect(**{align: (x, y)})
         self.screen.blit(text_surface, text_rect)
 
@@ -288,10 +430,18 @@ class Game:
                 channel.set_volume(self.volume)
                 channel.play(sfx_object, loops)
 
+    def play_music(self, path):
+        """(Re)starts looping background music; a no-op for games built with music_enabled = False."""
+        if not self.music_enabled:
+            return
+        pygame.mixer.music.stop()
+        pygame.mixer.music.load(path)
+        pygame.mixer.music.play(-1)
+
     def start_screen_shake(self, duration, intensity):
         self.screen_shake_duration = duration
         self.screen_shake_intensity = intensity
-        self.screen_shake_start_time = pygame.time.get_ticks()
+        self.screen_shake_start_time = CLOCK.get_ticks()
 
     def buy_gun_crate(self):
         crate_cost = 500
@@ -325,6 +475,7 @@ class Game:
                 }
 
                 # Call the new blocking animation function
+                from gacha import play_gacha_animation # Only needed once a crate is bought
                 play_gacha_animation(self.screen, gacha_result, self.gacha_gun_display_images, self.gacha_font)
 
                 # After animation, update game state
@@ -353,6 +504,8 @@ class Game:
             for event in pygame.event.get():
                 # Get mouse position for this event
                 mouse_pos = pygame.mouse.get_pos()
+                if event.type not in (pygame.MOUSEMOTION, pygame.JOYAXISMOTION):
+                    MENUS.invalidate() # Anything but hovering may change a menu; hovering is tracked per widget
 
                 if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
                     self.save_game_data()
@@ -366,7 +519,13 @@ class Game:
                         self.paused = not self.paused
 
                     if event.key == pygame.K_F3:
-                        self.benchmark.toggle()
+                        self.toggle_benchmark()
+
+                    if event.key == pygame.K_F4:
+                        self.dump_profile()
+
+                    if event.key == pygame.K_F5 and self.game_state in ['platformer', 'boss_fight']:
+                        self.toggle_recording()
 
                 # If paused, handle only pause menu events
                 if self.paused:
@@ -380,9 +539,7 @@ class Game:
                         # self.total_coins += self.player.coins # Removed
                         self.save_game_data()
                         self.game_state = 'home_screen'
-                        pygame.mixer.music.stop()
-                        pygame.mixer.music.load(THEME_MUSIC)
-                        pygame.mixer.music.play(-1)
+                        self.play_music(THEME_MUSIC)
                     elif self.exit_button_ingame.is_clicked(event, mouse_pos):
                         self.save_game_data()
                         self.running = False
@@ -406,17 +563,25 @@ class Game:
                         self.fullscreen = not self.fullscreen
                         self.apply_settings()
                         self.save_game_data()
+                    if self.fps_cap_button.is_clicked(event, mouse_pos):
+                        options = FPS_CAP_OPTIONS
+                        self.fps_cap = options[(options.index(self.fps_cap) + 1) % len(options)] if self.fps_cap in options else options[0]
+                        self.save_game_data()
+                    if self.resolution_button.is_clicked(event, mouse_pos):
+                        self.dynamic_resolution = not self.dynamic_resolution
+                        self.render_scale.set_enabled(self.dynamic_resolution)
+                        self.save_game_data()
 
                 if self.game_state in ['platformer', 'boss_fight'] and self.level_select_button.is_clicked(event, mouse_pos):
                     self.save_game_data()
                     self.game_state = 'level_selection'
-                    pygame.mixer.music.stop()
-                    pygame.mixer.music.load(THEME_MUSIC)
-                    pygame.mixer.music.play(-1)
+                    self.play_music(THEME_MUSIC)
                     continue
 
                 if self.game_state == 'victory':
                     if event.type == pygame.KEYDOWN or event.type == pygame.MOUSEBUTTONDOWN:
+                        release_all(self.all_sprites)
+                        if self.bullets: self.bullets.clear()
                         self.all_sprites.empty()
                         self.platforms.empty()
                         self.moving_platforms.empty()
@@ -433,16 +598,17 @@ class Game:
                         self.players = []
                         self.player = None
                         self.boss = None
+                        self.level_stream = None
                         self.camera_x = 0
                         self.screen_shake_duration = 0
                         self.screen_shake_intensity = 0
 
                         self.game_state = 'level_selection'
-                        pygame.mixer.music.stop()
-                        pygame.mixer.music.load(THEME_MUSIC)
-                        pygame.mixer.music.play(-1)
+                        self.play_music(THEME_MUSIC)
                 elif self.game_state == 'game_over':
                     if event.type == pygame.KEYDOWN and event.key == pygame.K_r: self.init_level(self.current_level)
+                elif self.game_state == 'home_screen' and self.menu_bg_image is None:
+                    pass # The loading screen takes no input
                 elif self.game_state == 'home_screen':
                     if self.start_button.is_clicked(event, mouse_pos):
                         self.game_state = 'level_selection'
@@ -525,6 +691,14 @@ class Game:
                         self.fullscreen = not self.fullscreen
                         self.apply_settings()
                         self.save_game_data()
+                    if self.fps_cap_button.is_clicked(event, mouse_pos):
+                        options = FPS_CAP_OPTIONS
+                        self.fps_cap = options[(options.index(self.fps_cap) + 1) % len(options)] if self.fps_cap in options else options[0]
+                        self.save_game_data()
+                    if self.resolution_button.is_clicked(event, mouse_pos):
+                        self.dynamic_resolution = not self.dynamic_resolution
+                        self.render_scale.set_enabled(self.dynamic_resolution)
+                        self.save_game_data()
         except Exception as e:
             import traceback
             traceback.print_exc()
@@ -536,11 +710,12 @@ class Game:
         self.gate_type = level_data.get("gate_type", "boss")
         
         # Sprite Groups
-        self.all_sprites = pygame.sprite.Group()
+        release_all(self.all_sprites) # Shots and effects of the previous level go back to their pools
+        self.all_sprites = CullingGroup()
         self.platforms = pygame.sprite.Group()
         self.moving_platforms = pygame.sprite.Group()
         self.coins = pygame.sprite.Group()
-        self.enemies = pygame.sprite.Group()
+        self.enemies = self.new_enemy_group()
         self.projectiles = pygame.sprite.Group()
         self.enemy_projectiles = pygame.sprite.Group()
         self.boss_projectiles = pygame.sprite.Group()
@@ -548,6 +723,7 @@ class Game:
         self.boss_gate_group = pygame.sprite.Group()
         self.power_up_boxes = pygame.sprite.Group()
         self.power_ups = pygame.sprite.Group()
+        self.broadphase.clear()
         
         # Players
         self.players = []
@@ -574,39 +750,41 @@ class Game:
             p = MovingPlatform(*p_data)
             self.platforms.add(p)
             self.moving_platforms.add(p)
-        for c_data in level_data["coins"]:
-            self.coins.add(Coin(*c_data))
-        for e_data in level_data["enemies"]:
-            # Enemies target the closest player (simple logic for now, pass P1)
-            # Improved logic: Pass list of players to Enemy or handle in Enemy.update
-            # For now, Enemy takes 'player'. We'll pass P1. 
-            # TODO: Update Enemy to target closest player.
-            self.enemies.add(Enemy(player=self.player, **e_data))
-        for b_data in level_data.get("power_up_boxes", []):
-            self.power_up_boxes.add(PowerUpBox(*b_data))
-        
+        # Add all sprites to the main rendering group; static platforms are drawn by the level layer
+        self.all_sprites.add(self.moving_platforms)
+        # Coins, enemies and power-up boxes are built as the camera reaches their chunk
+        self.camera_x = 0
+        self.level_stream = LevelStream(level_data, LEVEL_CHUNK_WIDTH if self.level_streaming else None)
+        self.level_stream.update(self, self.camera_x)
+
         self.boss_gate = BossGate(level_data["boss_gate_x"], 460)
         self.boss_gate_group.add(self.boss_gate)
-        
-        # Add all sprites to the main rendering group
-        self.all_sprites.add(
-            self.platforms, 
-            self.coins, 
-            self.enemies, 
-            self.power_up_boxes, 
-            self.boss_gate
-        )
+        self.all_sprites.add(self.boss_gate)
+        self.build_static_level()
         
         self.boss = None
         self.game_state = 'platformer'
-        self.camera_x = 0
+        self.snapshot_positions()
         
-        pygame.mixer.music.stop()
-        pygame.mixer.music.load(LEVEL_MUSIC)
-        pygame.mixer.music.play(-1)
+        self.play_music(LEVEL_MUSIC)
+
+    def build_level_entity(self, kind, data):
+        """Builds one coin, enemy or power-up box of the level data (kind is its key there)."""
+        if kind == 'coins':
+            return Coin(*data)
+        if kind == 'enemies':
+            # Enemies take P1 as the player whose ultimate meter their death fills
+            return Enemy(player=self.player, **data)
+        return PowerUpBox(*data)
+
+    def add_level_entity(self, kind, sprite):
+        """Puts a streamed-in level entity into its group and the rendering group."""
+        getattr(self, kind).add(sprite)
+        self.all_sprites.add(sprite)
 
     def init_boss_fight(self):
         self.game_state = 'boss_fight'
+        self.level_stream = None
         level_data = ALL_LEVELS[self.current_level]
         boss_data = level_data["boss"].copy()
 
@@ -614,8 +792,10 @@ class Game:
         boss_data.pop('x', None)
         boss_data.pop('y', None)
 
+        release_all(self.all_sprites) # Shots in flight go back to their pools instead of lingering in their groups
         self.all_sprites.empty() # Clear all old sprites
         self.platforms.empty(); self.coins.empty(); self.enemies.empty(); self.boss_gate_group.empty()
+        self.broadphase.clear()
 
         for player in self.players:
             player.rect.center = (200, 400)
@@ -626,14 +806,25 @@ class Game:
         self.camera_x = 0
 
         ground = Platform(0, 500, SCREEN_WIDTH, 40)
-        self.all_sprites.add(ground); self.platforms.add(ground)
+        self.platforms.add(ground)
+        self.build_static_level()
+        self.snapshot_positions()
 
         self.boss = Boss(x=SCREEN_WIDTH * 0.75, y=SCREEN_HEIGHT / 2, game=self, **boss_data)
         self.all_sprites.add(self.boss); self.boss_group.add(self.boss)
 
-        pygame.mixer.music.stop()
-        pygame.mixer.music.load(BOSS_THEME)
-        pygame.mixer.music.play(-1)
+        self.play_music(BOSS_THEME)
+
+    def new_enemy_group(self):
+        """Group for the level's enemies: an array-stepped EnemyHorde when numpy is installed."""
+        return EnemyHorde() if self.enemy_horde and NUMPY_AVAILABLE else pygame.sprite.Group()
+
+    def build_static_level(self):
+        """Freezes the current platforms into the physics index and the pre-rendered level layer."""
+        self.platform_index = PlatformIndex(self.platforms)
+        self.level_layer = LevelLayer(self.platforms)
+        if self.bullets:
+            self.bullets.set_level(self.platforms)
 
     def change_character(self, player_index, character_id):
         self.selected_characters[player_index] = character_id
@@ -646,10 +837,41 @@ class Game:
             # If in menu (not really showing players), just update data
             pass
 
+    def toggle_recording(self):
+        """F5: restarts the current level while recording inputs, or stops and saves the recording in progress."""
+        if self.recorder:
+            os.makedirs(RECORDINGS_DIR, exist_ok=True)
+            path = os.path.join(RECORDINGS_DIR, f"level{self.recorder.recording.level}-{time.strftime('%Y%m%d-%H%M%S')}.replay.gz")
+            recording = self.recorder.stop(path)
+            self.recorder = None
+            print(f"Recording saved to {path} ({recording.ticks} ticks)")
+        else:
+            self.recorder = Recorder(self, self.current_level)
+            print(f"Recording level {self.current_level}...")
+
+    def dump_profile(self):
+        """F4: saves the profiled frames as a Chrome trace; starts profiling first if it is off."""
+        if not PROFILER.enabled:
+            PROFILER.set_enabled(True)
+            print("Profiling... press F4 again to save a trace")
+            return
+        path = os.path.join(PROFILES_DIR, f"trace-{time.strftime('%Y%m%d-%H%M%S')}.json")
+        count = PROFILER.dump(path)
+        PROFILER.set_enabled(bool(self.benchmark and self.benchmark.active)) # Keep profiling only while the F3 overlay shows it
+        print(f"Trace saved to {path} ({count} spans), open it in chrome://tracing or ui.perfetto.dev")
+
     def update_game_state(self):
-        self.benchmark.update(self.clock)
+        """Advances the simulation by one fixed step (1 / SIMULATION_HZ seconds)."""
+        PROFILER.phase('sim')
+        if self.benchmark:
+            self.benchmark.update(self.clock)
+        if self.recorder and self.game_state not in ['platformer', 'boss_fight']:
+            self.toggle_recording() # The run ended (game over, level complete or back to the menus)
         if self.paused:
             return
+        CLOCK.advance()
+        reclaim_all() # Shots and effects that died last step go back to their pools
+        self.snapshot_positions()
 
         # Check for active players and Game Over condition
         if self.game_state in ['platformer', 'boss_fight']:
@@ -687,21 +909,40 @@ class Game:
             alive_players = [p for p in self.players if p.health > 0]
             primary_target = alive_players[0] if alive_players else (self.players[0] if self.players else None)
 
-            self.enemies.update(primary_target, self.all_sprites, self.enemy_projectiles, self.platforms)
+            PROFILER.phase('streaming')
+            if self.level_stream:
+                self.level_stream.update(self, self.camera_x)
 
-            self.enemy_projectiles.update(self.platforms)
-            self.coins.update()  # Update coins for animation and bobbing
+            PROFILER.phase('enemies')
+            self.lod.follow(self.camera_x)
+            self.enemies.update(primary_target, self.all_sprites, self.enemy_projectiles, self.platform_index, self.lod)
+
+            PROFILER.phase('world')
+            if self.bullets and self.bullets.absorb(self.enemy_projectiles, ENEMY_SHOT):
+                self.bullets.update_enemy_bullets()
+            else:
+                self.enemy_projectiles.update(self.platforms)
+            self.coins.update(self.lod)  # Update coins for animation and bobbing
             self.power_ups.update()
             self.boss_gate_group.update()
         elif self.game_state == 'boss_fight':
+            PROFILER.phase('boss')
             if self.boss:
                 self.boss.update()
             if self.game_state == 'victory':
                 pygame.mixer.music.stop()
-            self.boss_projectiles.update(self.platforms)
+            if self.bullets and self.bullets.absorb(self.boss_projectiles, BOSS_SHOT):
+                self.bullets.update_boss_bullets()
+            else:
+                self.boss_projectiles.update(self.platforms)
             self.coins.update()  # Update coins for animation and bobbing
 
+        # Bring the broadphase grids up to date before the collision passes
+        PROFILER.phase('broadphase')
+        self.broadphase.sync(self.coins, self.enemies, self.enemy_projectiles, self.boss_gate_group, self.power_up_boxes, self.platforms)
+
         # Update each player
+        PROFILER.phase('players')
         actions_list = []
         # Update controller manager to check for new inputs/connections if needed
                 
@@ -741,7 +982,7 @@ class Game:
                     self.projectiles.add(ultimate_proj)
 
             # Update player physics/animation
-            sfx_events = player.update(actions.get('move_x'), self.platforms)
+            sfx_events = player.update(actions.get('move_x'), self.platform_index)
             if sfx_events:
                 for sfx in sfx_events:
                     self._play_sfx(sfx)
@@ -762,7 +1003,7 @@ class Game:
             # Player Collisions (Coins, Powerups, Enemies)
             if self.game_state == 'platformer':
                 # Coins
-                for coin in pygame.sprite.spritecollide(player, self.coins, False):
+                for coin in self.broadphase.collide(self.coins, player.rect):
                     if player.hitbox.colliderect(coin.rect):
                         coin.kill()
                         self.total_coins += 1
@@ -775,14 +1016,21 @@ class Game:
                     player.activate_power_up(power_up.power_up_type)
 
                 # Enemies
-                if pygame.sprite.spritecollide(player, self.enemies, False, collide_hitbox): 
+                if self.broadphase.collide(self.enemies, player.hitbox, lambda enemy: collide_hitbox(player, enemy)):
                     player.take_damage(10)
                 # Enemy Projectiles
-                if pygame.sprite.spritecollide(player, self.enemy_projectiles, True): 
-                    player.take_damage(15)
+                if self.bullets and self.bullets.handles(ENEMY_SHOT):
+                    if self.bullets.hit(ENEMY_SHOT, player.rect):
+                        player.take_damage(15)
+                else:
+                    hit_projectiles = self.broadphase.collide(self.enemy_projectiles, player.rect)
+                    for enemy_proj in hit_projectiles:
+                        enemy_proj.kill()
+                    if hit_projectiles:
+                        player.take_damage(15)
 
             # Boss Gate
-            if pygame.sprite.spritecollide(player, self.boss_gate_group, False): 
+            if self.broadphase.collide(self.boss_gate_group, player.rect):
                 if self.gate_type == 'next_level':
                     if self.current_level == self.unlocked_levels and self.unlocked_levels < len(ALL_LEVELS):
                         self.unlocked_levels += 1
@@ -805,7 +1053,10 @@ class Game:
             
             # Boss Projectiles collision
             if self.game_state == 'boss_fight':
-                if pygame.sprite.spritecollide(player, self.boss_projectiles, True): 
+                if self.bullets and self.bullets.handles(BOSS_SHOT):
+                    if self.bullets.hit(BOSS_SHOT, player.rect):
+                        player.take_damage(25)
+                elif pygame.sprite.spritecollide(player, self.boss_projectiles, True): 
                     player.take_damage(25)
 
             # Fall death
@@ -813,171 +1064,102 @@ class Game:
                 player.health = 0 # Mark as dead next loop
                 player.kill()
 
-        self.projectiles.update()
-
-        # Projectile Collisions (Enemies, Boxes)
-        for proj in self.projectiles:
-            hit_enemies = pygame.sprite.spritecollide(proj, self.enemies, False, lambda proj, enemy: proj.rect.colliderect(enemy.hitbox))
-            if hit_enemies:
-                if proj.is_explosive:
-                    # Handle explosive projectile - damage all nearby enemies in an area
-                    explosion_radius = 80  # pixels
-                    explosion_center = proj.rect.center
-
-                    # Find all enemies in explosion radius
-                    for enemy in self.enemies:
-                        distance = math.sqrt((enemy.rect.centerx - explosion_center[0])**2 +
-                                           (enemy.rect.centery - explosion_center[1])**2)
-                        if distance <= explosion_radius:
-                            # Reduce damage based on distance (closer = more damage)
-                            distance_factor = max(0.3, 1.0 - distance/explosion_radius)  # 30% to 100% damage
-                            damage = int(proj.damage * distance_factor)
-                            enemy.take_damage(damage)
-
-                    # Also check for boss if in boss fight
-                    if self.game_state == 'boss_fight' and self.boss:
-                        distance = math.sqrt((self.boss.rect.centerx - explosion_center[0])**2 +
-                                           (self.boss.rect.centery - explosion_center[1])**2)
-                        if distance <= explosion_radius:
-                            distance_factor = max(0.3, 1.0 - distance/explosion_radius)
-                            damage = int(proj.damage * distance_factor)
-                            self.boss.take_damage(damage)
-
-                    # Create visual explosion effect
-                    explosion = Explosion(proj.rect.centerx, proj.rect.centery)
-                    self.all_sprites.add(explosion)
-                    self.effects.add(explosion)
-                    # Play explosion sound
-                    self._play_sfx('explosion')
-                    proj.kill()
-                else:
-                    # Regular projectile behavior
-                    proj.kill()
-                    for enemy in hit_enemies:
-                        enemy.take_damage(proj.damage)
+        PROFILER.phase('projectiles')
+        if self.bullets and self.bullets.absorb(self.projectiles, PLAYER_SHOT):
+            self.bullets.update_player_bullets(self)
+        else:
+            self.projectiles.update()
+
+            # Projectile Collisions (Enemies, Boxes)
+            for proj in self.projectiles:
+                hit_enemies = self.broadphase.collide(self.enemies, proj.rect, lambda enemy: proj.rect.colliderect(enemy.hitbox))
+                if hit_enemies:
+                    if proj.is_explosive:
+                        self.explode(proj)
+                    else:
+                        # Regular projectile behavior
+                        proj.kill()
+                        for enemy in hit_enemies:
+                            enemy.take_damage(proj.damage)
             
-            hit_boxes = pygame.sprite.spritecollide(proj, self.power_up_boxes, False)
-            if hit_boxes:
-                if proj.is_explosive:
-                    # Create explosion when explosive projectile hits a power-up box
-                    explosion_radius = 80
-                    explosion_center = proj.rect.center
-
-                    # Find all enemies in explosion radius
-                    for enemy in self.enemies:
-                        distance = math.sqrt((enemy.rect.centerx - explosion_center[0])**2 +
-                                           (enemy.rect.centery - explosion_center[1])**2)
-                        if distance <= explosion_radius:
-                            distance_factor = max(0.3, 1.0 - distance/explosion_radius)  # 30% to 100% damage
-                            damage = int(proj.damage * distance_factor)
-                            enemy.take_damage(damage)
-
-                    # Check boss in boss fight
-                    if self.game_state == 'boss_fight' and self.boss:
-                        distance = math.sqrt((self.boss.rect.centerx - explosion_center[0])**2 +
-                                           (self.boss.rect.centery - explosion_center[1])**2)
-                        if distance <= explosion_radius:
-                            distance_factor = max(0.3, 1.0 - distance/explosion_radius)
-                            damage = int(proj.damage * distance_factor)
-                            self.boss.take_damage(damage)
-
-                    # Break boxes and create power-ups (but not in boss fights)
-                    # Create visual explosion effect
-                    explosion = Explosion(proj.rect.centerx, proj.rect.centery)
-                    self.all_sprites.add(explosion)
-                    self.effects.add(explosion)
-                    proj.kill()
-                    # Don't create power-ups during boss fights
-                    if self.game_state != 'boss_fight':
-                        for box in hit_boxes:
-                            power_up_type = box.take_damage(proj.damage)
-                            if power_up_type:
-                                power_up = PowerUp(box.rect.centerx, box.rect.centery, power_up_type)
-                                self.all_sprites.add(power_up)
-                                self.power_ups.add(power_up)
-
-                    # Play explosion sound
-                    self._play_sfx('explosion')
-                else:
-                    proj.kill()
+                hit_boxes = self.broadphase.collide(self.power_up_boxes, proj.rect)
+                if hit_boxes:
+                    if proj.is_explosive:
+                        self.explode(proj)
+                        # Don't create power-ups during boss fights
+                        if self.game_state == 'boss_fight':
+                            hit_boxes = []
+                    else:
+                        proj.kill()
                     for box in hit_boxes:
-                        power_up_type = box.take_damage(proj.damage)
-                        if power_up_type:
-                            power_up = PowerUp(box.rect.centerx, box.rect.centery, power_up_type)
-                            self.all_sprites.add(power_up)
-                            self.power_ups.add(power_up)
+                        self.damage_box(box, proj.damage)
             
-            if pygame.sprite.spritecollide(proj, self.platforms, False):
-                if proj.is_explosive:
-                    # Create explosion when explosive projectile hits a platform
-                    explosion_radius = 80
-                    explosion_center = proj.rect.center
-
-                    # Find all enemies in explosion radius
-                    for enemy in self.enemies:
-                        distance = math.sqrt((enemy.rect.centerx - explosion_center[0])**2 +
-                                           (enemy.rect.centery - explosion_center[1])**2)
-                        if distance <= explosion_radius:
-                            distance_factor = max(0.3, 1.0 - distance/explosion_radius)  # 30% to 100% damage
-                            damage = int(proj.damage * distance_factor)
-                            enemy.take_damage(damage)
-
-                    # Check boss in boss fight
-                    if self.game_state == 'boss_fight' and self.boss:
-                        distance = math.sqrt((self.boss.rect.centerx - explosion_center[0])**2 +
-                                           (self.boss.rect.centery - explosion_center[1])**2)
-                        if distance <= explosion_radius:
-                            distance_factor = max(0.3, 1.0 - distance/explosion_radius)
-                            damage = int(proj.damage * distance_factor)
-                            self.boss.take_damage(damage)
-
-                    # Create visual explosion effect
-                    explosion = Explosion(proj.rect.centerx, proj.rect.centery)
-                    self.all_sprites.add(explosion)
-                    self.effects.add(explosion)
-                    # Play explosion sound
-                    self._play_sfx('explosion')
-                    proj.kill()
-                else:
-                    # Regular projectile behavior
-                    proj.kill()
-
-        if self.game_state == 'boss_fight' and self.boss:
-            hits = pygame.sprite.spritecollide(self.boss, self.projectiles, False)  # Don't remove on collision check
-            for hit in hits:
-                if hit.is_explosive:
-                    # Remove explosive projectile and handle explosion
-                    hit.kill()
-                    explosion_radius = 80
-                    explosion_center = hit.rect.center
-
-                    # Damage boss with distance-based damage
-                    distance = math.sqrt((self.boss.rect.centerx - explosion_center[0])**2 +
-                                       (self.boss.rect.centery - explosion_center[1])**2)
-                    if distance <= explosion_radius:
-                        distance_factor = max(0.3, 1.0 - distance/explosion_radius)
-                        damage = int(hit.damage * distance_factor)
-                        self.boss.take_damage(damage)
-
-                    # Create visual explosion effect
-                    explosion = Explosion(hit.rect.centerx, hit.rect.centery)
-                    self.all_sprites.add(explosion)
-                    self.effects.add(explosion)
-                    # Play explosion sound
-                    self._play_sfx('explosion')
-                else:
-                    # Regular projectile behavior
-                    hit.kill()
-                    self.boss.take_damage(hit.damage)
-            if not self.boss.alive():
-                pass # Handled by boss update
+                if self.broadphase.collide(self.platforms, proj.rect):
+                    if proj.is_explosive:
+                        self.explode(proj)
+                    else:
+                        # Regular projectile behavior
+                        proj.kill()
+
+            if self.game_state == 'boss_fight' and self.boss:
+                hits = pygame.sprite.spritecollide(self.boss, self.projectiles, False)  # Don't remove on collision check
+                for hit in hits:
+                    if hit.is_explosive:
+                        self.explode(hit)
+                    else:
+                        # Regular projectile behavior
+                        hit.kill()
+                        self.boss.take_damage(hit.damage)
+
+        # Every blast of this step does its area damage in one pass
+        with PROFILER.section('explosions'):
+            if self.area_damage.resolve(self.broadphase, self.enemies, self.boss if self.game_state == 'boss_fight' else None):
+                self._play_sfx('explosion')
 
         # Update visual effects (like explosions)
+        PROFILER.phase('effects')
         self.effects.update()
 
         # Update camera
+        PROFILER.phase('camera')
         self.update_camera()
 
+    def explode(self, proj):
+        """Detonates an explosive projectile sprite and removes it."""
+        if not proj.alive():
+            return # Already went off this step
+        proj.kill()
+        self.detonate(proj.rect.centerx, proj.rect.centery, proj.damage)
+
+    def detonate(self, x, y, damage):
+        """Queues a blast's area damage and shows a pooled explosion effect at (x, y)."""
+        self.area_damage.queue(x, y, damage)
+        explosion = EXPLOSION_POOL.acquire(x, y)
+        self.all_sprites.add(explosion)
+        self.effects.add(explosion)
+
+    def damage_box(self, box, damage):
+        """Hits a power-up box; a box that breaks drops its power-up."""
+        power_up_type = box.take_damage(damage)
+        if power_up_type:
+            power_up = PowerUp(box.rect.centerx, box.rect.centery, power_up_type)
+            self.all_sprites.add(power_up)
+            self.power_ups.add(power_up)
+
+    def snapshot_positions(self):
+        """Remembers where the moving sprites and the camera were before this step, for render interpolation."""
+        self.previous_positions = {sprite: sprite.rect.topleft for sprite in self.all_sprites.dynamic}
+        if self.bullets:
+            self.bullets.snapshot()
+        self.previous_camera_x = self.camera_x
+
+    def interpolate(self, sprite, alpha):
+        """Screen-space shift of sprite from its current rect towards where it is drawn this frame."""
+        previous = self.previous_positions.get(sprite)
+        if previous is None:
+            return 0, 0
+        return (previous[0] - sprite.rect.x) * (1 - alpha), (previous[1] - sprite.rect.y) * (1 - alpha)
+
     def update_camera(self):
         # Different camera behavior for boss fight
         if self.game_state == 'boss_fight':
@@ -1007,7 +1189,7 @@ class Game:
             self.camera_x = max(0, min(self.camera_x, level_width - SCREEN_WIDTH))
 
         # Apply screen shake effects
-        if pygame.time.get_ticks() < self.screen_shake_start_time + self.screen_shake_duration:
+        if CLOCK.get_ticks() < self.screen_shake_start_time + self.screen_shake_duration:
             shake_x = random.randint(-self.screen_shake_intensity, self.screen_shake_intensity)
             self.camera_x += shake_x
         else:
@@ -1034,27 +1216,58 @@ class Game:
             
             self.draw_text("BOSS HEALTH", 18, SCREEN_WIDTH / 2, y + bar_height / 2, WHITE)
 
-    def draw(self):
-        self.screen.fill(BLACK) # Clear screen at the beginning of each draw call
+    def draw(self, alpha=1.0):
+        """Renders the current state; alpha (0..1) is how far the next simulation step is, for interpolation."""
+        PROFILER.phase('draw_background')
         mouse_pos = pygame.mouse.get_pos() # Define mouse_pos here
-
-        effective_camera_x = self.camera_x
+        # Static screens are only redrawn where something changed, see MenuRenderer
+        dirty_rects = None
+        if self.game_state in self.static_states and DIRTY_RECT_MENUS and not (self.benchmark and self.benchmark.active):
+            dirty_rects = MENUS.begin((self.game_state, self.preloader.finished, len(self.connected_players), self.menu_bg_image is None), mouse_pos)
+            if dirty_rects == []:
+                return
+            if dirty_rects:
+                self.screen.set_clip(dirty_rects[0].unionall(dirty_rects[1:]))
+        else:
+            MENUS.invalidate() # The next menu frame goes over something else
+        # Levels go into the render scale's smaller target when it is below 1, then get upscaled under the HUD
+        scaler = self.render_scale if self.render_scale.scale < 1 and self.game_state in self.level_states else None
+        world = scaler.target() if scaler else self.screen
+        if self.game_state == 'home_screen' or not self.parallax.opaque:
+            world.fill(BLACK) # Clear screen at the beginning of each draw call; an opaque parallax backdrop covers it anyway
+
+        effective_camera_x = self.previous_camera_x + (self.camera_x - self.previous_camera_x) * alpha
         effective_camera_y = 0 # Assuming vertical camera is fixed for now
 
         # Apply screen shake offsets to effective camera positions for drawing
-        if pygame.time.get_ticks() < self.screen_shake_start_time + self.screen_shake_duration:
-            shake_x = random.randint(-self.screen_shake_intensity, self.screen_shake_intensity)
-            shake_y = random.randint(-self.screen_shake_intensity, self.screen_shake_intensity)
+        if CLOCK.get_ticks() < self.screen_shake_start_time + self.screen_shake_duration:
+            shake_x = self.render_rng.randint(-self.screen_shake_intensity, self.screen_shake_intensity)
+            shake_y = self.render_rng.randint(-self.screen_shake_intensity, self.screen_shake_intensity)
             effective_camera_x += shake_x
             effective_camera_y += shake_y
 
         if self.game_state == 'home_screen':
-            self.screen.blit(self.menu_bg_image, (0, 0))
+            if self.menu_bg_image is None:
+                self.draw_loading_screen()
+            else:
+                self.screen.blit(self.menu_bg_image, (0, 0))
+                if 'home interactive' not in STARTUP.marks:
+                    STARTUP.mark('home interactive')
+                    if self.preloader.done:
+                        STARTUP.report(self.preloader)
         else:
-            self.parallax.draw(self.screen)
-
-        if self.game_state == 'home_screen':
+            PROFILER.phase('parallax')
+            self.parallax.draw(world, scaler)
+        if self.benchmark:
+            self.benchmark.record_background(None if self.game_state == 'home_screen' else self.parallax.blits)
+
+        PROFILER.phase('draw_ui')
+        if self.game_state == 'home_screen' and self.menu_bg_image is None:
+            pass # Still loading
+        elif self.game_state == 'home_screen':
             self.draw_text("Spoonhead", 60, SCREEN_WIDTH/2, SCREEN_HEIGHT/4, GOLD)
+            if not self.preloader.done:
+                self.draw_text(f"Loading {self.preloader.progress() * 100:.0f}%", 12, SCREEN_WIDTH - 20, SCREEN_HEIGHT - 20, GRAY, align="bottomright")
             
             # Draw buttons
             self.start_button.draw(self.screen, mouse_pos)
@@ -1071,6 +1284,10 @@ class Game:
             # Update text based on state
             self.fullscreen_button.text = "Mode: Fullscreen" if self.fullscreen else "Mode: Windowed"
             self.fullscreen_button.draw(self.screen, mouse_pos)
+            self.fps_cap_button.text = f"FPS Cap: {self.fps_cap}" if self.fps_cap else "FPS Cap: Off"
+            self.fps_cap_button.draw(self.screen, mouse_pos)
+            self.resolution_button.text = f"Resolution: Dynamic ({self.render_scale.scale:.0%})" if self.dynamic_resolution else "Resolution: Native"
+            self.resolution_button.draw(self.screen, mouse_pos)
             self.back_button.draw(self.screen, mouse_pos)
         elif self.game_state == 'level_selection':
             self.screen.blit(self.menu_bg_image, (0, 0))
@@ -1091,6 +1308,8 @@ class Game:
                 
                 # Hover effect
                 is_hovered = card_rect.collidepoint(mouse_pos) and is_unlocked
+                if is_unlocked:
+                    MENUS.track(card_rect, is_hovered)
                 
                 card_color = DARK_GRAY if is_unlocked else BLACK
                 border_color = YELLOW if is_hovered else (GOLD if is_unlocked else GRAY)
@@ -1111,9 +1330,7 @@ class Game:
                     self.draw_text(level_data['name'], 20, card_rect.centerx, card_rect.y + 180, WHITE)
 
                 if not is_unlocked:
-                    lock_overlay = pygame.Surface((card_width, card_height), pygame.SRCALPHA)
-                    lock_overlay.fill((0, 0, 0, 180))
-                    self.screen.blit(lock_overlay, card_rect.topleft)
+                    self.screen.blit(OVERLAYS.get((card_width, card_height), (0, 0, 0, 180)), card_rect.topleft)
                     self.draw_text("Locked", 30, card_rect.centerx, card_rect.centery, RED)
             
             # P2 Join Text
@@ -1135,24 +1352,45 @@ class Game:
             self.inventory_screen.draw()
         
         elif self.game_state in ['platformer', 'boss_fight', 'victory', 'game_over']:
-            for sprite in self.all_sprites: 
-                offset_x = sprite.rect.x - effective_camera_x
-                offset_y = sprite.rect.y - effective_camera_y
+            PROFILER.phase('draw_level')
+            view = pygame.Rect(effective_camera_x - CULL_MARGIN, effective_camera_y - CULL_MARGIN, SCREEN_WIDTH + 2 * CULL_MARGIN, SCREEN_HEIGHT + 2 * CULL_MARGIN)
+            self.level_layer.draw(world, effective_camera_x, effective_camera_y, margin=CULL_MARGIN, scaler=scaler)
+            PROFILER.phase('draw_sprites')
+            visible_sprites = self.all_sprites.visible(view)
+            if self.benchmark:
+                self.benchmark.record_culling(len(visible_sprites), len(self.all_sprites) - len(visible_sprites))
+            indicators = []
+            for sprite in visible_sprites: 
+                shift_x, shift_y = self.interpolate(sprite, alpha)
+                offset_x = sprite.rect.x - effective_camera_x + shift_x
+                offset_y = sprite.rect.y - effective_camera_y + shift_y
                 
                 if isinstance(sprite, Boss) and sprite.dying_state == 'exploding':
-                    explosion_center_x = sprite.rect.centerx - effective_camera_x
-                    explosion_center_y = sprite.rect.centery - effective_camera_y
+                    explosion_center_x = sprite.rect.centerx - effective_camera_x + shift_x
+                    explosion_center_y = sprite.rect.centery - effective_camera_y + shift_y
                     explosion_rect = sprite.image.get_rect(center=(explosion_center_x, explosion_center_y))
-                    self.screen.blit(sprite.image, explosion_rect)
+                    position = explosion_rect.topleft
                 else:
-                    self.screen.blit(sprite.image, (offset_x, offset_y))
+                    position = (offset_x, offset_y)
+                if scaler:
+                    world.blit(scaler.image(sprite.image), (int(position[0] * scaler.scale), int(position[1] * scaler.scale)))
+                else:
+                    world.blit(sprite.image, position)
                 
-                # Draw P1/P2 indicators above players
+                # P1/P2 indicators above players, drawn with the HUD at full resolution
                 if isinstance(sprite, Player) and sprite.health > 0:
-                    indicator_text = f"P{sprite.player_index + 1}"
-                    indicator_color = GREEN if sprite.player_index == 0 else BLUE
-                    self.draw_text(indicator_text, 12, offset_x + sprite.rect.width/2, offset_y - 20, indicator_color)
-
+                    indicators.append((f"P{sprite.player_index + 1}", offset_x + sprite.rect.width/2, offset_y - 20, GREEN if sprite.player_index == 0 else BLUE))
+            if self.bullets:
+                drawn = self.bullets.draw(world, effective_camera_x, effective_camera_y, alpha, view, scaler)
+                if self.benchmark:
+                    self.benchmark.record_bullets(self.bullets.live(), drawn)
+            if scaler:
+                PROFILER.phase('upscale')
+                scaler.present(world, self.screen)
+            for indicator_text, x, y, indicator_color in indicators:
+                self.draw_text(indicator_text, 12, x, y, indicator_color)
+
+            PROFILER.phase('draw_ui')
             if self.game_state in ['platformer', 'boss_fight']:
                 for player in self.players:
                     if player.health > 0:
@@ -1164,7 +1402,7 @@ class Game:
                 self.draw_boss_health_bar()
 
             if self.game_state in ['victory', 'game_over']:
-                overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA); overlay.fill((0, 0, 0, 128)); self.screen.blit(overlay, (0, 0))
+                self.screen.blit(OVERLAYS.get((SCREEN_WIDTH, SCREEN_HEIGHT), (0, 0, 0, 128)), (0, 0))
                 if self.game_state == 'victory':
                     self.draw_text("VICTORY!", 60, SCREEN_WIDTH/2, SCREEN_HEIGHT/2 - 50, GOLD)
                     if self.current_level == self.unlocked_levels and self.unlocked_levels < len(ALL_LEVELS): self.draw_text(f"Level {self.current_level + 1} Unlocked!", 30, SCREEN_WIDTH/2, SCREEN_HEIGHT/2 + 60)
@@ -1173,16 +1411,17 @@ class Game:
                     self.draw_text("GAME OVER", 60, SCREEN_WIDTH/2, SCREEN_HEIGHT/2 - 30, RED); self.draw_text("Press R to Restart Level", 20, SCREEN_WIDTH/2, SCREEN_HEIGHT/2 + 40)
         
         if self.paused:
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 128))
-            self.screen.blit(overlay, (0, 0))
+            self.screen.blit(OVERLAYS.get((SCREEN_WIDTH, SCREEN_HEIGHT), (0, 0, 0, 128)), (0, 0))
             self.draw_text("Paused", 60, SCREEN_WIDTH/2, SCREEN_HEIGHT/4, GOLD)
             self.resume_button.draw(self.screen, pygame.mouse.get_pos())
             self.settings_button_ingame.draw(self.screen, pygame.mouse.get_pos())
             self.main_menu_button.draw(self.screen, pygame.mouse.get_pos())
 
-        self.benchmark.draw(self.screen)
-        pygame.display.flip()
+        PROFILER.phase('overlay')
+        if self.benchmark:
+            self.benchmark.draw(self.screen)
+        PROFILER.phase('flip')
+        MENUS.present(self.screen, dirty_rects)
 
     def draw_ui(self, player):
         idx = player.player_index
@@ -1225,11 +1464,30 @@ class Game:
             self.draw_text(f"Ult: {player.ultimate_meter}/{player.ultimate_max_meter}", 16, x_offset, y_offset + 55, WHITE, align="topleft")
 
     def run(self):
+        # Fixed-timestep loop: the simulation always advances in 1 / SIMULATION_HZ steps,
+        # however many frames are drawn in between; the leftover fraction interpolates the draw.
+        accumulator = 0.0
         while self.running:
+            accumulator += min(self.clock.tick(self.fps_cap), MAX_FRAME_TIME)
+            if self.game_state in self.level_states:
+                self.render_scale.record(self.clock.get_rawtime(), self.draw_ms) # Work and draw time of the last frame, without the cap's wait
+            PROFILER.phase('events')
             self.handle_events()
-            self.update_game_state()
-            self.draw()
-            self.clock.tick(0)
+            self.pump_assets()
+            while self.running and accumulator >= CLOCK.step_ms:
+                self.update_game_state()
+                accumulator -= CLOCK.step_ms
+            if self.running:
+                drawing = time.perf_counter()
+                self.draw(accumulator / CLOCK.step_ms)
+                self.draw_ms = (time.perf_counter() - drawing) * 1000
+                if self.first_frame_ms is None:
+                    self.first_frame_ms = STARTUP.mark('first frame')
+                    print(f"First frame after {self.first_frame_ms:.0f} ms")
+            PROFILER.end_frame()
+            if MENUS.idle and self.preloader.done:
+                MENUS.wait() # Nothing on screen changed: sleep instead of spinning (uncapped) through empty frames
+        self.preloader.shutdown()
         pygame.quit()
 
 if __name__ == "__main__":
@@ -0,0 +1,84 @@
+import pygame
+from settings import MENU_IDLE_WAIT
+
+
+class MenuRenderer:
+    """Dirty-rectangle presentation for the static screens (menus, settings, shop, inventory).
+
+    Game.draw still draws these screens in full, but asks begin() first. A
+    frame whose key (screen, loading progress...) or event count changed is
+    drawn whole and flipped. Otherwise only the widgets that changed since
+    are redrawn: those whose hover state flipped, as recorded by track() for
+    Buttons and level cards, and animations registered with animate() whose
+    frame came up. The draw runs clipped to them and present() pushes just
+    those rects with display.update(). When nothing changed, begin() returns
+    [] and wait() sleeps until the next event or animation frame.
+    """
+    def __init__(self, idle_wait=MENU_IDLE_WAIT):
+        self.idle_wait = idle_wait
+        self.key = None
+        self.widgets = []    # (rect, hovered) of everything on screen that reacts to the mouse
+        self.animations = [] # (rect, period ms, frame shown) of the animated parts on screen
+        self.drawing = False # between begin() and present(); track() and animate() only record then
+        self.idle = False    # the last begin() found nothing to draw
+        self.full_frames = 0
+        self.partial_frames = 0
+        self.idle_frames = 0
+
+    def invalidate(self):
+        """Forces a full redraw next frame (after an event, or once something else was drawn)."""
+        self.key = None
+        self.idle = False
+
+    def begin(self, key, mouse_pos):
+        """None to draw the whole frame, the rects to redraw, or [] if the screen is up to date."""
+        if key != self.key:
+            self.key = key
+            rects = None
+            self.full_frames += 1
+        else:
+            now = pygame.time.get_ticks()
+            rects = [rect for rect, hovered in self.widgets if rect.collidepoint(mouse_pos) != hovered]
+            rects += [rect for rect, period, frame in self.animations if now // period != frame]
+            if rects:
+                self.partial_frames += 1
+            else:
+                self.idle_frames += 1
+        self.idle = rects == []
+        if not self.idle:
+            self.widgets, self.animations = [], [] # The draw registers them again
+            self.drawing = True
+        return rects
+
+    def track(self, rect, hovered):
+        """Registers a widget drawn with its hover look; it is redrawn once the mouse enters or leaves it."""
+        if self.drawing:
+            self.widgets.append((pygame.Rect(rect), hovered))
+
+    def animate(self, rect, period):
+        """Registers a rect showing frame ticks // period of an animation; it is redrawn on the next one."""
+        if self.drawing:
+            self.animations.append((pygame.Rect(rect), period, pygame.time.get_ticks() // period))
+
+    def present(self, screen, rects):
+        """Puts a frame begun with begin() (or drawn without it, rects None) on the display."""
+        if rects:
+            pygame.display.update(rects)
+            screen.set_clip(None)
+        else:
+            pygame.display.flip()
+        self.drawing = False
+
+    def wait(self):
+        """Sleeps until an event arrives, the next animation frame is due or idle_wait passes; the queue keeps its order."""
+        now = pygame.time.get_ticks()
+        timeout = min([self.idle_wait] + [(frame + 1) * period - now for rect, period, frame in self.animations])
+        if timeout > 0:
+            event = pygame.event.wait(timeout)
+            if event.type != pygame.NOEVENT:
+                # Put the woken event back in front of any that arrived with it (a press and its release...)
+                for queued in [event] + pygame.event.get():
+                    pygame.event.post(queued)
+
+
+MENUS = MenuRenderer()
@@ -0,0 +1,753 @@
+import os
+import sys
+import time
+import math
+import random
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+from broadphase import Broadphase, PlatformIndex
+from culling import CullingGroup
+from level_layer import LevelLayer
+from sim_clock import CLOCK
+from level_data import ALL_LEVELS
+
+WORLD_WIDTH = 8800
+WORLD_HEIGHT = 720
+
+
+class Body(pygame.sprite.Sprite):
+    """Rect-only sprite standing in for enemies/projectiles in the micro-benchmarks."""
+    def __init__(self, rng, width, height, speed):
+        super().__init__()
+        self.rect = pygame.Rect(rng.randint(0, WORLD_WIDTH), rng.randint(0, WORLD_HEIGHT), width, height)
+        self.hitbox = self.rect.inflate(-width // 3, -height // 3)
+        self.vx = rng.choice((-1, 1)) * speed
+
+    def step(self):
+        self.rect.x += self.vx
+        if self.rect.left < 0 or self.rect.right > WORLD_WIDTH:
+            self.vx = -self.vx
+        self.hitbox.center = self.rect.center
+
+
+def time_frames(frames, step):
+    start = time.perf_counter()
+    for _ in range(frames):
+        step()
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+def bench_broadphase(frames=200):
+    """Projectile-vs-enemy pass: brute-force spritecollide against the grid broadphase."""
+    print("Broadphase: N enemies vs N projectiles, ms per frame")
+    print(f"{'bodies':>8} {'brute':>10} {'grid':>10} {'speedup':>8}")
+    for count in (10, 100, 1000):
+        rng = random.Random(count)
+        enemies = pygame.sprite.Group(Body(rng, 64, 74, 2) for _ in range(count))
+        projectiles = pygame.sprite.Group(Body(rng, 20, 10, 12) for _ in range(count))
+        broadphase = Broadphase()
+
+        def move():
+            for body in enemies: body.step()
+            for body in projectiles: body.step()
+
+        def brute_hits():
+            hits = 0
+            for proj in projectiles:
+                hits += len(pygame.sprite.spritecollide(proj, enemies, False, lambda proj, enemy: proj.rect.colliderect(enemy.hitbox)))
+            return hits
+
+        def grid_hits():
+            broadphase.sync(enemies)
+            hits = 0
+            for proj in projectiles:
+                hits += len(broadphase.collide(enemies, proj.rect, lambda enemy: proj.rect.colliderect(enemy.hitbox)))
+            return hits
+
+        # Both paths must agree before their timings mean anything
+        for _ in range(20):
+            move()
+            assert brute_hits() == grid_hits(), "broadphase disagrees with brute force"
+        brute = lambda: (move(), brute_hits())
+        grid = lambda: (move(), grid_hits())
+        brute_ms = time_frames(frames, brute)
+        grid_ms = time_frames(frames, grid)
+        print(f"{count:>8} {brute_ms:>10.3f} {grid_ms:>10.3f} {brute_ms / grid_ms:>7.1f}x")
+
+
+class FullScan:
+    """Reference for PlatformIndex: every platform in group order, as the physics loops used to scan."""
+    def __init__(self, platforms):
+        self.platforms = list(platforms)
+
+    def near(self, rect):
+        return self.platforms
+
+
+def scripted_inputs(rng, ticks):
+    """Recorded-style input track: held stick positions and jump presses in runs of 10-60 ticks."""
+    inputs = []
+    while len(inputs) < ticks:
+        move_x = rng.choice((None, 0.0, 0.5, 1.0, 1.0))
+        jump = rng.random() < 0.6
+        for i in range(rng.randint(10, 60)):
+            inputs.append((move_x, jump and i == 0))
+    return inputs[:ticks]
+
+
+def build_level(level_number, copies=1):
+    """Platforms, moving platforms and enemy data for a level, optionally tiled `copies` times to the right."""
+    from sprites import Platform, MovingPlatform
+    level = ALL_LEVELS[level_number]
+    width = level['boss_gate_x'] + 400
+    platforms = pygame.sprite.Group()
+    moving = []
+    enemies = []
+    for copy in range(copies):
+        dx = copy * width
+        for x, y, *rest in level['platforms']:
+            platforms.add(Platform(x + dx, y, *rest))
+        for x, y, *rest in level['moving_platforms']:
+            platform = MovingPlatform(x + dx, y, *rest)
+            platforms.add(platform)
+            moving.append(platform)
+        enemies.extend(dict(data, x=data['x'] + dx) for data in level['enemies'])
+    return platforms, moving, enemies, width * copies
+
+
+def physics_state(body):
+    return (tuple(body.hitbox), tuple(body.rect), body.vy, body.on_ground, getattr(body, 'vx', None))
+
+
+def replay_physics(level_number, ticks=1500, copies=1, seed=1):
+    """Replays the same scripted run through full-scan and indexed physics in lockstep.
+
+    Each player/enemy has a twin that resolves against FullScan; any divergence
+    in hitbox, rect, velocity or ground state raises. Returns the per-tick cost
+    of each side in ms.
+    """
+    from sprites import Player, Enemy
+    platforms, moving, enemy_data, width = build_level(level_number, copies)
+    index, scan = PlatformIndex(platforms), FullScan(platforms)
+    rng = random.Random(seed)
+    players = [(Player(x, 400, None), Player(x, 400, None), scripted_inputs(rng, ticks)) for x in range(100, width, 700)]
+    target = players[0][0]
+    enemies = [(Enemy(player=target, **data), Enemy(player=target, **data)) for data in enemy_data]
+    sink = pygame.sprite.Group()
+    elapsed = {scan: 0.0, index: 0.0}
+
+    for tick in range(ticks):
+        CLOCK.advance()
+        for platform in moving:
+            platform.update()
+        # Alternate which side goes first so neither always runs on warm caches
+        sides = ((0, scan), (1, index)) if tick % 2 else ((1, index), (0, scan))
+        for pair in players:
+            move_x, jump = pair[2][tick]
+            state = random.getstate()
+            for side, source in sides:
+                random.setstate(state)
+                start = time.perf_counter()
+                if jump: pair[side].jump()
+                pair[side].update(move_x, source)
+                elapsed[source] += time.perf_counter() - start
+            if physics_state(pair[0]) != physics_state(pair[1]):
+                raise AssertionError(f"level {level_number} tick {tick}: player diverged {physics_state(pair[0])} != {physics_state(pair[1])}")
+        for pair in enemies:
+            for side, source in sides:
+                start = time.perf_counter()
+                pair[side].update(target, sink, sink, source)
+                elapsed[source] += time.perf_counter() - start
+            if physics_state(pair[0]) != physics_state(pair[1]):
+                raise AssertionError(f"level {level_number} tick {tick}: enemy diverged {physics_state(pair[0])} != {physics_state(pair[1])}")
+        sink.empty()
+    return elapsed[scan] * 1000 / ticks, elapsed[index] * 1000 / ticks, len(platforms)
+
+
+def bench_platforms(ticks=1500):
+    """Player/enemy platform resolution: full scan against PlatformIndex, verified tick-for-tick."""
+    pygame.display.set_mode((1, 1))
+    print("Platform physics: replayed run, full scan vs index, ms per tick (trajectories identical)")
+    print(f"{'level':>8} {'platforms':>10} {'scan':>10} {'index':>10} {'speedup':>8}")
+    cases = [(level, 1) for level in ALL_LEVELS] + [(1, 10)]
+    for level, copies in cases:
+        scan_ms, index_ms, count = replay_physics(level, ticks, copies)
+        label = f"{level}" if copies == 1 else f"{level}x{copies}"
+        print(f"{label:>8} {count:>10} {scan_ms:>10.3f} {index_ms:>10.3f} {scan_ms / index_ms:>7.1f}x")
+
+
+def build_sprites(level_number, copies=1):
+    """all_sprites for a level as init_level fills it, optionally tiled, plus the level width."""
+    from sprites import Coin, Enemy, PowerUpBox, BossGate
+    level = ALL_LEVELS[level_number]
+    platforms, moving, enemy_data, width = build_level(level_number, copies)
+    group = CullingGroup(platforms)
+    for copy in range(copies):
+        dx = copy * width // copies
+        group.add(Coin(x + dx, y) for x, y in level['coins'])
+        group.add(PowerUpBox(x + dx, y, *rest) for x, y, *rest in level.get('power_up_boxes', []))
+        group.add(BossGate(level['boss_gate_x'] + dx, 460))
+    group.add(Enemy(player=None, **data) for data in enemy_data)
+    return group, width
+
+
+def bench_culling(frames=300):
+    """Game.draw sprite pass: blitting every sprite against CullingGroup.visible()."""
+    from settings import SCREEN_WIDTH, SCREEN_HEIGHT, CULL_MARGIN
+    pygame.display.set_mode((1, 1))
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    print("Draw culling: camera sweeping the level, ms per frame")
+    print(f"{'level':>8} {'sprites':>8} {'drawn':>8} {'all':>10} {'culled':>10} {'speedup':>8}")
+    for level, copies in [(level, 1) for level in ALL_LEVELS] + [(1, 10)]:
+        group, width = build_sprites(level, copies)
+        cameras = [(width - SCREEN_WIDTH) * i // frames for i in range(frames)]
+        views = [pygame.Rect(x - CULL_MARGIN, -CULL_MARGIN, SCREEN_WIDTH + 2 * CULL_MARGIN, SCREEN_HEIGHT + 2 * CULL_MARGIN) for x in cameras]
+        for view in views:
+            assert group.visible(view) == [s for s in group if view.colliderect(s.rect)], "culling disagrees with a full scan"
+
+        def draw(sprites, camera_x):
+            for sprite in sprites:
+                screen.blit(sprite.image, (sprite.rect.x - camera_x, sprite.rect.y))
+
+        def sweep(cull):
+            frame = iter(range(frames))
+            def step():
+                i = next(frame)
+                draw(group.visible(views[i]) if cull else group, cameras[i])
+            return time_frames(frames, step)
+
+        all_ms, culled_ms = sweep(False), sweep(True)
+        drawn = sum(len(group.visible(view)) for view in views) // frames
+        label = f"{level}" if copies == 1 else f"{level}x{copies}"
+        print(f"{label:>8} {len(group):>8} {drawn:>8} {all_ms:>10.3f} {culled_ms:>10.3f} {all_ms / culled_ms:>7.1f}x")
+
+
+def bench_level_layer(frames=300):
+    """Static geometry: one blit per Platform Surface against the chunked LevelLayer."""
+    from settings import SCREEN_WIDTH, SCREEN_HEIGHT, CULL_MARGIN
+    pygame.display.set_mode((1, 1))
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    reference = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    print("Level layer: camera sweeping the level, ms per frame")
+    print(f"{'level':>8} {'platforms':>10} {'sprites':>10} {'chunks':>10} {'speedup':>8} {'built':>6}")
+    for level, copies in [(level, 1) for level in ALL_LEVELS] + [(1, 10)]:
+        platforms, moving, _, width = build_level(level, copies)
+        static = [p for p in platforms if p.static]
+        layer = LevelLayer(platforms)
+        cameras = [(width - SCREEN_WIDTH) * i // frames for i in range(frames)]
+
+        def draw_sprites(surface, camera_x):
+            for platform in static:
+                surface.blit(platform.image, (platform.rect.x - camera_x, platform.rect.y))
+
+        # The chunks must put every pixel where the per-platform blits did. Fractional cameras
+        # are left out: blits truncate toward zero, so sprites hanging off the left edge used
+        # to land a pixel right of the rest; the chunks place everything consistently.
+        for camera_x in cameras[::25] + [511, 1023, 1024]:
+            reference.fill((0, 0, 0)); draw_sprites(reference, camera_x)
+            screen.fill((0, 0, 0)); layer.draw(screen, camera_x, 0)
+            assert pygame.image.tobytes(screen, 'RGB') == pygame.image.tobytes(reference, 'RGB'), f"level {level} differs at camera {camera_x}"
+
+        layer = LevelLayer(platforms)
+        frame = iter(range(frames * 2))
+        sprites_ms = time_frames(frames, lambda: draw_sprites(screen, cameras[next(frame) % frames]))
+        frame = iter(range(frames * 2))
+        chunks_ms = time_frames(frames, lambda: layer.draw(screen, cameras[next(frame) % frames], 0, CULL_MARGIN))
+        label = f"{level}" if copies == 1 else f"{level}x{copies}"
+        print(f"{label:>8} {len(static):>10} {sprites_ms:>10.3f} {chunks_ms:>10.3f} {sprites_ms / chunks_ms:>7.1f}x {layer.chunks_built:>6}")
+
+
+class Target(Body):
+    """Body with health, standing in for an Enemy under area damage."""
+    def __init__(self, rng, width, height, speed):
+        super().__init__(rng, width, height, speed)
+        self.health = 100
+
+    def take_damage(self, amount):
+        self.health -= amount
+        if self.health <= 0:
+            self.kill()
+
+
+def full_scan_blast(enemies, x, y, damage, radius=80):
+    """The per-explosion loop update_game_state used to repeat for every blast."""
+    for enemy in enemies:
+        distance = math.sqrt((enemy.rect.centerx - x)**2 + (enemy.rect.centery - y)**2)
+        if distance <= radius:
+            distance_factor = max(0.3, 1.0 - distance/radius)
+            enemy.take_damage(int(damage * distance_factor))
+
+
+def bench_explosions(frames=200, bombs=20):
+    """20 punk bombs (150 damage) landing in the same tick inside a horde."""
+    from area_damage import AreaDamage
+    from sprites import Explosion, EXPLOSION_POOL
+    pygame.display.set_mode((1, 1))
+    print(f"Explosions: {bombs} simultaneous blasts, ms per tick")
+    print(f"{'enemies':>8} {'hit':>6} {'scan+new':>10} {'batched':>10} {'speedup':>8}")
+    for count in (70, 300, 1000):
+        def horde():
+            rng = random.Random(count)
+            group = pygame.sprite.Group(Target(rng, 48, 64, 2) for _ in range(count))
+            blasts = [(t.rect.centerx + rng.randint(-40, 40), t.rect.centery + rng.randint(-40, 40), 150)
+                      for t in rng.sample(list(group), bombs)]
+            return group, blasts
+
+        # Both paths must leave every enemy with the same health
+        reference, blasts = horde()
+        for x, y, damage in blasts:
+            full_scan_blast(reference, x, y, damage)
+        batched, _ = horde()
+        broadphase, area = Broadphase(), AreaDamage()
+        broadphase.sync(batched)
+        for blast in blasts:
+            area.queue(*blast)
+        area.resolve(broadphase, batched)
+        assert [t.health for t in reference] == [t.health for t in batched], "area damage differs from the full scan"
+        hit = sum(1 for t in reference if t.health < 100)
+
+        group, _ = horde()
+        broadphase.sync(group)
+        effects = pygame.sprite.Group()
+        for target in group:
+            target.take_damage = lambda amount: None  # keep the horde intact across frames
+
+        def old_tick():
+            for x, y, damage in blasts:
+                full_scan_blast(group, x, y, damage)
+                effects.add(Explosion(x, y))
+            effects.empty()
+
+        def new_tick():
+            for x, y, damage in blasts:
+                area.queue(x, y, damage)
+                effects.add(EXPLOSION_POOL.acquire(x, y))
+            area.resolve(broadphase, group)
+            effects.empty()
+
+        old_ms, new_ms = time_frames(frames, old_tick), time_frames(frames, new_tick)
+        print(f"{count:>8} {hit:>6} {old_ms:>10.3f} {new_ms:>10.3f} {old_ms / new_ms:>7.1f}x")
+
+
+def bench_pools(ticks=3000, volley=3, lifetime=45):
+    """Sustained spread-shot fire: a new Projectile/BossProjectile per shot against their pools."""
+    import gc
+    from sprites import Projectile, BossProjectile, PROJECTILE_POOL, BOSS_PROJECTILE_POOL
+    from pool import reclaim_all
+    pygame.display.set_mode((1, 1))
+    Projectile.load_images()
+    print(f"Pools: {volley} shots a tick for {ticks} ticks, each living {lifetime} ticks")
+    print(f"{'sprite':>15} {'new ms':>8} {'pool ms':>8} {'speedup':>8} {'gc new':>7} {'gc pool':>8} {'allocated':>10}")
+    for cls, pool in ((Projectile, PROJECTILE_POOL), (BossProjectile, BOSS_PROJECTILE_POOL)):
+        def fire(spawn):
+            all_sprites, shots = pygame.sprite.Group(), pygame.sprite.Group()
+            born = {}
+            collections = sum(stat['collections'] for stat in gc.get_stats())
+            start = time.perf_counter()
+            for tick in range(ticks):
+                reclaim_all()
+                for i in range(volley):
+                    shot = spawn(640, 360, 12, i - 1)
+                    all_sprites.add(shot); shots.add(shot)
+                    born[shot] = tick
+                for shot in shots.sprites():
+                    if tick - born[shot] >= lifetime:
+                        shot.kill()
+            elapsed = (time.perf_counter() - start) * 1000
+            return elapsed, sum(stat['collections'] for stat in gc.get_stats()) - collections
+
+        unpooled = type(cls.__name__, (cls,), {'kill': pygame.sprite.Sprite.kill})  # killed shots are just dropped
+        new_ms, new_gc = fire(unpooled)
+        pool_ms, pool_gc = fire(pool.acquire)
+        print(f"{cls.__name__:>15} {new_ms:>8.1f} {pool_ms:>8.1f} {new_ms / pool_ms:>7.1f}x {new_gc:>7} {pool_gc:>8} {pool.created:>10}")
+
+
+def bench_profiler(ticks=1500):
+    """Overhead of the phase timers: per call, and on whole headless simulation ticks."""
+    from profiler import Profiler, PROFILER
+    from headless import HeadlessGame
+    calls = 200000
+    profiler = Profiler()
+    print("Profiler: ns per call")
+    print(f"{'state':>8} {'phase':>10} {'section':>10}")
+    for enabled in (False, True):
+        profiler.set_enabled(enabled)
+        start = time.perf_counter()
+        for _ in range(calls):
+            profiler.phase('a')
+        phase_ns = (time.perf_counter() - start) * 1e9 / calls
+        start = time.perf_counter()
+        for _ in range(calls):
+            with profiler.section('b'):
+                pass
+        section_ns = (time.perf_counter() - start) * 1e9 / calls
+        profiler.end_frame()
+        print(f"{'on' if enabled else 'off':>8} {phase_ns:>10.0f} {section_ns:>10.0f}")
+
+    game = HeadlessGame()
+    print(f"Headless ticks/s over {ticks} ticks of each level")
+    print(f"{'level':>8} {'off':>10} {'on':>10} {'cost':>8}")
+    for level in ALL_LEVELS:
+        rates = {}
+        for enabled in (False, True, False, True):  # interleaved so warm-up does not favour one side
+            PROFILER.set_enabled(enabled)
+            rates[enabled] = max(rates.get(enabled, 0), game.run_level(level, ticks))
+        PROFILER.set_enabled(False)
+        print(f"{level:>8} {rates[False]:>10.0f} {rates[True]:>10.0f} {rates[False] / rates[True] - 1:>7.1%}")
+
+
+def bench_bullets(ticks=120, counts=(500, 2000, 5000)):
+    """Headless ticks with N live bullets (3/4 player shots, 1/4 enemy shots), sprites against the NumPy engine."""
+    from headless import HeadlessGame
+    from replay import Recording
+    from sprites import PROJECTILE_POOL, ENEMY_PROJECTILE_POOL
+    from bullets import PLAYER_SHOT, ENEMY_SHOT
+    from settings import SCREEN_WIDTH, SCREEN_HEIGHT
+
+    def run(engine, live):
+        game = HeadlessGame(bullet_engine=engine)
+        Recording(1, 1, 0).restart(game)
+        rng = random.Random(1)
+
+        def top_up():
+            # Fresh shots around the camera until `live` are in flight again
+            shots, enemy_shots = len(game.projectiles), len(game.enemy_projectiles)
+            if game.bullets: # Below BULLET_ENGINE_MIN they are still sprites
+                shots += game.bullets.stores[PLAYER_SHOT].count
+                enemy_shots += game.bullets.stores[ENEMY_SHOT].count
+            for _ in range(live * 3 // 4 - shots):
+                shot = PROJECTILE_POOL.acquire(game.camera_x + rng.randrange(SCREEN_WIDTH), rng.randrange(SCREEN_HEIGHT - 200),
+                                               rng.choice((-1, 1)) * rng.randint(4, 12), rng.uniform(-1, 1), player=game.players[0])
+                game.all_sprites.add(shot); game.projectiles.add(shot)
+            for _ in range(live // 4 - enemy_shots):
+                shot = ENEMY_PROJECTILE_POOL.acquire(game.camera_x + rng.randrange(SCREEN_WIDTH), rng.randrange(SCREEN_HEIGHT - 200),
+                                                     rng.uniform(-5, 5), rng.uniform(-5, 5))
+                game.all_sprites.add(shot); game.enemy_projectiles.add(shot)
+
+        start = time.perf_counter()
+        for _ in range(ticks):
+            top_up()
+            game.update_game_state()
+        return (time.perf_counter() - start) * 1000 / ticks, game.fingerprint()
+
+    print(f"Bullets: {ticks} headless ticks of level 1 topped up to N live bullets")
+    print(f"{'bullets':>8} {'sprite ms':>10} {'numpy ms':>9} {'speedup':>8}  same result")
+    for live in counts:
+        sprite_ms, sprite_state = run(False, live)
+        numpy_ms, numpy_state = run(True, live)
+        print(f"{live:>8} {sprite_ms:>10.2f} {numpy_ms:>9.2f} {sprite_ms / numpy_ms:>7.1f}x  {sprite_state == numpy_state}")
+
+
+def bench_horde(ticks=600, copies=(1, 10, 20, 50, 100)):
+    """Enemy.update one sprite at a time against EnemyHorde, on tiled copies of level 1, verified tick-for-tick."""
+    from sprites import Player, Enemy
+    from horde import EnemyHorde
+    from pool import release_all, reclaim_all
+    pygame.display.set_mode((1, 1))
+    print(f"Horde: {ticks} ticks of enemy updates, plain Group vs EnemyHorde, ms per tick (states identical)")
+    print(f"{'copies':>8} {'enemies':>8} {'group':>10} {'horde':>10} {'speedup':>8}")
+    for count in copies:
+        platforms, moving, enemy_data, width = build_level(1, count)
+        index = PlatformIndex(platforms)
+        target = Player(width // 2, 400, None)
+        group, horde = pygame.sprite.Group(), EnemyHorde()
+        for data in enemy_data:
+            group.add(Enemy(player=target, **data))
+            horde.add(Enemy(player=target, **data))
+        sink = pygame.sprite.Group()
+        elapsed = {'group': 0.0, 'horde': 0.0}
+        for tick in range(ticks):
+            CLOCK.advance()
+            reclaim_all()
+            for platform in moving:
+                platform.update()
+            target.rect.centerx = (tick * 37) % width # sweep the target so every enemy gets to shoot
+            for name, enemies in (('group', group), ('horde', horde)):
+                start = time.perf_counter()
+                enemies.update(target, sink, sink, index)
+                elapsed[name] += time.perf_counter() - start
+            for plain, batched in zip(group, horde):
+                if physics_state(plain) != physics_state(batched) or plain.last_shot_time != batched.last_shot_time:
+                    raise AssertionError(f"tick {tick}: enemy diverged {physics_state(plain)} != {physics_state(batched)}")
+            release_all(sink)
+        group_ms, horde_ms = (elapsed[name] * 1000 / ticks for name in ('group', 'horde'))
+        print(f"{count:>8} {len(group):>8} {group_ms:>10.3f} {horde_ms:>10.3f} {group_ms / horde_ms:>7.1f}x")
+
+
+def bench_lod(ticks=900, copies=(1, 4, 16)):
+    """Enemy and coin updates per tick on tiled copies of level 3, every sprite in full against SimulationLOD."""
+    from sprites import Player, Enemy, Coin
+    from horde import EnemyHorde
+    from pool import release_all, reclaim_all
+    from sim_lod import SimulationLOD
+    pygame.display.set_mode((1, 1))
+    level = ALL_LEVELS[3]
+    print(f"LOD: {ticks} ticks of enemy and coin updates, the camera scrolling level 3 tiled, ms per tick")
+    print(f"{'copies':>8} {'enemies':>8} {'coins':>8} {'full':>10} {'lod':>10} {'speedup':>8}")
+    for count in copies:
+        platforms, moving, enemy_data, width = build_level(3, count)
+        index = PlatformIndex(platforms)
+        elapsed = {}
+        for name, enabled in (('full', False), ('lod', True)):
+            lod = SimulationLOD()
+            lod.enabled = enabled
+            target = Player(0, 400, None)
+            enemies, coins = EnemyHorde(), pygame.sprite.Group()
+            enemies.add(Enemy(player=target, **data) for data in enemy_data)
+            for copy in range(count):
+                coins.add(Coin(x + copy * width // count, y) for x, y in level['coins'])
+            sink = pygame.sprite.Group()
+            start_steps = CLOCK.steps
+            elapsed[name] = 0.0
+            for tick in range(ticks):
+                CLOCK.advance()
+                reclaim_all()
+                for platform in moving:
+                    platform.update()
+                target.rect.centerx = 400 + tick * 6 # a player running right, the camera centred on them
+                lod.follow(target.rect.centerx - 640)
+                start = time.perf_counter()
+                enemies.update(target, sink, sink, index, lod)
+                coins.update(lod)
+                elapsed[name] += time.perf_counter() - start
+                release_all(sink)
+            CLOCK.steps = start_steps
+        full_ms, lod_ms = (elapsed[name] * 1000 / ticks for name in ('full', 'lod'))
+        print(f"{count:>8} {len(enemy_data):>8} {len(level['coins']) * count:>8} {full_ms:>10.3f} {lod_ms:>10.3f} {full_ms / lod_ms:>7.1f}x")
+
+
+def bench_streaming(copies=(1, 10, 50)):
+    """Building level 3's entities up front against loading only the chunks near the start, on tiled copies."""
+    from headless import HeadlessGame
+    from streaming import LevelStream, STREAMED, spawn_x
+    from settings import LEVEL_CHUNK_WIDTH
+    game = HeadlessGame()
+    game.init_level(3) # warm the asset cache; the level's groups take the entities below
+    level = ALL_LEVELS[3]
+    width = level['boss_gate_x'] + 400
+    print("Streaming: level 3 tiled, entities built at level start and sprites in the level, up front vs streamed")
+    print(f"{'copies':>8} {'entities':>9} {'upfront ms':>11} {'stream ms':>10} {'upfront':>8} {'stream':>8}")
+    for count in copies:
+        data = {kind: [] for kind in STREAMED}
+        for copy in range(count):
+            dx = copy * width
+            data['coins'].extend((x + dx, y) for x, y in level['coins'])
+            data['enemies'].extend(dict(entry, x=entry['x'] + dx) for entry in level['enemies'])
+            data['power_up_boxes'].extend((x + dx, y, *rest) for x, y, *rest in level.get('power_up_boxes', []))
+        row = []
+        for chunk_width in (None, LEVEL_CHUNK_WIDTH):
+            for kind in STREAMED:
+                getattr(game, kind).empty()
+            game.all_sprites.empty()
+            start = time.perf_counter()
+            LevelStream(data, chunk_width).update(game, 0)
+            row += [(time.perf_counter() - start) * 1000, len(game.all_sprites)]
+        entities = sum(len(entries) for entries in data.values())
+        print(f"{count:>8} {entities:>9} {row[0]:>11.2f} {row[2]:>10.2f} {row[1]:>8} {row[3]:>8}")
+
+
+def bench_atlas(repeats=5):
+    """Every player, gun and bullet frame loaded from its own PNG against read from the packed atlas, cold cache each time."""
+    from asset_cache import ASSETS
+    from atlas import atlas_entries, build_atlas, load_atlas, install_atlas
+    pygame.display.set_mode((1, 1)) # convert_alpha() needs a display
+    entries = atlas_entries()
+
+    def from_files():
+        for path, frame_size, size in entries:
+            if frame_size:
+                ASSETS.get_frames(path, frame_size, size)
+            else:
+                ASSETS.get_image(path, size)
+
+    start = time.perf_counter()
+    index, pages = build_atlas(entries)
+    build_ms = (time.perf_counter() - start) * 1000
+    print(f"Atlas: {len(entries)} images, {sum(len(rects) for *_, rects in index['frames'])} frames in {len(pages)} page(s), built in {build_ms:.1f} ms")
+    print(f"{'source':>8} {'files':>6} {'ms':>8}")
+    for name, load in (('files', from_files), ('atlas', lambda: install_atlas(load_atlas()))):
+        best = None
+        for _ in range(repeats):
+            ASSETS.clear()
+            reads = ASSETS.disk_loads
+            start = time.perf_counter()
+            load()
+            ms = (time.perf_counter() - start) * 1000
+            best = ms if best is None else min(best, ms)
+        files = ASSETS.disk_loads - reads if name == 'files' else len(index['pages'])
+        print(f"{name:>8} {files:>6} {best:>8.2f}")
+    ASSETS.clear()
+
+
+def bench_parallax(frames=300):
+    """The six background layers alpha-blitted as loaded against the flattened planes, per frame at 1280x720."""
+    from parallax import Parallax
+    from settings import SCREEN_WIDTH, SCREEN_HEIGHT
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    parallax = Parallax(SCREEN_WIDTH, SCREEN_HEIGHT)
+    start = time.perf_counter()
+    planes = parallax.flatten()
+    flatten_ms = (time.perf_counter() - start) * 1000
+    print(f"Parallax: {len(parallax.layers)} layers -> {len(planes)} planes, flattened in {flatten_ms:.1f} ms")
+    print(f"{'planes':>10} {'blits':>6} {'ms/frame':>9}")
+    for name, drawn, clear in (('layers', parallax.layers, True), ('flattened', planes, not parallax.opaque)):
+        parallax.planes = drawn
+        frame = [0]
+
+        def step():
+            if clear:
+                screen.fill((0, 0, 0))
+            parallax.update(frame[0] * 7.3)
+            parallax.draw(screen)
+            frame[0] += 1
+        ms = time_frames(frames, step)
+        print(f"{name:>10} {parallax.blits:>6} {ms:>9.3f}")
+
+
+def bench_render_scale(frames=200):
+    """The level world (parallax, chunks, sprites) drawn at each RenderScale and upscaled, per frame at 1280x720."""
+    from parallax import Parallax
+    from render_scale import RenderScale
+    from settings import SCREEN_WIDTH, SCREEN_HEIGHT, CULL_MARGIN
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    parallax = Parallax(SCREEN_WIDTH, SCREEN_HEIGHT)
+    group, width = build_sprites(1, 10)
+    layer = LevelLayer(build_level(1, 10)[0])
+    cameras = [(width - SCREEN_WIDTH) * i // frames for i in range(frames)]
+    render_scale = RenderScale((SCREEN_WIDTH, SCREEN_HEIGHT), scales=(1.0, 0.75, 0.625, 0.5)) # Every candidate, not just RENDER_SCALES
+    render_scale.set_enabled(True)
+    print("Render scale: level 1x10 with the camera sweeping it, ms per frame")
+    print(f"{'scale':>6} {'target':>10} {'world':>8} {'upscale':>8} {'total':>8}")
+    for level, scale in enumerate(render_scale.scales):
+        render_scale.set_level(level)
+        scaler = render_scale if scale < 1 else None
+        world = render_scale.target() if scaler else screen
+        frame = iter(range(frames * 2))
+
+        def draw():
+            camera_x = cameras[next(frame) % frames]
+            view = pygame.Rect(camera_x - CULL_MARGIN, -CULL_MARGIN, SCREEN_WIDTH + 2 * CULL_MARGIN, SCREEN_HEIGHT + 2 * CULL_MARGIN)
+            parallax.update(camera_x)
+            parallax.draw(world, scaler)
+            layer.draw(world, camera_x, 0, CULL_MARGIN, scaler)
+            for sprite in group.visible(view):
+                x, y = sprite.rect.x - camera_x, sprite.rect.y
+                if scaler:
+                    world.blit(scaler.image(sprite.image), (int(x * scale), int(y * scale)))
+                else:
+                    world.blit(sprite.image, (x, y))
+        draw() # Scaled copies are made on first use
+        world_ms = time_frames(frames, draw)
+        upscale_ms = time_frames(frames, lambda: render_scale.present(world, screen)) if scaler else 0.0
+        size = "x".join(map(str, world.get_size()))
+        print(f"{scale:>6.3f} {size:>10} {world_ms:>8.3f} {upscale_ms:>8.3f} {world_ms + upscale_ms:>8.3f}")
+
+
+def bench_overlays(frames=300):
+    """Translucent overlays: a fresh SRCALPHA surface filled per draw against OverlayCache, at 1280x720."""
+    from overlay_cache import OverlayCache
+    from settings import SCREEN_WIDTH, SCREEN_HEIGHT
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    cache = OverlayCache()
+    print("Overlays: ms per frame")
+    print(f"{'overlay':>14} {'count':>6} {'allocated':>10} {'cached':>8} {'speedup':>8}")
+    for name, size, color, count in (('pause', (SCREEN_WIDTH, SCREEN_HEIGHT), (0, 0, 0, 128), 1),
+                                     ('locked cards', (220, 300), (0, 0, 0, 180), 4),
+                                     ('locked guns', (120, 120), (0, 0, 0, 180), 15)):
+        def allocated():
+            for i in range(count):
+                overlay = pygame.Surface(size, pygame.SRCALPHA)
+                overlay.fill(color)
+                screen.blit(overlay, (i * 40, 0))
+
+        def cached():
+            for i in range(count):
+                screen.blit(cache.get(size, color), (i * 40, 0))
+        allocated_ms, cached_ms = time_frames(frames, allocated), time_frames(frames, cached)
+        print(f"{name:>14} {count:>6} {allocated_ms:>10.3f} {cached_ms:>8.3f} {allocated_ms / cached_ms:>7.1f}x")
+    print(f"Cache: {cache.allocations} surfaces allocated for {cache.hits + cache.allocations} overlays, {cache.used_bytes() // 1024} KB")
+
+
+def bench_flash(ticks=600, counts=(100, 1000)):
+    """Enemy.animate for a horde kept flashing: flip and tint per frame (as before) against the prebuilt variants."""
+    from sprites import Enemy
+    from asset_cache import ASSETS
+
+    class CopyingEnemy(Enemy):
+        """Enemy.animate as it was, flipping new frames and tinting a copy on every flash step."""
+        def animate(self):
+            now = CLOCK.get_ticks()
+            current_animation = self.animations[self.action]
+            if now - self.last_frame_update > 120:
+                self.last_frame_update = now
+                self.frame_index = (self.frame_index + 1) % len(current_animation)
+                new_image = current_animation[self.frame_index]
+                if self.direction == -1:
+                    new_image = pygame.transform.flip(new_image, True, False)
+                center = self.rect.center
+                self.image, self.rect = new_image, new_image.get_rect(center=center)
+                self.original_image = self.image
+            if self.flash_timer > 0:
+                self.flash_timer -= 1
+                if (self.flash_timer // 5) % 2 == 0:
+                    flash_image = self.original_image.copy()
+                    flash_image.fill((255, 255, 255), special_flags=pygame.BLEND_ADD)
+                    self.image = flash_image
+
+    pygame.display.set_mode((1, 1))
+    print(f"Hit flashes: {ticks} ticks of Enemy.animate with every enemy hit every 30 ticks, ms per tick")
+    print(f"{'enemies':>8} {'copying':>10} {'variants':>10} {'speedup':>8} {'uncached images':>16}")
+    for count in counts:
+        results = []
+        for cls in (CopyingEnemy, Enemy):
+            enemies = [cls(i * 50, 300, None) for i in range(count)]
+            for i, enemy in enumerate(enemies):
+                enemy.direction = -1 if i % 2 else 1
+            cached = {frame for entry in ASSETS.entries.values() for frame in (entry if isinstance(entry, tuple) else (entry,))}
+            made = 0
+            elapsed = 0.0
+            for tick in range(ticks):
+                CLOCK.advance()
+                if tick % 30 == 0:
+                    for enemy in enemies:
+                        enemy.flash_timer = 30
+                start = time.perf_counter()
+                for enemy in enemies:
+                    enemy.animate()
+                elapsed += time.perf_counter() - start
+                made += sum(enemy.image not in cached for enemy in enemies) # Shown but not from the frame cache
+            results.append((elapsed * 1000 / ticks, made / ticks))
+        (copying_ms, copying_made), (variants_ms, variants_made) = results
+        print(f"{count:>8} {copying_ms:>10.3f} {variants_ms:>10.3f} {copying_ms / variants_ms:>7.1f}x {copying_made:>7.1f} -> {variants_made:<5.1f}")
+
+
+BENCHMARKS = {
+    'broadphase': bench_broadphase,
+    'platforms': bench_platforms,
+    'culling': bench_culling,
+    'level_layer': bench_level_layer,
+    'explosions': bench_explosions,
+    'pools': bench_pools,
+    'bullets': bench_bullets,
+    'horde': bench_horde,
+    'flash': bench_flash,
+    'lod': bench_lod,
+    'streaming': bench_streaming,
+    'atlas': bench_atlas,
+    'parallax': bench_parallax,
+    'render_scale': bench_render_scale,
+    'overlays': bench_overlays,
+    'profiler': bench_profiler,
+}
+
+if __name__ == "__main__":
+    names = sys.argv[1:] or list(BENCHMARKS)
+    pygame.init()
+    for name in names:
+        if name not in BENCHMARKS:
+            print(f"Unknown benchmark '{name}'. Available: {', '.join(BENCHMARKS)}")
+            sys.exit(1)
+        BENCHMARKS[name]()
@@ -0,0 +1,44 @@
+import pygame
+from profiler import PROFILER
+
+
+class OverlayCache:
+    """Filled surfaces for the translucent overlays, shared by size and colour.
+
+    The dimming behind pause and end-of-level text, the locked level cards,
+    characters and guns, and the gacha flash used to allocate and fill an
+    SRCALPHA surface on every draw. get() hands out one cached surface per
+    (size, RGB), in display format, with the alpha of the requested RGBA
+    set as surface alpha: the same uniform colour blended over the screen,
+    and a plain blit instead of a per-pixel one. Since the alpha is set on
+    each call, a fade reuses a single surface; blit it before asking for
+    the same size and colour again. Every new surface is counted in the
+    profiler's 'overlay allocs'.
+    """
+    def __init__(self):
+        self.surfaces = {}  # (size, rgb) -> Surface
+        self.hits = 0
+        self.allocations = 0
+
+    def get(self, size, color):
+        """Surface of size filled with color (RGB or RGBA), ready to blit."""
+        key = ((int(size[0]), int(size[1])), tuple(color[:3]))
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = pygame.Surface(key[0])
+            if pygame.display.get_surface():
+                surface = surface.convert()
+            surface.fill(key[1])
+            self.surfaces[key] = surface
+            self.allocations += 1
+            PROFILER.count('overlay allocs')
+        else:
+            self.hits += 1
+        surface.set_alpha(int(color[3]) if len(color) > 3 else None)
+        return surface
+
+    def used_bytes(self):
+        return sum(surface.get_width() * surface.get_height() * surface.get_bytesize() for surface in self.surfaces.values())
+
+
+OVERLAYS = OverlayCache()
@@ -1,15 +1,40 @@
 import pygame
 
+COLORKEY = (255, 0, 255) # Stands in for the transparent pixels of layers whose alpha is all 0 or 255
+OPAQUE, BINARY, BLENDED = 'opaque', 'binary', 'blended' # How a layer's pixels use alpha
+
+
+def alpha_kind(image):
+    """OPAQUE, BINARY (each pixel fully opaque or fully clear, and none visible in COLORKEY) or BLENDED."""
+    opaque = pygame.mask.from_surface(image, 254).count()
+    if opaque == image.get_width() * image.get_height():
+        return OPAQUE
+    if opaque == pygame.mask.from_surface(image, 0).count() and not pygame.mask.from_threshold(image, (*COLORKEY, 255), (1, 1, 1, 1)).count():
+        return BINARY
+    return BLENDED
+
+
 class Parallax:
-    def __init__(self, screen_width, screen_height):
+    """Background layers scrolling at fractions of the camera speed.
+
+    Layers arrive one by one (from the preloader) and are drawn as they come.
+    Once all are in, flatten() rebuilds what draw() blits as planes: runs of
+    adjacent layers that share a speed are merged into one surface, the back
+    run is composited over the black clear colour into an opaque backdrop
+    (for the static sky, a single blit per frame), fully opaque planes are
+    convert()ed, planes whose alpha is only 0 or 255 become colorkeyed RLE
+    surfaces, and only the rest keep per-pixel alpha. Transparent margins are
+    cropped off, and draw() blits only the tiles that reach the screen.
+    """
+    def __init__(self, screen_width, screen_height, preloader=None):
         self.screen_width = screen_width
         self.screen_height = screen_height
-        
+        self.opaque = False # True once the backdrop covers the whole screen, so it needs no clearing first
+        self.blits = 0 # Blits in the last draw(), for the F3 overlay
+
         self.layers = []
+        paths = []
         for i in range(6):
-            image = pygame.image.load(f'assets/Background/{i}.png').convert_alpha()
-            scaled_image = self.scale_image(image)
-            
             speed = 0
             if i == 5:
                 speed = 0
@@ -18,14 +43,29 @@ class Parallax:
             else:
                 speed = (5 - i) * 0.1
 
-            self.layers.append({
-                'image': scaled_image,
+            layer = {
+                'image': None, # Set by set_image() once loaded; layers without one are skipped
                 'speed': speed,
-                'x': 0
-            })
+                'x': 0,
+                'offset': (0, 0), # Where the (cropped) image sits in its tile
+                'period': 0, # Tile width
+                'alpha': BLENDED, # See alpha_kind()
+                'bounds': None, # Visible part of the image
+            }
+            self.layers.append(layer)
+            paths.append(f'assets/Background/{i}.png')
         
         
         self.layers.reverse()
+        paths.reverse()
+        self.planes = self.layers # Drawn as they load, until flatten() replaces them
+        for path, layer in zip(paths, self.layers):
+            if preloader:
+                # Decode and scale on a worker, convert on the main thread
+                preloader.add('parallax', lambda path=path: self.load_layer(path),
+                              lambda loaded, layer=layer: self.set_image(layer, loaded))
+            else:
+                self.set_image(layer, self.load_layer(path))
 
     def scale_image(self, image):
         image_height = image.get_height()
@@ -33,20 +73,88 @@ class Parallax:
         new_width = image.get_width() * scale
         return pygame.transform.scale(image, (int(new_width), self.screen_height))
 
-    def update(self, camera_x):
-        for layer in self.layers:
-            layer['x'] = -camera_x * layer['speed']
+    def load_layer(self, path):
+        """Decodes and scales one layer, and finds how it uses alpha and where its visible pixels are. Safe off the main thread."""
+        source = pygame.image.load(path)
+        image = self.scale_image(source)
+        return image, alpha_kind(source), image.get_bounding_rect() # Scaling only repeats source pixels
 
-    def draw(self, screen):
-        for layer in self.layers:
-            image = layer['image']
-            image_width = image.get_width()
-            x = layer['x'] % image_width
+    def set_image(self, layer, loaded):
+        image, layer['alpha'], layer['bounds'] = loaded
+        layer['image'] = image.convert_alpha()
+        layer['period'] = image.get_width()
+        if self.planes is self.layers and all(layer['image'] for layer in self.layers):
+            self.planes = self.flatten()
 
-            screen.blit(image, (x, 0))
+    def flatten(self):
+        """Merges and converts the loaded layers into the planes draw() blits, back to front."""
+        runs = []
+        for layer in self.layers:
+            if runs and runs[-1][0]['speed'] == layer['speed']:
+                runs[-1].append(layer)
+            else:
+                runs.append([layer])
+        planes = []
+        for run in runs:
+            kinds = {layer['alpha'] for layer in run}
+            kind = OPAQUE if OPAQUE in kinds else BLENDED if BLENDED in kinds else BINARY
+            bounds = run[0]['bounds'].unionall([layer['bounds'] for layer in run[1:]])
+            image = run[0]['image']
+            if not planes and kind != OPAQUE:
+                # The back run goes over what draw() used to clear the screen to, so nothing behind it shows
+                image = pygame.Surface((max(layer['period'] for layer in run), self.screen_height))
+                image.fill((0, 0, 0))
+                kind, bounds = OPAQUE, image.get_rect()
+            elif len(run) > 1:
+                image = pygame.Surface((max(layer['period'] for layer in run), self.screen_height), pygame.SRCALPHA)
+            if image is not run[0]['image']:
+                for layer in run:
+                    image.blit(layer['image'], (0, 0))
+            image = image.subsurface(bounds)
+            if kind == OPAQUE:
+                image = image.convert()
+            elif kind == BINARY:
+                keyed = pygame.Surface(bounds.size)
+                keyed.fill(COLORKEY)
+                keyed.blit(image, (0, 0))
+                keyed.set_colorkey(COLORKEY, pygame.RLEACCEL)
+                image = keyed.convert()
+            else:
+                image = image.convert_alpha()
+            planes.append({'image': image, 'speed': run[0]['speed'], 'x': run[0]['x'], 'offset': bounds.topleft,
+                           'period': max(layer['period'] for layer in run)})
+        back = planes[0]
+        self.opaque = back['offset'] == (0, 0) and back['image'].get_height() >= self.screen_height
+        return planes
 
-            if x > 0:
-                screen.blit(image, (x - image_width, 0))
+    def update(self, camera_x):
+        for plane in self.planes:
+            plane['x'] = -camera_x * plane['speed']
 
-            if x < self.screen_width:
-                 screen.blit(image, (x + image_width, 0))
+    def draw(self, screen, scaler=None):
+        """Blits the planes; with a RenderScale, its scaled copies at scaled positions into its smaller target."""
+        self.blits = 0
+        scale = scaler.scale if scaler else 1
+        for plane in self.planes:
+            image = plane['image']
+            if image is None:
+                continue
+            period = plane['period']
+            offset_x, offset_y = plane['offset']
+            image_width = image.get_width()
+            # Every tile that reaches the screen. Positions truncate toward zero as blit() would, so the
+            # tile left of x overlaps it by a pixel; it is drawn after x, and its edge column is the one shown.
+            x = plane['x'] % period
+            tiles = [x, x - period]
+            tile_x = x + period
+            while tile_x < self.screen_width:
+                tiles.append(tile_x)
+                tile_x += period
+            for tile_x in tiles:
+                left = int(tile_x) + offset_x
+                if left + image_width > 0 and left < self.screen_width:
+                    if scaler:
+                        screen.blit(scaler.image(image), (int(left * scale), int(offset_y * scale)))
+                    else:
+                        screen.blit(image, (left, offset_y))
+                    self.blits += 1
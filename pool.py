@@ -0,0 +1,71 @@
+POOLS = {}  # label -> SpritePool, for reclaim_all() and the F3 overlay
+
+
+class Pooled:
+    """Mixin for sprites spawned through a SpritePool: kill() hands the sprite back to it."""
+    pool = None
+
+    def kill(self):
+        if self.alive():
+            super().kill()
+            self.pool.release(self)
+
+
+class SpritePool:
+    """Recycles sprites of one class instead of building a new one per spawn.
+
+    The class mixes in Pooled and takes its spawn arguments in both __init__
+    and reset(). acquire() returns a free sprite reset with those arguments,
+    or a new one when none is free. Killed sprites wait in `released` until
+    reclaim(), which Game runs once at the start of every simulation step:
+    a shot killed this step is never handed out again in the same step, so
+    it can't be drawn interpolated from its old position.
+    """
+    def __init__(self, cls, label):
+        self.cls = cls
+        self.label = label
+        self.free = []
+        self.released = []
+        self.created = 0
+        self.in_use = 0
+        self.high_water = 0
+        cls.pool = self
+        POOLS[label] = self
+
+    def preallocate(self, count, *args, **kwargs):
+        """Builds free sprites up front so the first volleys don't allocate."""
+        for _ in range(count - self.created):
+            self.free.append(self.cls(*args, **kwargs))
+            self.created += 1
+
+    def acquire(self, *args, **kwargs):
+        if self.free:
+            sprite = self.free.pop()
+            sprite.reset(*args, **kwargs)
+        else:
+            sprite = self.cls(*args, **kwargs)
+            self.created += 1
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        return sprite
+
+    def release(self, sprite):
+        self.released.append(sprite)
+        self.in_use -= 1
+
+    def reclaim(self):
+        self.free.extend(self.released)
+        self.released.clear()
+
+
+def reclaim_all():
+    for pool in POOLS.values():
+        pool.reclaim()
+
+
+def release_all(group):
+    """Kills the pooled sprites in group, e.g. a level's all_sprites before the level is dropped."""
+    for sprite in group.sprites():
+        if isinstance(sprite, Pooled):
+            sprite.kill()
@@ -0,0 +1,91 @@
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from settings import PRELOAD_WORKERS
+
+
+def timed(load):
+    """Runs load(), returning its result and how long it took in ms."""
+    start = time.perf_counter()
+    return load(), (time.perf_counter() - start) * 1000
+
+
+class Preloader:
+    """Loads assets on worker threads while the main loop keeps drawing.
+
+    add() runs load() on the pool: reading files and decoding them
+    (pygame.image.load, pygame.mixer.Sound, transform.scale) releases the
+    GIL and needs no display. The result goes to finish(), which pump() or
+    wait() calls on the main thread, in the order the jobs were added, for
+    whatever SDL wants done there, such as convert_alpha() against the
+    display surface. Jobs belong to a named group, so a screen can start as
+    soon as its own group is ready(). With no workers every job runs at once
+    in add(), which is plain synchronous loading.
+    """
+    def __init__(self, workers=PRELOAD_WORKERS, started=None):
+        self.pool = ThreadPoolExecutor(workers, thread_name_prefix='preload') if workers else None
+        self.queue = deque()  # (group, future, finish) waiting for finish()
+        self.pending = {}     # group -> jobs not finished yet
+        self.timings = {}     # group -> [ms decoding on workers, ms finishing on the main thread, perf_counter when ready]
+        self.total = 0
+        self.finished = 0
+        self.started = started if started is not None else time.perf_counter()
+        self.finished_ms = None # from `started` until the last job finished, None while any is left
+
+    def add(self, group, load, finish):
+        self.total += 1
+        timing = self.timings.setdefault(group, [0.0, 0.0, None])
+        timing[2] = None
+        if self.pool is None:
+            self.finish(group, timed(load), finish)
+            return
+        self.pending[group] = self.pending.get(group, 0) + 1
+        self.queue.append((group, self.pool.submit(timed, load), finish))
+        self.finished_ms = None
+
+    def finish(self, group, loaded, finish):
+        result, load_ms = loaded
+        start = time.perf_counter()
+        finish(result)
+        now = time.perf_counter()
+        timing = self.timings[group]
+        timing[0] += load_ms
+        timing[1] += (now - start) * 1000
+        self.finished += 1
+        if not self.pending.get(group):
+            timing[2] = now
+        if not self.queue:
+            self.finished_ms = (now - self.started) * 1000
+
+    def finish_next(self):
+        group, future, finish = self.queue.popleft()
+        self.pending[group] -= 1
+        self.finish(group, future.result(), finish)
+
+    def pump(self, budget_ms=4):
+        """Finishes the jobs whose load is done, for up to budget_ms; True once every job is finished."""
+        deadline = time.perf_counter() + budget_ms / 1000
+        while self.queue and self.queue[0][1].done():
+            self.finish_next()
+            if time.perf_counter() > deadline:
+                break
+        return self.done
+
+    def wait(self, group=None):
+        """Blocks until every job of group (None: every job at all) is finished."""
+        while self.queue and (group is None or self.pending.get(group)):
+            self.finish_next()
+
+    def ready(self, group):
+        return not self.pending.get(group)
+
+    @property
+    def done(self):
+        return not self.queue
+
+    def progress(self):
+        return self.finished / self.total if self.total else 1.0
+
+    def shutdown(self):
+        if self.pool:
+            self.pool.shutdown(wait=True, cancel_futures=True) # Only waits for loads already running
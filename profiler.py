@@ -0,0 +1,147 @@
+import json
+import os
+import time
+from collections import deque
+from contextlib import nullcontext
+
+NULL_SECTION = nullcontext()
+
+class Section:
+    __slots__ = ('profiler', 'name')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.profiler.begin(self.name)
+
+    def __exit__(self, *exc):
+        self.profiler.end()
+
+
+class Profiler:
+    """Wall-clock timers for the phases of a frame (enemy AI, collisions, drawing, flip...).
+
+    Top-level phases are marked one after another with phase(); work nested
+    inside a phase is timed with `with PROFILER.section(name):`. Each phase
+    keeps its self time (excluding nested sections) per frame in a ring buffer,
+    so the phases of a frame add up to the time spent in it. Every span is also
+    kept for dump(), which writes Chrome trace-event JSON (chrome://tracing,
+    Perfetto). count() adds to per-frame counters (surface allocations...),
+    kept in ring buffers the same way and traced as counter tracks. With
+    enabled False every call returns immediately.
+    """
+    def __init__(self, history=300, trace_limit=200000):
+        self.enabled = False
+        self.history = history
+        self.phases = {}  # name -> deque of self time (ms) per frame
+        self.totals = {}  # name -> self time (ns) in the frame so far
+        self.last_frame = {}  # name -> self time (ms) in the last finished frame
+        self.stack = []   # open spans: [name, start ns, nested ns]
+        self.events = deque(maxlen=trace_limit)  # (name, start ns, duration ns, depth)
+        self.counters = {}  # name -> deque of counts per frame
+        self.counts = {}    # name -> count in the frame so far
+        self.last_counts = {}  # name -> count in the last finished frame
+        self.count_events = deque(maxlen=trace_limit)  # (name, frame end ns, count)
+        self.frames = 0
+
+    def begin(self, name):
+        self.stack.append([name, time.perf_counter_ns(), 0])
+
+    def end(self):
+        name, start, nested = self.stack.pop()
+        duration = time.perf_counter_ns() - start
+        self.totals[name] = self.totals.get(name, 0) + duration - nested
+        if self.stack:
+            self.stack[-1][2] += duration
+        self.events.append((name, start, duration, len(self.stack)))
+
+    def phase(self, name):
+        """Ends the open phase and starts the next one (None just ends it)."""
+        if not self.enabled:
+            return
+        while self.stack:
+            self.end()
+        if name:
+            self.begin(name)
+
+    def section(self, name):
+        """Context manager timing a span nested in the current phase."""
+        if not self.enabled:
+            return NULL_SECTION
+        return Section(self, name)
+
+    def count(self, name, n=1):
+        """Adds n to this frame's counter name."""
+        if not self.enabled:
+            return
+        self.counts[name] = self.counts.get(name, 0) + n
+
+    def end_frame(self):
+        """Closes the frame: pushes every phase's time into its ring buffer (0 if it did not run)."""
+        if not self.enabled:
+            return
+        self.phase(None)
+        for name in self.totals:
+            if name not in self.phases:
+                self.phases[name] = deque([0.0] * self.frames, maxlen=self.history)
+        self.last_frame = {name: self.totals.get(name, 0) / 1e6 for name in self.phases}
+        for name, ring in self.phases.items():
+            ring.append(self.last_frame[name])
+        self.totals = {}
+        for name in self.counts:
+            if name not in self.counters:
+                self.counters[name] = deque([0] * self.frames, maxlen=self.history)
+        self.last_counts = {name: self.counts.get(name, 0) for name in self.counters}
+        now = time.perf_counter_ns()
+        for name, ring in self.counters.items():
+            ring.append(self.last_counts[name])
+            self.count_events.append((name, now, self.last_counts[name]))
+        self.counts = {}
+        self.frames = min(self.frames + 1, self.history)
+
+    def set_enabled(self, enabled):
+        if not enabled and self.enabled:
+            self.phase(None)
+            self.totals = {}
+            self.counts = {}
+        self.enabled = enabled
+
+    def averages(self):
+        """Mean ms per frame of each phase over the ring buffers, heaviest first."""
+        means = {name: sum(ring) / len(ring) for name, ring in self.phases.items() if ring}
+        return sorted(means.items(), key=lambda item: item[1], reverse=True)
+
+    def count_averages(self):
+        """Mean count per frame of each counter over the ring buffers."""
+        return {name: sum(ring) / len(ring) for name, ring in self.counters.items() if ring}
+
+    def dump(self, path):
+        """Writes the recorded spans as Chrome trace-event JSON; returns how many were written."""
+        events = [{'name': 'thread_name', 'ph': 'M', 'pid': os.getpid(), 'tid': 0, 'args': {'name': 'game loop'}}]
+        events.extend({
+            'name': name,
+            'cat': 'phase' if depth == 0 else 'section',
+            'ph': 'X',
+            'ts': start / 1000,
+            'dur': duration / 1000,
+            'pid': os.getpid(),
+            'tid': 0,
+        } for name, start, duration, depth in self.events)
+        events.extend({
+            'name': name,
+            'ph': 'C',
+            'ts': at / 1000,
+            'pid': os.getpid(),
+            'args': {name: count},
+        } for name, at, count in self.count_events)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+        return len(self.events)
+
+
+PROFILER = Profiler()
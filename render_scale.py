@@ -0,0 +1,120 @@
+import weakref
+from collections import deque
+import pygame
+from settings import RENDER_SCALES, RENDER_SCALE_TARGET_FPS, RENDER_SCALE_WINDOW, RENDER_SCALE_HEADROOM, RENDER_SCALE_SMOOTH
+
+
+class RenderScale:
+    """Dynamic resolution: the level is drawn into a smaller surface when frames run over budget.
+
+    record() takes each frame's work time (without the frame cap's sleep)
+    and the part of it spent in Game.draw, the only part a scale can cut.
+    Drawing gets what the rest of the frame leaves of the budget; when the
+    simulation alone overruns it no scale can help, so the scale holds.
+    Once a full window of frames draws over its share, the scale steps down
+    `scales`; the first window at the new scale measures its gain, the draw
+    time against the window before the step. A scale that did not cut the
+    draw time is left straight away and skipped from then on. The scale
+    steps back up once the draw time the scale above would take, by that
+    gain, fits in headroom * its share, so it does not bounce between two
+    scales. The window restarts on every change, so each scale is judged on
+    its own frames. While the scale is below 1, Game.draw renders the level
+    into target() with image() copies of every sprite scaled to match,
+    present() upscales it onto the screen, and the HUD goes on top at full
+    resolution.
+    """
+    def __init__(self, size, scales=RENDER_SCALES, target_fps=RENDER_SCALE_TARGET_FPS,
+                 window=RENDER_SCALE_WINDOW, headroom=RENDER_SCALE_HEADROOM, smooth=RENDER_SCALE_SMOOTH):
+        self.size = size
+        self.scales = scales
+        self.budget_ms = 1000 / target_fps
+        self.headroom = headroom
+        self.smooth = smooth
+        self.enabled = False
+        self.level = 0 # index into scales
+        self.frame_times = deque(maxlen=window) # (frame ms, draw ms)
+        self.gains = {} # level -> (level stepped down from, draw time there / draw time at this level)
+        self.draw_before = None # mean draw time of the window before a step down, until the gain is measured
+        self.stepped_from = 0 # level of the last step down
+        self.targets = {} # scale -> Surface the level is drawn into
+        self.images = weakref.WeakKeyDictionary() # source Surface -> copy at the current scale
+        self.changes = 0
+
+    @property
+    def scale(self):
+        return self.scales[self.level] if self.enabled else 1.0
+
+    def set_enabled(self, enabled):
+        self.enabled = enabled
+        self.gains = {}
+        self.set_level(0)
+
+    def set_level(self, level):
+        if level != self.level:
+            self.changes += 1
+        self.level = level
+        self.frame_times.clear()
+        self.draw_before = None
+        self.images = weakref.WeakKeyDictionary()
+
+    def record(self, frame_ms, draw_ms):
+        """Adds a frame's work time and draw time; steps the scale when a full window draws over its share or well under it."""
+        if not self.enabled:
+            return
+        self.frame_times.append((frame_ms, draw_ms))
+        if len(self.frame_times) < self.frame_times.maxlen:
+            return
+        frame_mean = sum(frame for frame, _ in self.frame_times) / len(self.frame_times)
+        draw_mean = sum(draw for _, draw in self.frame_times) / len(self.frame_times)
+        draw_budget = self.budget_ms - (frame_mean - draw_mean) # what the simulation and the rest leave for drawing
+        if self.draw_before is not None: # First window since stepping down
+            upper = self.stepped_from
+            self.gains[self.level] = (upper, self.draw_before / max(draw_mean, 0.001))
+            self.draw_before = None
+            if self.gains[self.level][1] <= 1:
+                self.set_level(upper) # No cheaper here; skipped from now on
+                return
+        if draw_mean > draw_budget > 0:
+            self.step_down(draw_mean)
+        elif self.level > 0:
+            upper, gain = self.gains.get(self.level, (self.level - 1, 1.0)) # Unmeasured after set_level()
+            if draw_mean * gain < draw_budget * self.headroom:
+                self.set_level(upper)
+
+    def step_down(self, draw_mean):
+        """Moves to the next lower scale not yet found to draw no faster, if there is one."""
+        for level in range(self.level + 1, len(self.scales)):
+            if self.gains.get(level, (None, 2.0))[1] > 1:
+                self.stepped_from = self.level
+                self.set_level(level)
+                self.draw_before = draw_mean
+                return
+
+    def target(self):
+        """Surface to draw the level into at the current scale."""
+        scale = self.scale
+        surface = self.targets.get(scale)
+        if surface is None:
+            surface = pygame.Surface((round(self.size[0] * scale), round(self.size[1] * scale))).convert()
+            self.targets[scale] = surface
+        return surface
+
+    def image(self, surface):
+        """surface scaled by the current scale, made once per surface and scale."""
+        scaled = self.images.get(surface)
+        if scaled is None:
+            scale = self.scale
+            width, height = surface.get_size()
+            scaled = pygame.transform.scale(surface, (max(1, round(width * scale)), max(1, round(height * scale))))
+            colorkey = surface.get_colorkey()
+            if colorkey:
+                scaled.set_colorkey(colorkey, pygame.RLEACCEL) # scale() keeps the key but not RLE
+            self.images[surface] = scaled
+        return scaled
+
+    def present(self, target, screen):
+        """Upscales target onto the whole screen."""
+        if self.smooth:
+            pygame.transform.smoothscale(target, self.size, screen)
+        else:
+            pygame.transform.scale(target, self.size, screen)
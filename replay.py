@@ -0,0 +1,157 @@
+import gzip
+import json
+import random
+from sim_clock import CLOCK
+
+REPLAY_VERSION = 1
+
+# What a controller returns when nothing is pressed; recordings only store the keys that differ
+NEUTRAL_ACTIONS = {
+    'move_x': 0.5,
+    'shoot': False,
+    'shoot_direction': 'horizontal',
+    'dash': False,
+    'jump': False,
+    'switch_weapon': False,
+    'activate_ultimate': False,
+    'join': False
+}
+
+
+class RecordingController:
+    """Wraps a real controller and appends every action dict it hands out to a track."""
+    def __init__(self, controller, track):
+        self.controller = controller
+        self.track = track
+
+    def get_actions(self):
+        actions = self.controller.get_actions()
+        self.track.append(dict(actions))
+        return actions
+
+
+class ReplayController:
+    """Feeds a recorded track back one action dict per call; neutral input once it runs out."""
+    def __init__(self, track):
+        self.track = track
+        self.position = 0
+
+    @property
+    def finished(self):
+        return self.position >= len(self.track)
+
+    def get_actions(self):
+        if self.finished:
+            return dict(NEUTRAL_ACTIONS)
+        actions = self.track[self.position]
+        self.position += 1
+        return dict(actions)
+
+
+class Recording:
+    """One player session: the per-tick actions of each player plus everything needed to restart it identically.
+
+    The RNG seed and sim-clock step are applied before the level is built, and
+    the characters, guns and upgrades in use are stored with it, so a replay
+    runs exactly the same game as long as the game code itself is unchanged.
+    """
+    def __init__(self, level, seed, start_step=0, loadout=None, tracks=None):
+        self.level = level
+        self.seed = seed
+        self.start_step = start_step
+        self.loadout = loadout or {}
+        self.tracks = tracks or {}  # player index -> [action dict per tick]
+
+    @classmethod
+    def capture_loadout(cls, game):
+        return {
+            'connected_players': list(game.connected_players),
+            'characters': {str(i): game.selected_characters.get(i) for i in game.connected_players},
+            'guns': {str(i): game.equipped_guns.get(i) for i in game.connected_players},
+            'upgrades': dict(game.upgrades),
+        }
+
+    def restart(self, game):
+        """Puts game at the recorded starting point: same seed, clock, loadout and a fresh level."""
+        random.seed(self.seed)
+        CLOCK.steps = self.start_step
+        if self.loadout:
+            game.connected_players = list(self.loadout['connected_players'])
+            game.selected_characters.update({int(i): c for i, c in self.loadout['characters'].items()})
+            game.equipped_guns.update({int(i): g for i, g in self.loadout['guns'].items()})
+            game.upgrades.update(self.loadout['upgrades'])
+        game.init_level(self.level)
+
+    def replay(self, game):
+        """Restarts the recorded level on game with ReplayControllers installed; returns them (P1, P2)."""
+        controllers = [ReplayController(self.tracks[i]) if i in self.tracks else None for i in (0, 1)]
+        game.controller_manager.set_controllers(*controllers)
+        self.restart(game)
+        return controllers
+
+    @property
+    def ticks(self):
+        return max((len(track) for track in self.tracks.values()), default=0)
+
+    def save(self, path):
+        data = {
+            'version': REPLAY_VERSION,
+            'level': self.level,
+            'seed': self.seed,
+            'start_step': self.start_step,
+            'loadout': self.loadout,
+            'tracks': {str(i): encode_track(track) for i, track in self.tracks.items()},
+        }
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, path):
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != REPLAY_VERSION:
+            raise ValueError(f"{path}: unsupported replay version {data.get('version')}")
+        tracks = {int(i): decode_track(track) for i, track in data['tracks'].items()}
+        return cls(data['level'], data['seed'], data['start_step'], data['loadout'], tracks)
+
+
+class Recorder:
+    """Records a session on a live Game by wrapping the controllers ControllerManager assigned."""
+    def __init__(self, game, level, seed=None):
+        self.game = game
+        self.recording = Recording(level, seed if seed is not None else random.randrange(2 ** 32), CLOCK.steps,
+                                   Recording.capture_loadout(game))
+        manager = game.controller_manager
+        self.original = (manager.get_p1_controller(), manager.get_p2_controller())
+        manager.set_controllers(*[
+            RecordingController(controller, self.recording.tracks.setdefault(index, [])) if controller else None
+            for index, controller in enumerate(self.original)
+        ])
+        self.recording.restart(game)
+
+    def stop(self, path=None):
+        """Puts the real controllers back; saves to path if given. Returns the Recording."""
+        self.game.controller_manager.set_controllers(*self.original)
+        if path:
+            self.recording.save(path)
+        return self.recording
+
+
+def encode_track(track):
+    """Run-length encodes a track as [[count, {keys that differ from neutral}], ...]."""
+    runs = []
+    for actions in track:
+        delta = {key: value for key, value in actions.items() if NEUTRAL_ACTIONS.get(key) != value}
+        if runs and runs[-1][1] == delta:
+            runs[-1][0] += 1
+        else:
+            runs.append([1, delta])
+    return runs
+
+
+def decode_track(runs):
+    track = []
+    for count, delta in runs:
+        actions = dict(NEUTRAL_ACTIONS, **delta)
+        track.extend(actions for _ in range(count))
+    return track
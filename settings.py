@@ -145,7 +145,34 @@ BOSS_THEME = "assets/audio/boss.mp3"
 
 # Game Constants
 BOSS_COLLISION_DAMAGE = 10
+EXPLOSION_RADIUS = 80 # pixels from the blast centre to an enemy's centre
+EXPLOSION_MIN_FALLOFF = 0.3 # share of the damage still dealt at the edge of the blast
 PLAYER_INVINCIBILITY_TIME = 1000 # milliseconds
+CULL_MARGIN = 64 # pixels drawn beyond each screen edge before sprites are culled
+BULLET_ENGINE = True # move and hit test bullets as NumPy arrays (bullets.py) when numpy is installed
+BULLET_ENGINE_MIN = 48 # live bullets of one kind before the engine takes them over; fewer step faster as sprites
+ENEMY_HORDE = True # step all enemies together as NumPy arrays (horde.py) when numpy is installed
+SIMULATION_LOD = False # sleep enemies and coins far from the camera (sim_lod.py); within run-to-run noise on the shipped levels
+SIM_FULL_MARGIN = 320 # pixels beyond each screen edge where everything is fully simulated
+SIM_PHYSICS_MARGIN = 1280 # pixels beyond each screen edge where enemies still move and shoot, unanimated
+LEVEL_STREAMING = True # build coins, enemies and power-up boxes chunk by chunk as the camera nears them (streaming.py)
+LEVEL_CHUNK_WIDTH = 1024 # pixels of level per streamed chunk
+LEVEL_STREAM_MARGIN = 1600 # pixels beyond each screen edge where chunks are loaded; past SIM_PHYSICS_MARGIN, so enemies arrive frozen
+PRELOAD_WORKERS = 4 # threads decoding sounds and images in the background at startup (preloader.py)
+TEXTURE_ATLAS = True # draw player, gun and bullet frames from packed, pre-scaled pages cached on disk (atlas.py)
+ATLAS_PAGE_SIZE = 1024 # pixels per side of an atlas page
+SIMULATION_HZ = 60 # fixed simulation steps per second, independent of the frame rate
+MAX_FRAME_TIME = 250 # milliseconds; longer stalls are dropped instead of simulated in a burst
+FPS_CAP = 144 # default frame cap, 0 = uncapped
+FPS_CAP_OPTIONS = [30, 60, 144, 0]
+DYNAMIC_RESOLUTION = False # default for the "Resolution" setting: draw levels at a lower internal scale when frames run slow (render_scale.py)
+RENDER_SCALES = (1.0, 0.5) # internal scales tried in order; 0.75 and 0.625 drew slower than native once upscaled (microbench render_scale)
+RENDER_SCALE_TARGET_FPS = 60 # frame-time budget the scale is adjusted to meet; drawing gets what the simulation leaves of it
+RENDER_SCALE_WINDOW = 30 # frames averaged before each adjustment
+RENDER_SCALE_HEADROOM = 0.8 # scale back up once the draw time predicted at the scale above is below this fraction of its share of the budget
+RENDER_SCALE_SMOOTH = False # upscale with smoothscale (filtered) instead of scale (nearest pixel)
+DIRTY_RECT_MENUS = True # on menu screens, redraw and present only what changed, and sleep while nothing does (menu_renderer.py)
+MENU_IDLE_WAIT = 100 # milliseconds an idle menu sleeps at most between checks
 
 # Boss Assets
 BOSS_IDLE_SPRITE = "assets/orangjahat/Idle.png"
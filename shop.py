@@ -1,6 +1,6 @@
 import pygame
 from ui import Button
-from settings import PIXEL_FONT
+from text_cache import TEXT
 
 # Colors
 WHITE = (255, 255, 255)
@@ -30,7 +30,7 @@ class ShopScreen:
         self.total_coins = total_coins
         self.upgrades = upgrades
         self.shop_items = shop_items
-        self.font = pygame.font.Font(PIXEL_FONT, 40)
+        self.font = TEXT.get_font(40)
         self.item_buttons = []
         self.scroll_y = 0
         self.setup_buttons()
@@ -105,7 +105,7 @@ class ShopScreen:
                     buy_button.text = f"Buy ({price})"
                     buy_button.color = GREEN if can_afford else GRAY
                     buy_button.hover_color = ORANGE if can_afford else GRAY
-                    buy_button.font = pygame.font.Font(PIXEL_FONT, 12) # Set font size for buy button
+                    buy_button.font_size = 12 # Set font size for buy button
                     
                     buy_button.draw(self.screen, mouse_pos)
         
@@ -167,8 +167,7 @@ class ShopScreen:
         return None
 
     def draw_text(self, text, size, x, y, color=WHITE, align="center"):
-        font = pygame.font.Font(PIXEL_FONT, size)
-        text_surface = font.render(text, True, color)
+        text_surface = TEXT.render(text, size, color)
         text_rect = text_surface.get_rect()
         if align == "center":
             text_rect.center = (x, y)
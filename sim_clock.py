@@ -0,0 +1,27 @@
+from settings import SIMULATION_HZ
+
+class SimClock:
+    """Simulated game time, advanced by one fixed step per Game.update_game_state.
+
+    Gameplay timers (cooldowns, animations, buffs, controller repeat) read this
+    instead of pygame.time.get_ticks() / time.time(), so the game runs at the
+    same speed however fast frames are drawn and stops while paused.
+    """
+    def __init__(self, hz=SIMULATION_HZ):
+        self.hz = hz
+        self.step_ms = 1000 / hz
+        self.steps = 0
+
+    def advance(self):
+        self.steps += 1
+
+    def get_ticks(self):
+        """Milliseconds of simulated time, a drop-in for pygame.time.get_ticks()."""
+        return int(self.steps * 1000 // self.hz)
+
+    def time(self):
+        """Seconds of simulated time, a drop-in for time.time() deltas."""
+        return self.steps / self.hz
+
+
+CLOCK = SimClock()
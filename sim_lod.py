@@ -0,0 +1,46 @@
+from settings import SCREEN_WIDTH, SIM_FULL_MARGIN, SIM_PHYSICS_MARGIN
+
+# Simulation tiers, by horizontal distance from the camera view
+FULL = 0     # everything: movement, shooting, animation
+PHYSICS = 1  # movement, landing, shooting and the hit flash countdown, but no animation frame swaps
+FROZEN = 2   # not stepped at all; carries on from the same state when the camera comes back
+
+
+class SimulationLOD:
+    """Picks how much of the simulation each enemy or coin gets this step.
+
+    follow() is called with the camera position before the level's sprites
+    are updated. The FULL band reaches SIM_FULL_MARGIN past each screen
+    edge, beyond the draw cull margin plus screen shake and a step of camera
+    movement, so whatever can be drawn is always simulated in full and no
+    enemy behaves differently while visible. Out there enemies keep their
+    physics and shoot timers up to SIM_PHYSICS_MARGIN, which gives them time
+    to land before they scroll into view, and beyond it they are frozen.
+    The camera only scrolls horizontally, so the bands are x ranges. With
+    enabled False every sprite is FULL.
+    """
+    def __init__(self, full_margin=SIM_FULL_MARGIN, physics_margin=SIM_PHYSICS_MARGIN):
+        self.full_margin = full_margin
+        self.physics_margin = physics_margin
+        self.enabled = True
+        self.follow(0)
+
+    def follow(self, camera_x):
+        self.full_left, self.full_right = camera_x - self.full_margin, camera_x + SCREEN_WIDTH + self.full_margin
+        self.physics_left, self.physics_right = camera_x - self.physics_margin, camera_x + SCREEN_WIDTH + self.physics_margin
+
+    def tier(self, rect):
+        if not self.enabled or (rect.right > self.full_left and rect.left < self.full_right):
+            return FULL
+        if rect.right > self.physics_left and rect.left < self.physics_right:
+            return PHYSICS
+        return FROZEN
+
+    def tiers(self, left, right):
+        """tier() for NumPy arrays of rect lefts and rights."""
+        tiers = ((right <= self.full_left) | (left >= self.full_right)).astype('i1')
+        if not self.enabled:
+            tiers[:] = FULL
+            return tiers
+        tiers += (right <= self.physics_left) | (left >= self.physics_right)
+        return tiers
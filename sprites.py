@@ -2,9 +2,14 @@ import pygame
 import random
 import os
 import math
-import time
 from settings import *
 from level_data import ALL_LEVELS
+from asset_cache import ASSETS
+from atlas import PLAYER_SIZE, PLAYER_SHEET_FRAME, BULLET_SIZE, gun_size
+from sim_clock import CLOCK
+from profiler import PROFILER
+from pool import SpritePool, Pooled
+from sim_lod import FULL, FROZEN
 
 def get_scaled_size(original_size, max_size):
     """
@@ -32,10 +37,7 @@ def get_scaled_size(original_size, max_size):
 class SpriteSheet:
     """Utility for loading and parsing sprite sheets."""
     def __init__(self, filename):
-        try:
-            self.sprite_sheet = pygame.image.load(filename).convert_alpha()
-        except pygame.error as e:
-            raise e
+        self.sprite_sheet = ASSETS.load_image(filename)
 
     def get_image(self, x, y, width, height):
         image = pygame.Surface((width, height), pygame.SRCALPHA)
@@ -93,13 +95,13 @@ class Player(pygame.sprite.Sprite):
 
         self.action = 'idle'
         self.frame_index = 0
-        self.last_frame_update = pygame.time.get_ticks()
+        self.last_frame_update = CLOCK.get_ticks()
         self.idle_timer = 0
         self.is_emoting = False
         self.emote_cooldown = random.randint(5000, 10000)
 
         # Emote & Double Jump Specifics
-        self.idle_timer_start = pygame.time.get_ticks()
+        self.idle_timer_start = CLOCK.get_ticks()
         self.idle_duration_threshold = random.randint(3000, 5000) # 3 to 5 seconds
         self.current_emote_frames = []
         self.current_emote_frame_index = 0
@@ -147,14 +149,9 @@ class Player(pygame.sprite.Sprite):
         gun_info = self.gun_data[gun_id]
         gun_path = gun_info['image_path']
         try:
-            # For non-animated guns, just load a single image
-            self.gun_image = pygame.image.load(gun_path).convert_alpha()
-            original_size = gun_info.get('size', (self.gun_image.get_width(), self.gun_image.get_height()))
-            
-            # Apply a uniform scaling factor
-            scale_factor = 0.6
-            scaled_size = (max(1, int(original_size[0] * scale_factor)), max(1, int(original_size[1] * scale_factor)))
-            self.gun_image = pygame.transform.scale(self.gun_image, scaled_size)
+            # For non-animated guns, just load a single image; the source is only read when GUN_DATA has no size
+            original_size = gun_info.get('size') or ASSETS.load_image(gun_path).get_size()
+            self.gun_image = ASSETS.get_image(gun_path, gun_size(original_size))
         except pygame.error:
             # Fallback if image fails to load
             scale_factor = 0.4
@@ -166,36 +163,36 @@ class Player(pygame.sprite.Sprite):
         # Load bullet image for the gun
         bullet_path = gun_info['bullet_path']
         try:
-            bullet_img = pygame.image.load(bullet_path).convert_alpha()
-            scaled_bullet = pygame.transform.scale(bullet_img, (20, 10))
-            Projectile.animation_frames_right = [scaled_bullet]
-            Projectile.animation_frames_left = [pygame.transform.flip(scaled_bullet, True, False)]
-        except pygame.error:
+            Projectile.animation_frames_right = [ASSETS.get_image(bullet_path, BULLET_SIZE)]
+            Projectile.animation_frames_left = [ASSETS.get_image(bullet_path, BULLET_SIZE, flip=True)]
+        except (pygame.error, FileNotFoundError):
             surf = pygame.Surface((20, 10), pygame.SRCALPHA); surf.fill(YELLOW)
             Projectile.animation_frames_right = [surf]
             Projectile.animation_frames_left = [surf]
 
+        self.prebake_composites()
+
     def apply_buff(self):
         # Cyborg: damage boost after kill (5s)
         if self.buff == 'damage_boost':
             self.damage_boost_active = True
-            self.damage_boost_timer = pygame.time.get_ticks()
+            self.damage_boost_timer = CLOCK.get_ticks()
             self.buff_active = True
-            self.buff_timer = pygame.time.get_ticks()
+            self.buff_timer = CLOCK.get_ticks()
         # Biker: speed boost (5s)
         elif self.buff == 'speed_boost':
             self.speed = 10
             self.buff_active = True
-            self.buff_timer = pygame.time.get_ticks()
+            self.buff_timer = CLOCK.get_ticks()
         # Punk: jump boost (5s)
         elif self.buff == 'jump_boost':
             self.jump_power = -28
             self.buff_active = True
-            self.buff_timer = pygame.time.get_ticks()
+            self.buff_timer = CLOCK.get_ticks()
 
     def update_buff(self):
         # Buff duration: 5 seconds
-        if self.buff_active and pygame.time.get_ticks() - self.buff_timer > 5000:
+        if self.buff_active and CLOCK.get_ticks() - self.buff_timer > 5000:
             if self.buff == 'damage_boost':
                 self.damage_boost_active = False
             elif self.buff == 'speed_boost':
@@ -245,8 +242,9 @@ class Player(pygame.sprite.Sprite):
         self.current_weapon_index = (self.current_weapon_index + 1) % len(self.unlocked_weapons)
 
     def load_animations(self):
-        player_size = (62, 62)
-        hand_size = (62, 62) # Example size
+        # Frame sizes match atlas.py, so these lookups hit the atlas's subsurfaces when it is installed
+        player_size = PLAYER_SIZE
+        hand_size = PLAYER_SIZE
 
         # Load body animations
         self.body_animations = {'idle': [], 'run': [], 'jump': [], 'double_jump': []}
@@ -256,22 +254,13 @@ class Player(pygame.sprite.Sprite):
                 loaded_frames = []
                 if isinstance(sprite_path, list): # Handle list of image paths
                     for path in sprite_path:
-                        try:
-                            img = pygame.image.load(path).convert_alpha()
-                            scaled_img = pygame.transform.scale(img, player_size)
-                            loaded_frames.append(scaled_img)
-                        except (pygame.error, FileNotFoundError):
-                            loaded_frames.append(pygame.Surface(player_size, pygame.SRCALPHA)) # Placeholder
+                        loaded_frames.append(ASSETS.get_image(path, player_size, fallback=lambda: pygame.Surface(player_size, pygame.SRCALPHA))) # Placeholder on failure
                     self.body_animations[anim_type] = loaded_frames
                 else: # Handle single sprite sheet path
-                    try:
-                        sheet = SpriteSheet(sprite_path)
-                        frames = sheet.get_animation_frames(48, 48)
-                        scaled_frames = [pygame.transform.scale(frame, player_size) for frame in frames]
-                        self.body_animations[anim_type] = scaled_frames
-                    except (pygame.error, FileNotFoundError):
+                    def placeholder():
                         placeholder_frame = pygame.Surface(player_size, pygame.SRCALPHA); placeholder_frame.fill(BLUE)
-                        self.body_animations[anim_type] = [placeholder_frame] * 4
+                        return [placeholder_frame] * 4
+                    self.body_animations[anim_type] = ASSETS.get_frames(sprite_path, PLAYER_SHEET_FRAME, player_size, fallback=placeholder)
             else: # Fallback if action sprite path not defined
                 placeholder_frame = pygame.Surface(player_size, pygame.SRCALPHA); placeholder_frame.fill(BLUE)
                 self.body_animations[anim_type] = [placeholder_frame] * 4
@@ -282,21 +271,9 @@ class Player(pygame.sprite.Sprite):
         if 'hand_animations' in self.character_data:
             for anim_type, hand_path_val in self.character_data['hand_animations'].items():
                 loaded_frames = []
-                if isinstance(hand_path_val, list):
-                    for path in hand_path_val:
-                        try:
-                            img = pygame.image.load(path).convert_alpha()
-                            scaled_img = pygame.transform.scale(img, hand_size)
-                            loaded_frames.append(scaled_img)
-                        except (pygame.error, FileNotFoundError):
-                            loaded_frames.append(pygame.Surface(hand_size, pygame.SRCALPHA)) # Placeholder
-                else: # Assume it's a single string path
-                    try:
-                        img = pygame.image.load(hand_path_val).convert_alpha()
-                        scaled_img = pygame.transform.scale(img, hand_size)
-                        loaded_frames.append(scaled_img)
-                    except (pygame.error, FileNotFoundError):
-                        loaded_frames.append(pygame.Surface(hand_size, pygame.SRCALPHA)) # Placeholder
+                hand_paths = hand_path_val if isinstance(hand_path_val, list) else [hand_path_val] # Single string path
+                for path in hand_paths:
+                    loaded_frames.append(ASSETS.get_image(path, hand_size, fallback=lambda: pygame.Surface(hand_size, pygame.SRCALPHA))) # Placeholder on failure
                 
                 # Match length to body anim if possible, else use a list of 1 for single images
                 target_length = len(self.body_animations.get(anim_type, [None])) if anim_type in self.body_animations else 1
@@ -324,9 +301,7 @@ class Player(pygame.sprite.Sprite):
             for emote_path in self.character_data['emotes']:
                 emote_name = os.path.splitext(os.path.basename(emote_path))[0].lower() # Extract name from path
                 try:
-                    img = pygame.image.load(emote_path).convert_alpha()
-                    scaled_img = pygame.transform.scale(img, player_size)
-                    self.emote_animations[emote_name] = [scaled_img] # Use name as key
+                    self.emote_animations[emote_name] = [ASSETS.get_image(emote_path, player_size)] # Use name as key
                     print(f"  Loaded emote: {emote_name}")
                 except (pygame.error, FileNotFoundError):
                     print(f"  Failed to load emote: {emote_path}")
@@ -335,7 +310,7 @@ class Player(pygame.sprite.Sprite):
             print(f"No emotes loaded for {self.character_id}.")
 
     def animate(self):
-        now = pygame.time.get_ticks()
+        now = CLOCK.get_ticks()
         
         body_frame = None
         hand_frame = None
@@ -343,6 +318,7 @@ class Player(pygame.sprite.Sprite):
         if self.is_emoting:
             # Emote animation
             current_emote_animation = self.current_emote_frames # Use the already selected frames
+            emote_name = self.action
             
             if now - self.emote_start_time > self.emote_animation_speed:
                 self.emote_start_time = now
@@ -354,65 +330,73 @@ class Player(pygame.sprite.Sprite):
                     self.current_emote_frame_index = 0 # Reset for next emote
                 
             body_frame = current_emote_animation[self.current_emote_frame_index]
-            # No hand or gun when emoting, so hand_frame remains None
+            body_key = ('emote', emote_name, self.current_emote_frame_index)
+            hand_key = None # No hand or gun when emoting
             
         else: # Regular animation logic
             if self.action == 'double_jump' and self.frame_index >= len(self.body_animations['double_jump']) - 1:
                 self.set_action('jump')
             
-            current_body_animation = self.body_animations.get(self.action)
-            if not current_body_animation:
-                current_body_animation = self.body_animations['idle'] # Fallback
+            body_action = self.action if self.body_animations.get(self.action) else 'idle' # Fallback
+            current_body_animation = self.body_animations[body_action]
             
             if now - self.last_frame_update > 100:
                 self.last_frame_update = now
                 self.frame_index = (self.frame_index + 1) % len(current_body_animation)
             
             body_frame = current_body_animation[self.frame_index]
-            hand_frames_list = self.hand_animations.get(self.action, self.hand_animations['idle'])
-            hand_frame = hand_frames_list[self.frame_index % len(hand_frames_list)]
-        
+            body_key = (body_action, self.frame_index)
+            hand_action = self.action if self.action in self.hand_animations else 'idle'
+            hand_frames_list = self.hand_animations[hand_action]
+            hand_index = self.frame_index % len(hand_frames_list)
+            hand_frame = hand_frames_list[hand_index]
+            hand_key = (hand_action, hand_index)
+
+        # Only draw hand and gun if not emoting AND not jumping
+        draw_gun = not self.is_emoting and self.action not in ('jump', 'double_jump')
+        key = ('player_composite', self.character_id, body_key, hand_key, self.facing_right, self.equipped_gun_id if draw_gun else None)
+        self.image = ASSETS.get(key, lambda: self.build_composite(body_frame, hand_frame, self.facing_right, draw_gun))
+        self.rect = self.image.get_rect(center=self.rect.center)
+
+    def build_composite(self, body_frame, hand_frame, facing_right, draw_gun):
+        """Layers body, gun and hand into one 60x60 frame; cached by animate()."""
         # Handle flipping and composite image creation
-        if not self.facing_right:
+        if not facing_right:
             body_frame = pygame.transform.flip(body_frame, True, False)
             if hand_frame:
                 hand_frame = pygame.transform.flip(hand_frame, True, False)
         
-        # Create a new composite image
         composite_image = pygame.Surface((60, 60), pygame.SRCALPHA)
-        
-        # Blit body frame
         composite_image.blit(body_frame, (0, 0))
 
-        if not self.is_emoting and self.action not in ('jump', 'double_jump'): # Only draw hand and gun if not emoting AND not jumping
-            # Position hand relative to body
-            current_hand_offset_x = 20
-            current_hand_offset_y = 30
-            
-            # Adjust offsets for jump/double_jump
-            if self.action in ('jump', 'double_jump'):
-                current_hand_offset_x = 10 # Example adjustment
-                current_hand_offset_y = 15 # Example adjustment
-
-            # Position gun relative to hand
-            gun_offset_x = 0
-            gun_offset_y = 0
-
-            # Blit gun and hand
+        if draw_gun:
+            # Position hand relative to body, gun sits in the hand
+            hand_offset = (20, 30)
             if self.gun_image:
-                flipped_gun_image = pygame.transform.flip(self.gun_image, True, False) if not self.facing_right else self.gun_image
-                composite_image.blit(flipped_gun_image, (current_hand_offset_x + gun_offset_x, current_hand_offset_y + gun_offset_y))
+                gun_image = self.gun_image if facing_right else pygame.transform.flip(self.gun_image, True, False)
+                composite_image.blit(gun_image, hand_offset)
             if hand_frame:
-                composite_image.blit(hand_frame, (current_hand_offset_x, current_hand_offset_y))
-
-        self.image = composite_image
-        self.rect = self.image.get_rect(center=self.rect.center)
+                composite_image.blit(hand_frame, hand_offset)
+        return composite_image
+
+    def prebake_composites(self):
+        """Builds the cached composites for every regular action frame with the equipped gun."""
+        for action, body_frames in self.body_animations.items():
+            hand_frames_list = self.hand_animations.get(action, self.hand_animations['idle'])
+            hand_action = action if action in self.hand_animations else 'idle'
+            draw_gun = action not in ('jump', 'double_jump')
+            for frame_index, body_frame in enumerate(body_frames):
+                hand_index = frame_index % len(hand_frames_list)
+                hand_frame = hand_frames_list[hand_index]
+                for facing_right in (True, False):
+                    key = ('player_composite', self.character_id, (action, frame_index), (hand_action, hand_index), facing_right, self.equipped_gun_id if draw_gun else None)
+                    ASSETS.get(key, lambda: self.build_composite(body_frame, hand_frame, facing_right, draw_gun))
 
     def set_action(self, new_action):
         if self.action != new_action:
             self.action = new_action
             self.frame_index = 0
-            self.last_frame_update = pygame.time.get_ticks() # Reset timer on action change
+            self.last_frame_update = CLOCK.get_ticks() # Reset timer on action change
             if self.action.startswith('emote'):
                 self.is_emoting = True
                 self.current_emote_frame_index = 0 # Reset emote frame index when starting a new emote
@@ -421,7 +405,7 @@ class Player(pygame.sprite.Sprite):
 
     def update(self, move_input, platforms):
         sfx_events = []
-        now = pygame.time.get_ticks()
+        now = CLOCK.get_ticks()
 
         # Emote logic
         if self.action == 'idle' and not self.is_emoting and self.on_ground and (move_input is None or (move_input >= 0.4 and move_input <= 0.6)): # Only trigger emotes when truly idle
@@ -441,7 +425,7 @@ class Player(pygame.sprite.Sprite):
         elif self.is_emoting and (
             (move_input is not None and (move_input < 0.4 or move_input > 0.6)) # Movement
             or self.vy < 0 # Jumping
-            or (hasattr(self.game, 'shooting') and self.game.shooting and pygame.time.get_ticks() - self.last_shot < self.shoot_cooldown) # Shooting
+            or (hasattr(self.game, 'shooting') and self.game.shooting and CLOCK.get_ticks() - self.last_shot < self.shoot_cooldown) # Shooting
         ):
             self.is_emoting = False
             self.set_action('idle') # Return to idle animation
@@ -464,14 +448,14 @@ class Player(pygame.sprite.Sprite):
             self.vx = 0
             if move_input is not None:
                 if self.dashing:
-                    if pygame.time.get_ticks() - self.dash_timer > self.dash_duration: self.dashing = False
+                    if CLOCK.get_ticks() - self.dash_timer > self.dash_duration: self.dashing = False
                     self.vx = self.dash_speed * (1 if self.facing_right else -1)
                 else:
                     if move_input < 0.4: self.vx = -self.speed; self.facing_right = False
                     elif move_input > 0.6: self.vx = self.speed; self.facing_right = True
         
         self.hitbox.x += self.vx
-        for platform in platforms:
+        for platform in platforms.near(self.hitbox):
             if platform.rect.colliderect(self.hitbox):
                 if self.vx > 0: self.hitbox.right = platform.rect.left
                 elif self.vx < 0: self.hitbox.left = platform.rect.right
@@ -487,7 +471,7 @@ class Player(pygame.sprite.Sprite):
         
         # Track the moving platform the player is standing on
         self.standing_on_moving = None
-        for platform in platforms:
+        for platform in platforms.near(self.hitbox):
             if platform.rect.colliderect(self.hitbox):
                 if self.vy > 0:
                     self.hitbox.bottom = platform.rect.top
@@ -515,7 +499,8 @@ class Player(pygame.sprite.Sprite):
         # Re-center X after potential moving platform adjustments
         self.rect.centerx = self.hitbox.centerx + (self.hitbox_offset_x if self.facing_right else -self.hitbox_offset_x)
 
-        self.animate()
+        with PROFILER.section('player_animate'):
+            self.animate()
 
         if self.on_ground and not self.was_on_ground:
             sfx_events.append('landing')
@@ -523,7 +508,7 @@ class Player(pygame.sprite.Sprite):
         self.was_on_ground = self.on_ground
         
         # Power-up timer
-        if self.damage_boost_active and pygame.time.get_ticks() - self.damage_boost_timer > self.power_up_duration:
+        if self.damage_boost_active and CLOCK.get_ticks() - self.damage_boost_timer > self.power_up_duration:
             self.damage_boost_active = False
             
         return sfx_events
@@ -547,16 +532,16 @@ class Player(pygame.sprite.Sprite):
 
     def dash(self):
         if self.is_emoting: return
-        current_time = pygame.time.get_ticks()
+        current_time = CLOCK.get_ticks()
         if not self.dashing and current_time - self.last_dash > self.dash_cooldown and not self.is_emoting:
             self.dashing = True; self.dash_timer = current_time; self.last_dash = current_time
 
     def shoot(self, shoot_direction='horizontal'):
         if self.is_emoting: return None, None
-        current_time = pygame.time.get_ticks()
+        current_time = CLOCK.get_ticks()
         if current_time - self.last_shot > self.shoot_cooldown and not self.is_emoting:
             self.last_shot = current_time
-            projectiles = pygame.sprite.Group()
+            projectiles = []
             sfx_name = 'default_shot' # Default sound
             
             damage = self.shot_damage * 2 if self.damage_boost_active else self.shot_damage
@@ -567,8 +552,8 @@ class Player(pygame.sprite.Sprite):
             if current_weapon == 'burst_shot':
                 sfx_name = 'burst_shot'
                 for i in range(3):
-                    proj = Projectile(self.rect.centerx + (i * 15 * direction), self.rect.centery, 12 * direction, 0, damage=damage)
-                    projectiles.add(proj)
+                    proj = PROJECTILE_POOL.acquire(self.rect.centerx + (i * 15 * direction), self.rect.centery, 12 * direction, 0, damage=damage)
+                    projectiles.append(proj)
                 return projectiles, sfx_name
 
             if current_weapon == 'spread_shot':
@@ -582,7 +567,7 @@ class Player(pygame.sprite.Sprite):
                     
                     vx = 12 * math.cos(rad_angle)
                     vy = 12 * math.sin(rad_angle)
-                    projectiles.add(Projectile(self.rect.centerx, self.rect.centery, vx, vy, damage=damage, player=self))
+                    projectiles.append(PROJECTILE_POOL.acquire(self.rect.centerx, self.rect.centery, vx, vy, damage=damage, player=self))
                 return projectiles, sfx_name
 
             # Default shot
@@ -590,23 +575,23 @@ class Player(pygame.sprite.Sprite):
             sqrt2_half = 0.7071 # Approximation of sin(45) and cos(45)
 
             if shoot_direction == 'up':
-                projectiles.add(Projectile(self.rect.centerx, self.rect.centery, 0, -speed, damage=damage, player=self))
+                projectiles.append(PROJECTILE_POOL.acquire(self.rect.centerx, self.rect.centery, 0, -speed, damage=damage, player=self))
             elif shoot_direction == 'down':
-                projectiles.add(Projectile(self.rect.centerx, self.rect.centery, 0, speed, damage=damage, player=self))
+                projectiles.append(PROJECTILE_POOL.acquire(self.rect.centerx, self.rect.centery, 0, speed, damage=damage, player=self))
             elif shoot_direction == 'up_right':
-                projectiles.add(Projectile(self.rect.centerx, self.rect.centery, speed * sqrt2_half, -speed * sqrt2_half, damage=damage, player=self))
+                projectiles.append(PROJECTILE_POOL.acquire(self.rect.centerx, self.rect.centery, speed * sqrt2_half, -speed * sqrt2_half, damage=damage, player=self))
             elif shoot_direction == 'up_left':
-                projectiles.add(Projectile(self.rect.centerx, self.rect.centery, -speed * sqrt2_half, -speed * sqrt2_half, damage=damage, player=self))
+                projectiles.append(PROJECTILE_POOL.acquire(self.rect.centerx, self.rect.centery, -speed * sqrt2_half, -speed * sqrt2_half, damage=damage, player=self))
             elif shoot_direction == 'down_right':
-                projectiles.add(Projectile(self.rect.centerx, self.rect.centery, speed * sqrt2_half, speed * sqrt2_half, damage=damage, player=self))
+                projectiles.append(PROJECTILE_POOL.acquire(self.rect.centerx, self.rect.centery, speed * sqrt2_half, speed * sqrt2_half, damage=damage, player=self))
             elif shoot_direction == 'down_left':
-                projectiles.add(Projectile(self.rect.centerx, self.rect.centery, -speed * sqrt2_half, speed * sqrt2_half, damage=damage, player=self))
+                projectiles.append(PROJECTILE_POOL.acquire(self.rect.centerx, self.rect.centery, -speed * sqrt2_half, speed * sqrt2_half, damage=damage, player=self))
             elif shoot_direction == 'left':
-                 projectiles.add(Projectile(self.rect.centerx, self.rect.centery, -speed, 0, damage=damage, player=self))
+                 projectiles.append(PROJECTILE_POOL.acquire(self.rect.centerx, self.rect.centery, -speed, 0, damage=damage, player=self))
             elif shoot_direction == 'right':
-                 projectiles.add(Projectile(self.rect.centerx, self.rect.centery, speed, 0, damage=damage, player=self))
+                 projectiles.append(PROJECTILE_POOL.acquire(self.rect.centerx, self.rect.centery, speed, 0, damage=damage, player=self))
             else: # horizontal
-                projectiles.add(Projectile(self.rect.centerx, self.rect.centery, speed * direction, 0, damage=damage, player=self))
+                projectiles.append(PROJECTILE_POOL.acquire(self.rect.centerx, self.rect.centery, speed * direction, 0, damage=damage, player=self))
             
             return projectiles, sfx_name
         return None, None
@@ -618,7 +603,7 @@ class Player(pygame.sprite.Sprite):
     def activate_power_up(self, power_up_type):
         if power_up_type == 'damage_boost':
             self.damage_boost_active = True
-            self.damage_boost_timer = pygame.time.get_ticks()
+            self.damage_boost_timer = CLOCK.get_ticks()
         elif power_up_type == 'health':
             self.health += 25
             if self.health > self.max_health:
@@ -644,7 +629,7 @@ class Player(pygame.sprite.Sprite):
             
             if self.character_id == 'cyborg':
                 # Giant Laser
-                proj = Projectile(self.rect.centerx, self.rect.centery, 20 * direction, 0, damage=100, player=self)
+                proj = PROJECTILE_POOL.acquire(self.rect.centerx, self.rect.centery, 20 * direction, 0, damage=100, player=self)
                 proj.image = pygame.transform.scale(proj.image, (80, 40))
                 proj.rect = proj.image.get_rect(center=proj.rect.center)
                 # Cyborg ultimate SFX
@@ -654,15 +639,15 @@ class Player(pygame.sprite.Sprite):
                 
             elif self.character_id == 'biker':
                 # Spread Burst (Shotgun blast)
-                projectiles = pygame.sprite.Group()
+                projectiles = []
                 for angle in range(-20, 21, 10):
                     rad = math.radians(angle)
                     if direction == -1: rad = math.pi - rad # Adjust for left facing
 
                     vx = 18 * math.cos(rad)
                     vy = 18 * math.sin(rad)
-                    p = Projectile(self.rect.centerx, self.rect.centery, vx, vy, damage=25, player=self)
-                    projectiles.add(p)
+                    p = PROJECTILE_POOL.acquire(self.rect.centerx, self.rect.centery, vx, vy, damage=25, player=self)
+                    projectiles.append(p)
                 # Biker ultimate SFX
                 if hasattr(self.game, '_play_sfx'):
                     self.game._play_sfx('biker_ultimate')
@@ -673,7 +658,7 @@ class Player(pygame.sprite.Sprite):
                 # Initial velocity with slight upward component for arc trajectory
                 initial_vx = 6 * direction  # Slower horizontal movement
                 initial_vy = -4  # Slight upward throw to create a low arc
-                proj = Projectile(self.rect.centerx, self.rect.centery, initial_vx, initial_vy, damage=150, player=self, is_explosive=True, has_gravity=True)
+                proj = PROJECTILE_POOL.acquire(self.rect.centerx, self.rect.centery, initial_vx, initial_vy, damage=150, player=self, is_explosive=True, has_gravity=True)
                 size = 60
                 proj.image = pygame.Surface((size, size), pygame.SRCALPHA)
                 pygame.draw.circle(proj.image, ORANGE, (size//2, size//2), size//2)
@@ -685,22 +670,27 @@ class Player(pygame.sprite.Sprite):
                 return proj
 
             # Fallback
-            proj = Projectile(self.rect.centerx, self.rect.centery, 15 * direction, 0, damage=50, player=self)
+            proj = PROJECTILE_POOL.acquire(self.rect.centerx, self.rect.centery, 15 * direction, 0, damage=50, player=self)
             if hasattr(self.game, '_play_sfx'):
                 self.game._play_sfx('generic_ultimate')
             return proj
         return None
 
 
+ENEMY_ACTIONS = ['walk', 'idle', 'attack1', 'attack2', 'attack3', 'attack4', 'death', 'hurt', 'special']
+
 class Enemy(pygame.sprite.Sprite):
     """Enemy that patrols and shoots, with flashing effect only when taking damage."""
+    horde = None # EnemyHorde stepping this enemy, if any; told when a hit starts the flash
+    flash_tint = (255, 255, 255) # Added to the frame while flashing
+
     def __init__(self, x, y, player, patrol_distance=100, speed=2, shoot_cooldown=2.0):
         super().__init__()
         self.player = player
         self.load_animations()
         self.action = 'walk'
         self.frame_index = 0
-        self.last_frame_update = pygame.time.get_ticks()
+        self.last_frame_update = CLOCK.get_ticks()
         self.image = self.animations[self.action][self.frame_index]
         self.rect = self.image.get_rect(center=(x, y))
         # Create a smaller hitbox for more precise hit detection while maintaining platform stance
@@ -708,35 +698,50 @@ class Enemy(pygame.sprite.Sprite):
         self.hitbox.center = self.rect.center
         self.health, self.speed, self.direction = 30, speed, 1
         self.start_x, self.patrol_distance = x, patrol_distance
-        self.shoot_cooldown, self.last_shot_time = shoot_cooldown, time.time()
+        self.shoot_cooldown, self.last_shot_time = shoot_cooldown, CLOCK.time()
         self.detection_range = 400
         # Flashing effect for damage
         self.flash_timer = 0
         self.original_image = self.image
+        self.flash_image = self.variants[self.action, False, True][self.frame_index]
         self.vy = 0
         self.gravity = 0.8
         self.on_ground = False
 
-    def load_animations(self):
-        self.animations = {}
+    @staticmethod
+    def image_paths():
+        return [f"assets/orangjahat/{anim_type.capitalize()}.png" for anim_type in ENEMY_ACTIONS]
+
+    @staticmethod
+    def decode_images():
+        """Reads the enemy sheets from disk; safe on a worker thread, frame_variants() then builds the frames."""
+        for path in Enemy.image_paths():
+            ASSETS.decode(path)
+
+    @staticmethod
+    def frame_variants():
+        """(action, facing left, flashing) -> frames for every animation, built once and shared through ASSETS."""
         enemy_size = (106, 106) # Increased size by 10 pixels
         
-        animation_types = ['walk', 'idle', 'attack1', 'attack2', 'attack3', 'attack4', 'death', 'hurt', 'special']
-        
-        for anim_type in animation_types:
-            path = f"assets/orangjahat/{anim_type.capitalize()}.png"
-            try:
-                sheet = SpriteSheet(path)
-                frames = sheet.get_animation_frames(96, 96)
-                self.animations[anim_type] = [pygame.transform.scale(frame, enemy_size) for frame in frames]
-            except Exception as e:
-                # If a specific animation is missing, create a placeholder
-                placeholder_surface = pygame.Surface(enemy_size, pygame.SRCALPHA)
-                placeholder_surface.fill((255, 0, 255, 128)) # Pink placeholder
-                self.animations[anim_type] = [placeholder_surface] * 6
+        def placeholder():
+            # If a specific animation is missing, create a placeholder
+            placeholder_surface = pygame.Surface(enemy_size, pygame.SRCALPHA)
+            placeholder_surface.fill((255, 0, 255, 128)) # Pink placeholder
+            return [placeholder_surface] * 6
+
+        variants = {}
+        for anim_type, path in zip(ENEMY_ACTIONS, Enemy.image_paths()):
+            for flip in (False, True):
+                variants[anim_type, flip, False] = ASSETS.get_frames(path, (96, 96), enemy_size, flip=flip, fallback=placeholder)
+                variants[anim_type, flip, True] = ASSETS.get_frames(path, (96, 96), enemy_size, flip=flip, fallback=placeholder, tint=Enemy.flash_tint)
+        return variants
+
+    def load_animations(self):
+        self.variants = self.frame_variants()
+        self.animations = {action: frames for (action, flip, flash), frames in self.variants.items() if not flip and not flash}
 
     def animate(self):
-        now = pygame.time.get_ticks()
+        now = CLOCK.get_ticks()
         
         # Ensure self.action is valid, otherwise default to 'idle'
         if self.action not in self.animations:
@@ -747,23 +752,31 @@ class Enemy(pygame.sprite.Sprite):
         if now - self.last_frame_update > 120:
             self.last_frame_update = now
             self.frame_index = (self.frame_index + 1) % len(current_animation)
-            new_image = current_animation[self.frame_index]
-            if self.direction == -1:
-                new_image = pygame.transform.flip(new_image, True, False)
+            facing_left = self.direction == -1
+            new_image = self.variants[self.action, facing_left, False][self.frame_index]
             center = self.rect.center
             self.image, self.rect = new_image, new_image.get_rect(center=center)
             self.original_image = self.image
+            self.flash_image = self.variants[self.action, facing_left, True][self.frame_index]
         
         # Apply flashing effect if taking damage
         if self.flash_timer > 0:
             self.flash_timer -= 1
             # Flash every 100ms (alternating visible/invisible)
             if (self.flash_timer // 5) % 2 == 0:
-                flash_image = self.original_image.copy()
-                flash_image.fill((255, 255, 255), special_flags=pygame.BLEND_ADD)
-                self.image = flash_image
+                self.image = self.flash_image
+
+    def fade_flash(self):
+        """The flash countdown of animate() for steps without animation, so an unseen hit still wears off."""
+        self.flash_timer -= 1
+        if self.flash_timer <= 0:
+            self.image = self.original_image
+
+    def update(self, player, all_sprites_group, enemy_projectiles_group, platforms, lod=None):
+        tier = lod.tier(self.rect) if lod else FULL
+        if tier == FROZEN:
+            return
 
-    def update(self, player, all_sprites_group, enemy_projectiles_group, platforms):
         # State logic
         if self.speed > 0:
             self.action = 'walk'
@@ -782,7 +795,7 @@ class Enemy(pygame.sprite.Sprite):
         self.on_ground = False
 
         # Vertical collision with platforms
-        for platform in platforms:
+        for platform in platforms.near(self.hitbox):
             if platform.rect.colliderect(self.hitbox) and self.vy > 0:
                 self.hitbox.bottom = platform.rect.top
                 self.vy = 0
@@ -791,12 +804,15 @@ class Enemy(pygame.sprite.Sprite):
         self.rect.bottom = self.hitbox.bottom
         self.rect.centerx = self.hitbox.centerx
 
-        self.animate()
+        if tier == FULL:
+            self.animate()
+        elif self.flash_timer > 0:
+            self.fade_flash()
         
         # Shooting logic
-        if abs(player.rect.centerx - self.rect.centerx) < self.detection_range and time.time() - self.last_shot_time > self.shoot_cooldown:
+        if abs(player.rect.centerx - self.rect.centerx) < self.detection_range and CLOCK.time() - self.last_shot_time > self.shoot_cooldown:
             self.shoot_at_player(player, all_sprites_group, enemy_projectiles_group)
-            self.last_shot_time = time.time()
+            self.last_shot_time = CLOCK.time()
 
     def shoot_at_player(self, player, all_sprites, projectiles_group):
         dx = player.rect.centerx - self.rect.centerx
@@ -805,64 +821,96 @@ class Enemy(pygame.sprite.Sprite):
         distance = math.hypot(dx, dy)
         if distance == 0: return
         vx, vy = (dx / distance) * 6, (dy / distance) * 6
-        proj = EnemyProjectile(self.rect.centerx, self.rect.centery, vx, vy)
+        proj = ENEMY_PROJECTILE_POOL.acquire(self.rect.centerx, self.rect.centery, vx, vy)
         all_sprites.add(proj); projectiles_group.add(proj)
 
     def take_damage(self, amount):
         self.health -= amount
         # Trigger flash effect for 300ms
         self.flash_timer = 30
+        if self.horde:
+            self.horde.flashing.add(self)
         if self.health <= 0:
             self.kill()
             self.player.increase_ultimate_meter()
 
-class EnemyProjectile(pygame.sprite.Sprite):
+# Shots leaving these bounds are dropped; the boss arena is a single screen
+PROJECTILE_BOUNDS = pygame.Rect(-100, -100, 10000, SCREEN_HEIGHT + 200)
+BOSS_PROJECTILE_BOUNDS = pygame.Rect(-50, -50, SCREEN_WIDTH + 100, SCREEN_HEIGHT + 100)
+
+class EnemyProjectile(Pooled, pygame.sprite.Sprite):
+    shared_image = None # Drawn once, every shot blits the same Surface
+
     def __init__(self, x, y, vx, vy):
         super().__init__()
-        self.image = pygame.Surface((12, 12), pygame.SRCALPHA); self.image.fill(RED)
-        pygame.draw.circle(self.image, RED, (6, 6), 6)
+        if EnemyProjectile.shared_image is None:
+            EnemyProjectile.shared_image = pygame.Surface((12, 12), pygame.SRCALPHA); EnemyProjectile.shared_image.fill(RED)
+            pygame.draw.circle(EnemyProjectile.shared_image, RED, (6, 6), 6)
+        self.image = EnemyProjectile.shared_image
+        self.reset(x, y, vx, vy)
+
+    def reset(self, x, y, vx, vy):
         self.rect = self.image.get_rect(center=(x, y))
         self.vx, self.vy, self.lifetime = vx, vy, 180
 
     def update(self, platforms):
         self.rect.move_ip(self.vx, self.vy); self.lifetime -= 1
-        if self.lifetime <= 0 or not self.rect.colliderect(pygame.Rect(-100,-100,10000,SCREEN_HEIGHT+200)): self.kill()
+        if self.lifetime <= 0 or not self.rect.colliderect(PROJECTILE_BOUNDS): self.kill()
         if pygame.sprite.spritecollide(self, platforms, False):
             self.kill()
 
-class BossProjectile(pygame.sprite.Sprite):
+class BossProjectile(Pooled, pygame.sprite.Sprite):
+    shared_image = None # Drawn once, every shot blits the same Surface
+
     def __init__(self, x, y, vx, vy):
-        super().__init__(); self.image = pygame.Surface((16, 16), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, PINK, (8, 8), 8); pygame.draw.circle(self.image, PURPLE, (8, 8), 5)
+        super().__init__()
+        if BossProjectile.shared_image is None:
+            BossProjectile.shared_image = pygame.Surface((16, 16), pygame.SRCALPHA)
+            pygame.draw.circle(BossProjectile.shared_image, PINK, (8, 8), 8); pygame.draw.circle(BossProjectile.shared_image, PURPLE, (8, 8), 5)
+        self.image = BossProjectile.shared_image
+        self.reset(x, y, vx, vy)
+
+    def reset(self, x, y, vx, vy):
         self.rect = self.image.get_rect(center=(x, y)); self.vx, self.vy = vx, vy
 
     def update(self, platforms):
         self.rect.move_ip(self.vx, self.vy)
-        if not self.rect.colliderect(pygame.Rect(-50,-50,SCREEN_WIDTH+100,SCREEN_HEIGHT+100)): self.kill()
+        if not self.rect.colliderect(BOSS_PROJECTILE_BOUNDS): self.kill()
         if pygame.sprite.spritecollide(self, platforms, False):
             self.kill()
 
-class Projectile(pygame.sprite.Sprite):
+class Projectile(Pooled, pygame.sprite.Sprite):
     animation_frames_right, animation_frames_left = [], []
+    @staticmethod
+    def image_paths():
+        return [os.path.join("assets", "Guns", "Pistols", "5 Bullets", f"7_{i}.png") for i in "12"]
+
+    @staticmethod
+    def decode_images():
+        """Reads the shot images from disk; safe on a worker thread, load_images() then converts them."""
+        for path in Projectile.image_paths():
+            ASSETS.decode(path)
+
     @staticmethod
     def load_images():
         if Projectile.animation_frames_right: return
-        bullet_size, sprite_paths = (20, 10), [os.path.join("assets", "Guns", "Pistols", "5 Bullets", f"7_{i}.png") for i in "12"]
+        bullet_size, sprite_paths = (20, 10), Projectile.image_paths()
         try:
             for path in sprite_paths:
-                img = pygame.image.load(path).convert_alpha()
-                scaled = pygame.transform.scale(img, bullet_size)
-                Projectile.animation_frames_right.append(scaled)
-                Projectile.animation_frames_left.append(pygame.transform.flip(scaled, True, False))
-        except pygame.error:
+                Projectile.animation_frames_right.append(ASSETS.get_image(path, bullet_size))
+                Projectile.animation_frames_left.append(ASSETS.get_image(path, bullet_size, flip=True))
+        except (pygame.error, FileNotFoundError):
             surf = pygame.Surface(bullet_size, pygame.SRCALPHA); surf.fill(YELLOW)
             Projectile.animation_frames_right = [surf]*2; Projectile.animation_frames_left = [surf]*2
 
     def __init__(self, x, y, vx, vy, damage=10, player=None, is_explosive=False, has_gravity=False):
         super().__init__()
+        self.reset(x, y, vx, vy, damage, player, is_explosive, has_gravity)
+
+    def reset(self, x, y, vx, vy, damage=10, player=None, is_explosive=False, has_gravity=False):
         direction = 1 if vx >= 0 else -1
         self.anim_frames = Projectile.animation_frames_right if direction == 1 else Projectile.animation_frames_left
-        self.frame_index, self.last_frame_update = 0, pygame.time.get_ticks()
+        self.frame_index, self.last_frame_update = 0, CLOCK.get_ticks()
         self.image = self.anim_frames[self.frame_index]; self.rect = self.image.get_rect(center=(x, y))
         self.vx, self.vy = vx, vy
         self.damage = damage
@@ -872,8 +920,8 @@ class Projectile(pygame.sprite.Sprite):
         self.gravity = 0.5 if has_gravity else 0  # Gravity acceleration
 
     def update(self):
-        if pygame.time.get_ticks() - self.last_frame_update > 100:
-            self.last_frame_update = pygame.time.get_ticks()
+        if CLOCK.get_ticks() - self.last_frame_update > 100:
+            self.last_frame_update = CLOCK.get_ticks()
             self.frame_index = (self.frame_index + 1) % len(self.anim_frames); self.image = self.anim_frames[self.frame_index]
 
         # Apply gravity if this projectile has it
@@ -881,38 +929,36 @@ class Projectile(pygame.sprite.Sprite):
             self.vy += self.gravity
 
         self.rect.move_ip(self.vx, self.vy)
-        if not self.rect.colliderect(pygame.Rect(-100,-100,10000,SCREEN_HEIGHT+200)): self.kill()
+        if not self.rect.colliderect(PROJECTILE_BOUNDS): self.kill()
 
-class Explosion(pygame.sprite.Sprite):
-    """Explosion effect for explosive projectiles like the punk's ultimate"""
+class Explosion(Pooled, pygame.sprite.Sprite):
+    """Explosion effect for explosive projectiles like the punk's ultimate; spawned through EXPLOSION_POOL"""
     def __init__(self, x, y):
         super().__init__()
-        import math
         from settings import BOSS_EXPLOSION_SPRITE_PATH, ORANGE
-        self.explosion_frames = []
         explosion_size = (128, 128)  # Same size as boss explosion
 
-        # Load explosion animation
-        try:
-            sheet = SpriteSheet(BOSS_EXPLOSION_SPRITE_PATH)
-            frames = sheet.get_animation_frames(64, 52)  # Use same frame dimensions as boss
-            self.explosion_frames = [pygame.transform.scale(frame, explosion_size) for frame in frames]
-        except (pygame.error, FileNotFoundError):
+        def placeholder():
             # Fallback to colored surface
             placeholder_frame = pygame.Surface(explosion_size, pygame.SRCALPHA)
             pygame.draw.circle(placeholder_frame, ORANGE, (64, 64), 64)
             pygame.draw.circle(placeholder_frame, (255, 100, 0), (64, 64), 50)  # Inner orange
-            self.explosion_frames = [placeholder_frame] * 8
+            return [placeholder_frame] * 8
+
+        # Load explosion animation (same frame dimensions as boss)
+        self.explosion_frames = ASSETS.get_frames(BOSS_EXPLOSION_SPRITE_PATH, (64, 52), explosion_size, fallback=placeholder)
+        self.animation_speed = 30  # ms per frame (fast for explosion)
+        self.reset(x, y)
 
+    def reset(self, x, y):
         self.frame_index = 0
         self.image = self.explosion_frames[0]
         self.rect = self.image.get_rect(center=(x, y))
-        self.animation_speed = 30  # ms per frame (fast for explosion)
-        self.last_frame_update = pygame.time.get_ticks()
+        self.last_frame_update = CLOCK.get_ticks()
 
     def update(self):
         # Animate explosion
-        now = pygame.time.get_ticks()
+        now = CLOCK.get_ticks()
         if now - self.last_frame_update > self.animation_speed:
             self.last_frame_update = now
             self.frame_index += 1
@@ -923,14 +969,41 @@ class Explosion(pygame.sprite.Sprite):
             else:
                 self.image = self.explosion_frames[self.frame_index]
 
+PROJECTILE_POOL = SpritePool(Projectile, 'proj')
+ENEMY_PROJECTILE_POOL = SpritePool(EnemyProjectile, 'enemy')
+BOSS_PROJECTILE_POOL = SpritePool(BossProjectile, 'boss')
+EXPLOSION_POOL = SpritePool(Explosion, 'fx')
+
 class Platform(pygame.sprite.Sprite):
+    static = True # Never moves horizontally; lets CullingGroup bucket it once
+
     def __init__(self, x, y, width, height):
         super().__init__()
-        self.image = pygame.Surface((width, height)); self.image.fill(BROWN)
-        pygame.draw.rect(self.image, DARK_BROWN, (0, 0, width, height), 3)
-        self.rect = self.image.get_rect(topleft=(x, y))
+        self.rect = pygame.Rect(x, y, width, height)
+        self._image = None
+
+    @property
+    def image(self):
+        # Built on first use: static platforms are drawn through the LevelLayer chunks instead
+        if self._image is None:
+            self._image = pygame.Surface(self.rect.size)
+            self.paint(self._image, -self.rect.x, -self.rect.y)
+        return self._image
+
+    def paint(self, surface, offset_x, offset_y):
+        # Paints the platform onto surface (its own image or a LevelLayer chunk) at the given offset.
+        # Everything goes through clipped fills: fill() does not clip negative coordinates and
+        # draw.rect() would put a border wherever a chunk edge cuts the platform.
+        rect = self.rect.move(offset_x, offset_y)
+        bounds = surface.get_rect()
+        surface.fill(BROWN, rect.clip(bounds))
+        for edge in ((rect.left, rect.top, rect.width, 3), (rect.left, rect.bottom - 3, rect.width, 3),
+                     (rect.left, rect.top, 3, rect.height), (rect.right - 3, rect.top, 3, rect.height)):
+            surface.fill(DARK_BROWN, pygame.Rect(edge).clip(bounds))
 
 class MovingPlatform(Platform):
+    static = False
+
     def __init__(self, x, y, width, height, move_axis='x', move_range=100, speed=2):
         super().__init__(x, y, width, height)
         self.start_pos = pygame.math.Vector2(x, y)
@@ -943,30 +1016,30 @@ class MovingPlatform(Platform):
             self.direction *= -1
 
 class Coin(pygame.sprite.Sprite):
+    static = True # Only bobs vertically
+
     def __init__(self, x, y):
         super().__init__()
         self.animations = {}
         self.load_animations()
         self.frame_index = 0
-        self.last_frame_update = pygame.time.get_ticks()
+        self.last_frame_update = CLOCK.get_ticks()
 
         self.image = self.animations['idle'][self.frame_index] # Set initial image
         self.rect = self.image.get_rect(center=(x, y))
         self.bob_offset, self.bob_range, self.original_y = random.uniform(0, 2*math.pi), 6, y  # Increased bob range for more visible movement
 
     def load_animations(self):
-        self.animations['idle'] = []
         coin_size = (32, 32) # Increased size for better visibility
-        try:
-            sheet = SpriteSheet(COIN_SPRITE_PATH)
-            frames = sheet.get_animation_frames(16, 16) # Use provided frame dimensions
-            self.animations['idle'] = [pygame.transform.scale(frame, coin_size) for frame in frames]
-        except (pygame.error, FileNotFoundError):
+        def placeholder():
             placeholder_frame = pygame.Surface(coin_size, pygame.SRCALPHA); placeholder_frame.fill(GOLD)
-            self.animations['idle'] = [placeholder_frame] * 15 # Use number of frames provided
+            return [placeholder_frame] * 15 # Use number of frames provided
+        self.animations['idle'] = ASSETS.get_frames(COIN_SPRITE_PATH, (16, 16), coin_size, fallback=placeholder) # Use provided frame dimensions
 
-    def update(self):
-        now = pygame.time.get_ticks()
+    def update(self, lod=None):
+        if lod and lod.tier(self.rect) != FULL:
+            return # Purely cosmetic, so off-screen coins just wait
+        now = CLOCK.get_ticks()
         # Animate faster for more visible effect (80ms instead of 100ms)
         if now - self.last_frame_update > 80:
             self.last_frame_update = now
@@ -978,42 +1051,45 @@ class Coin(pygame.sprite.Sprite):
         self.bob_offset += 0.15  # Increased speed for more visible bobbing
 
 class BossGate(pygame.sprite.Sprite):
+    static = True
+
     def __init__(self, x, y):
         super().__init__()
         self.animations = {}
         self.load_animations()
         self.frame_index = 0
-        self.last_frame_update = pygame.time.get_ticks()
+        self.last_frame_update = CLOCK.get_ticks()
         self.image = self.animations['idle'][self.frame_index]
         self.rect = self.image.get_rect(center=(x, y))
 
     def load_animations(self):
-        self.animations['idle'] = []
         portal_size = (128, 128) # Scaled up size for better visibility
-        try:
-            for i in range(1, 8): # Load portal1_frame_1.png to portal1_frame_7.png
-                path = os.path.join(PORTAL_IMAGES_DIR, f"portal1_frame_{i}.png")
-                img = pygame.image.load(path).convert_alpha()
-                self.animations['idle'].append(pygame.transform.scale(img, portal_size))
-        except (pygame.error, FileNotFoundError):
-            placeholder_frame = pygame.Surface(portal_size, pygame.SRCALPHA)
-            placeholder_frame.fill(PURPLE)
-            self.animations['idle'] = [placeholder_frame] * 7
+        def build():
+            try:
+                # Load portal1_frame_1.png to portal1_frame_7.png
+                return tuple(ASSETS.get_image(os.path.join(PORTAL_IMAGES_DIR, f"portal1_frame_{i}.png"), portal_size) for i in range(1, 8))
+            except (pygame.error, FileNotFoundError):
+                placeholder_frame = pygame.Surface(portal_size, pygame.SRCALPHA)
+                placeholder_frame.fill(PURPLE)
+                return (placeholder_frame,) * 7
+        self.animations['idle'] = ASSETS.get(('portal', portal_size), build)
 
     def update(self):
-        now = pygame.time.get_ticks()
+        now = CLOCK.get_ticks()
         if now - self.last_frame_update > 100: # Animation speed
             self.last_frame_update = now
             self.frame_index = (self.frame_index + 1) % len(self.animations['idle'])
             self.image = self.animations['idle'][self.frame_index]
 
 class PowerUpBox(pygame.sprite.Sprite):
+    static = True # Only bobs vertically
+
     def __init__(self, x, y, power_up_type='damage_boost', health=50):
         super().__init__()
         self.animations = {}
         self.load_animations()
         self.frame_index = 0
-        self.last_frame_update = pygame.time.get_ticks()
+        self.last_frame_update = CLOCK.get_ticks()
 
         self.image = self.animations['idle'][self.frame_index]
         self.rect = self.image.get_rect(center=(x, y))
@@ -1024,15 +1100,11 @@ class PowerUpBox(pygame.sprite.Sprite):
         self.original_y = y
 
     def load_animations(self):
-        self.animations['idle'] = []
         crate_size = (80, 80)
-        try:
-            sheet = SpriteSheet(CRATE_SPRITE_PATH)
-            frames = sheet.get_animation_frames(48, 48)
-            self.animations['idle'] = [pygame.transform.scale(frame, crate_size) for frame in frames]
-        except (pygame.error, FileNotFoundError):
+        def placeholder():
             placeholder_frame = pygame.Surface(crate_size, pygame.SRCALPHA); placeholder_frame.fill(GRAY)
-            self.animations['idle'] = [placeholder_frame] * 6
+            return [placeholder_frame] * 6
+        self.animations['idle'] = ASSETS.get_frames(CRATE_SPRITE_PATH, (48, 48), crate_size, fallback=placeholder)
 
     def take_damage(self, amount):
         self.health -= amount
@@ -1042,7 +1114,7 @@ class PowerUpBox(pygame.sprite.Sprite):
         return None
 
     def update(self):
-        now = pygame.time.get_ticks()
+        now = CLOCK.get_ticks()
         if now - self.last_frame_update > 100:
             self.last_frame_update = now
             self.frame_index = (self.frame_index + 1) % len(self.animations['idle'])
@@ -1055,31 +1127,35 @@ class PowerUp(pygame.sprite.Sprite):
         super().__init__()
         self.power_up_type = power_up_type
         
-        power_up_size = (32, 32)
-        if self.power_up_type == 'damage_boost':
-            try:
-                self.image = pygame.image.load(DAMAGE_POWERUP_PATH).convert_alpha()
-            except (pygame.error, FileNotFoundError):
-                self.image = pygame.Surface(power_up_size, pygame.SRCALPHA); self.image.fill(ORANGE)
-        elif self.power_up_type == 'health':
-            try:
-                self.image = pygame.image.load(HEALTH_POWERUP_PATH).convert_alpha()
-            except (pygame.error, FileNotFoundError):
-                self.image = pygame.Surface(power_up_size, pygame.SRCALPHA); self.image.fill(GREEN)
-        else: # Default or unknown power-up
-            self.image = pygame.Surface(power_up_size, pygame.SRCALPHA); self.image.fill(WHITE)
-
-        self.image = pygame.transform.scale(self.image, power_up_size)
+        self.image = ASSETS.get(('power_up', power_up_type), lambda: PowerUp.build_image(power_up_type))
         self.rect = self.image.get_rect(center=(x, y))
 
-        pygame.draw.rect(self.image, BLACK, self.image.get_rect(), 2) # Border
-
         # Add bobbing attributes
         self.bob_offset = random.uniform(0, 2 * math.pi)
         self.bob_range = 8  # More pronounced bob
         self.original_y = y  # Store original Y for bobbing
         self.bob_speed = 0.1 # Speed of bobbing
 
+    @staticmethod
+    def build_image(power_up_type):
+        power_up_size = (32, 32)
+        if power_up_type == 'damage_boost':
+            try:
+                image = ASSETS.load_image(DAMAGE_POWERUP_PATH)
+            except (pygame.error, FileNotFoundError):
+                image = pygame.Surface(power_up_size, pygame.SRCALPHA); image.fill(ORANGE)
+        elif power_up_type == 'health':
+            try:
+                image = ASSETS.load_image(HEALTH_POWERUP_PATH)
+            except (pygame.error, FileNotFoundError):
+                image = pygame.Surface(power_up_size, pygame.SRCALPHA); image.fill(GREEN)
+        else: # Default or unknown power-up
+            image = pygame.Surface(power_up_size, pygame.SRCALPHA); image.fill(WHITE)
+
+        image = pygame.transform.scale(image, power_up_size) # Always a fresh copy, safe to draw on
+        pygame.draw.rect(image, BLACK, image.get_rect(), 2) # Border
+        return image
+
     def update(self):
         # Implement bobbing effect
         self.bob_offset += self.bob_speed
@@ -1096,19 +1172,20 @@ class Boss(pygame.sprite.Sprite):
         self.shoot_interval = shoot_interval  # Now assumed to be in milliseconds
         self.phases = phases
         self.current_phase = 1
-        self.last_shot_time = pygame.time.get_ticks() # Use pygame.time.get_ticks() for consistency with shoot_interval
+        self.last_shot_time = CLOCK.get_ticks() # Use CLOCK.get_ticks() for consistency with shoot_interval
         self.pattern_counter = 0  # Used for cycling through patterns
 
         # Flashing effect for damage
         self.is_flashing = False
         self.flash_timer = 0
         self.flash_duration = 100 # milliseconds
+        self.flash_tint = (100, 100, 100, 0) # Added to the frame while flashing (brighter)
 
         self.animations = {} # Initialize animations dictionary
         self.load_animations() # Load animations
         self.action = 'idle'
         self.frame_index = 0
-        self.last_frame_update = pygame.time.get_ticks()
+        self.last_frame_update = CLOCK.get_ticks()
 
         self.dying_state = None # 'falling', 'exploding', None
         self.vy = 0 # Vertical velocity for falling
@@ -1117,56 +1194,42 @@ class Boss(pygame.sprite.Sprite):
 
         self.image = self.animations[self.action][self.frame_index] # Set initial image
         self.rect = self.image.get_rect(center=(x, y))
-        self.original_image = self.image.copy() # Store original for flashing
+        self.original_image = self.image # Shown again once the flash ends
+        self.flash_image = self.variants[self.action, False, True][self.frame_index]
 
         self.direction = 1 # For simple horizontal movement
 
     def load_animations(self):
-        self.animations = {'idle': [], 'walk': [], 'death': []}
+        """Every animation facing right and left, plain and flash-tinted, shared through ASSETS."""
+        self.animations = {}
+        self.variants = {} # (action, facing left, flashing) -> frames
         boss_size = (96, 96) # Adjust size to exact frame dimensions
 
-        # Load Idle animation
-        try:
-            sheet = SpriteSheet(BOSS_IDLE_SPRITE_PATH)
-            frames = sheet.get_animation_frames(72, 72) # Use provided frame dimensions
-            self.animations['idle'] = [pygame.transform.scale(frame, boss_size) for frame in frames]
-        except (pygame.error, FileNotFoundError):
-            placeholder_frame = pygame.Surface(boss_size, pygame.SRCALPHA); placeholder_frame.fill(PURPLE)
-            self.animations['idle'] = [placeholder_frame] * 4
+        def placeholder(size, color, count):
+            def build():
+                placeholder_frame = pygame.Surface(size, pygame.SRCALPHA); placeholder_frame.fill(color)
+                return [placeholder_frame] * count
+            return build
+
+        def load(action, path, frame_size, size, fallback):
+            for flip in (False, True):
+                self.variants[action, flip, False] = ASSETS.get_frames(path, frame_size, size, flip=flip, fallback=fallback)
+                self.variants[action, flip, True] = ASSETS.get_frames(path, frame_size, size, flip=flip, fallback=fallback, tint=self.flash_tint)
+            self.animations[action] = self.variants[action, False, False]
+
+        # Idle, Walk and Death animations use the provided 72x72 frame dimensions
+        load('idle', BOSS_IDLE_SPRITE_PATH, (72, 72), boss_size, placeholder(boss_size, PURPLE, 4))
+        load('walk', BOSS_WALK_SPRITE_PATH, (72, 72), boss_size, placeholder(boss_size, DARK_PURPLE, 4))
+        load('death', BOSS_DEATH_SPRITE_PATH, (72, 72), boss_size, placeholder(boss_size, RED, 4))
 
-        # Load Walk animation
-        try:
-            sheet = SpriteSheet(BOSS_WALK_SPRITE_PATH)
-            frames = sheet.get_animation_frames(72, 72) # Use provided frame dimensions
-            self.animations['walk'] = [pygame.transform.scale(frame, boss_size) for frame in frames]
-        except (pygame.error, FileNotFoundError):
-            placeholder_frame = pygame.Surface(boss_size, pygame.SRCALPHA); placeholder_frame.fill(DARK_PURPLE)
-            self.animations['walk'] = [placeholder_frame] * 4
-        
-        # Load Death animation
-        try:
-            sheet = SpriteSheet(BOSS_DEATH_SPRITE_PATH)
-            frames = sheet.get_animation_frames(72, 72) # Use provided frame dimensions
-            self.animations['death'] = [pygame.transform.scale(frame, boss_size) for frame in frames]
-        except (pygame.error, FileNotFoundError):
-            placeholder_frame = pygame.Surface(boss_size, pygame.SRCALPHA); placeholder_frame.fill(RED)
-            self.animations['death'] = [placeholder_frame] * 4
-        
         # Load Explosion animation
         explosion_size = (128, 128) # Larger size for explosion effect
-        try:
-            sheet = SpriteSheet(BOSS_EXPLOSION_SPRITE_PATH)
-            frames = sheet.get_animation_frames(64, 52) # Use provided frame dimensions for explosion
-            self.animations['explosion'] = [pygame.transform.scale(frame, explosion_size) for frame in frames]
-        except (pygame.error, FileNotFoundError):
-            placeholder_frame = pygame.Surface(explosion_size, pygame.SRCALPHA); placeholder_frame.fill(ORANGE)
-            self.animations['explosion'] = [placeholder_frame] * 32 # Use number of frames provided
+        load('explosion', BOSS_EXPLOSION_SPRITE_PATH, (64, 52), explosion_size, placeholder(explosion_size, ORANGE, 32)) # Use number of frames provided
 
     def animate(self):
-        now = pygame.time.get_ticks()
-        current_animation = self.animations.get(self.action)
-        if not current_animation:
-            current_animation = self.animations['idle'] # Fallback
+        now = CLOCK.get_ticks()
+        action = self.action if self.action in self.animations else 'idle' # Fallback
+        current_animation = self.animations[action]
 
         animation_speed = 150 # Default speed
         is_looping_animation = True
@@ -1185,13 +1248,13 @@ class Boss(pygame.sprite.Sprite):
                 self.frame_index = (self.frame_index + 1) % len(current_animation)
             # If it's a non-looping animation and we're at the last frame, keep it there.
 
-            new_image = current_animation[self.frame_index]
-            if self.direction == -1: # Assuming Boss also flips based on direction
-                new_image = pygame.transform.flip(new_image, True, False)
+            facing_left = self.direction == -1 # Assuming Boss also flips based on direction
+            new_image = self.variants[action, facing_left, False][self.frame_index]
             
             center = self.rect.center
             self.image, self.rect = new_image, new_image.get_rect(center=center)
-            self.original_image = self.image.copy() # Update original_image for flashing
+            self.original_image = self.image # Update original_image for flashing
+            self.flash_image = self.variants[action, facing_left, True][self.frame_index]
 
     def load_image(self):
         # Placeholder image for the boss
@@ -1220,7 +1283,7 @@ class Boss(pygame.sprite.Sprite):
                     self.rect.bottom = platform.rect.top
                     self.vy = 0
                     self.dying_state = 'exploding'
-                    self.explosion_start_time = pygame.time.get_ticks()
+                    self.explosion_start_time = CLOCK.get_ticks()
                     self.game.start_screen_shake(duration=500, intensity=5) # 0.5s shake, medium intensity
                     self.game._play_sfx('explosion') # Play explosion sound
                     break # Stop checking for platforms once landed
@@ -1260,7 +1323,7 @@ class Boss(pygame.sprite.Sprite):
         
         self.animate() # Update boss animation
 
-        now = pygame.time.get_ticks() # Use pygame.time.get_ticks() for consistency
+        now = CLOCK.get_ticks() # Use CLOCK.get_ticks() for consistency
         if now - self.last_shot_time > self.shoot_interval and self.shoot_interval != float('inf'): # Check if boss is still attacking
             self.last_shot_time = now
             if self.boss_type == 1:
@@ -1272,14 +1335,12 @@ class Boss(pygame.sprite.Sprite):
         
         # Handle flashing
         if self.is_flashing:
-            if pygame.time.get_ticks() - self.flash_timer > self.flash_duration:
+            if CLOCK.get_ticks() - self.flash_timer > self.flash_duration:
                 self.is_flashing = False
-                self.image = self.original_image.copy() # Revert to original
+                self.image = self.original_image # Revert to original
             else:
                 # Simple flash: make it brighter
-                flash_image = self.original_image.copy()
-                flash_image.fill((100, 100, 100, 0), special_flags=pygame.BLEND_ADD) # Brighten
-                self.image = flash_image
+                self.image = self.flash_image
 
 
     def shoot_pattern_boss1(self):
@@ -1303,18 +1364,18 @@ class Boss(pygame.sprite.Sprite):
             self.shoot_pattern_3()
 
     def shoot_pattern_1(self):
-        proj = BossProjectile(self.rect.centerx, self.rect.bottom, 0, 5)
+        proj = BOSS_PROJECTILE_POOL.acquire(self.rect.centerx, self.rect.bottom, 0, 5)
         self.game.all_sprites.add(proj); self.game.boss_projectiles.add(proj)
 
     def shoot_pattern_2(self):
         for angle in range(0, 360, 45):
-            proj = BossProjectile(self.rect.centerx, self.rect.centery, math.cos(math.radians(angle))*4, math.sin(math.radians(angle))*4)
+            proj = BOSS_PROJECTILE_POOL.acquire(self.rect.centerx, self.rect.centery, math.cos(math.radians(angle))*4, math.sin(math.radians(angle))*4)
             self.game.all_sprites.add(proj); self.game.boss_projectiles.add(proj)
 
     def shoot_pattern_3(self):
         for i in range(2):
             angle = (self.pattern_counter*15 + i*180)%360
-            proj = BossProjectile(self.rect.centerx, self.rect.centery, math.cos(math.radians(angle))*5, math.sin(math.radians(angle))*5)
+            proj = BOSS_PROJECTILE_POOL.acquire(self.rect.centerx, self.rect.centery, math.cos(math.radians(angle))*5, math.sin(math.radians(angle))*5)
             self.game.all_sprites.add(proj); self.game.boss_projectiles.add(proj)
         self.pattern_counter+=1
 
@@ -1331,8 +1392,8 @@ class Boss(pygame.sprite.Sprite):
                 # Disable boss movement and attacks immediately
                 self.speed = 0
                 self.shoot_interval = float('inf') # Stop attacking
-                self.death_fall_start_time = pygame.time.get_ticks()
+                self.death_fall_start_time = CLOCK.get_ticks()
             return
         self.is_flashing = True
-        self.flash_timer = pygame.time.get_ticks()
+        self.flash_timer = CLOCK.get_ticks()
         # No image change here, handled in update()
\ No newline at end of file
@@ -0,0 +1,100 @@
+import builtins
+import os
+import sys
+import time
+from contextlib import nullcontext
+
+NULL_SECTION = nullcontext()
+
+
+class Section:
+    __slots__ = ('profile', 'name', 'start')
+
+    def __init__(self, profile, name):
+        self.profile = profile
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.profile.sections[self.name] = (time.perf_counter() - self.start) * 1000
+
+
+class StartupProfile:
+    """Where the time goes between launch and an interactive home screen.
+
+    Turned on with --profile-startup or SPOONHEAD_PROFILE_STARTUP=1, and
+    main.py imports this module first. It then times every first import
+    through __import__: self time excludes nested imports, as with
+    python -X importtime. `with STARTUP.section(name):` times the parts of
+    Game.__init__, and mark() records milestones since launch. report()
+    prints all of it plus the preloader's asset groups. With enabled False
+    only the milestones are kept.
+    """
+    def __init__(self, enabled):
+        self.enabled = enabled
+        self.started = time.perf_counter()
+        self.imports = []   # (module, self ms, total ms, depth) in import order
+        self.sections = {}  # name -> ms
+        self.marks = {}     # milestone -> ms since launch
+        self.nested = []    # total ms of the imports nested in each open import
+        self.reported = False
+        if enabled:
+            self.original_import = builtins.__import__
+            builtins.__import__ = self.timed_import
+
+    def timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if level or name in sys.modules:
+            return self.original_import(name, globals, locals, fromlist, level)
+        depth = len(self.nested)
+        self.nested.append(0.0)
+        start = time.perf_counter()
+        try:
+            return self.original_import(name, globals, locals, fromlist, level)
+        finally:
+            total = (time.perf_counter() - start) * 1000
+            nested = self.nested.pop()
+            if self.nested:
+                self.nested[-1] += total
+            self.imports.append((name, total - nested, total, depth))
+
+    def section(self, name):
+        if not self.enabled:
+            return NULL_SECTION
+        return Section(self, name)
+
+    def mark(self, name):
+        """Records the first time a milestone is reached; returns its ms since launch."""
+        if name not in self.marks:
+            self.marks[name] = (time.perf_counter() - self.started) * 1000
+        return self.marks[name]
+
+    def report(self, preloader=None, heaviest=10):
+        """Prints the profile once and stops timing imports (later ones are the lazy, on-demand modules)."""
+        if not self.enabled or self.reported:
+            return
+        self.reported = True
+        builtins.__import__ = self.original_import
+        print("--- Startup profile (ms) ---")
+        print("Imports by main.py, including what they import:")
+        for name, _, total, depth in self.imports:
+            if depth == 0:
+                print(f"  {name:<28} {total:8.1f}")
+        print("Heaviest modules, self time:")
+        for name, own, _, _ in sorted(self.imports, key=lambda item: item[1], reverse=True)[:heaviest]:
+            print(f"  {name:<28} {own:8.1f}")
+        print("Game.__init__:")
+        for name, ms in self.sections.items():
+            print(f"  {name:<28} {ms:8.1f}")
+        if preloader:
+            print("Asset groups (decoding on workers / finishing on the main thread / ready since launch):")
+            for group, (load_ms, finish_ms, ready_at) in preloader.timings.items():
+                ready = f"{(ready_at - self.started) * 1000:8.1f}" if ready_at else "   still loading"
+                print(f"  {group:<28} {load_ms:8.1f} {finish_ms:8.1f} {ready}")
+        print("Milestones since launch:")
+        for name, ms in self.marks.items():
+            print(f"  {name:<28} {ms:8.1f}")
+
+
+STARTUP = StartupProfile('--profile-startup' in sys.argv or os.environ.get('SPOONHEAD_PROFILE_STARTUP') == '1')
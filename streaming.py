@@ -0,0 +1,63 @@
+from settings import SCREEN_WIDTH, LEVEL_CHUNK_WIDTH, LEVEL_STREAM_MARGIN
+
+STREAMED = ('coins', 'enemies', 'power_up_boxes') # level data keys, also the Game groups they go in
+
+
+def spawn_x(kind, data):
+    return data['x'] if kind == 'enemies' else data[0]
+
+
+class LevelStream:
+    """A level's coins, enemies and power-up boxes, built chunk by chunk as the camera gets near.
+
+    The entries of the level data are bucketed by spawn x into chunks
+    chunk_width wide. update() loads every chunk within `margin` of the
+    screen: its entities are built through Game.build_level_entity the first
+    time, then added to their groups. A chunk more than one further chunk
+    away is unloaded: survivors leave their groups but are kept, so an enemy
+    comes back as hurt as it left, and the collected or killed are dropped
+    for good. Within a chunk entities are built in level data order, so with
+    chunk_width None (one chunk) the level is built exactly as before
+    streaming. Platforms are not streamed: the platform index and the static
+    level layer cover the whole level.
+    """
+    def __init__(self, level_data, chunk_width=LEVEL_CHUNK_WIDTH, margin=LEVEL_STREAM_MARGIN):
+        self.chunk_width = chunk_width
+        self.margin = margin
+        self.pending = {}  # chunk -> [(kind, data)] not built yet
+        self.kept = {}     # chunk -> [(kind, sprite)] built, in their groups while the chunk is loaded
+        self.loaded = set()
+        self.built = 0
+        for kind in STREAMED:
+            for data in level_data.get(kind, []):
+                chunk = max(0, int(spawn_x(kind, data) // chunk_width)) if chunk_width else 0
+                self.pending.setdefault(chunk, []).append((kind, data))
+                self.kept.setdefault(chunk, [])
+
+    def update(self, game, camera_x):
+        """Loads the chunks near the camera at camera_x and unloads the far ones."""
+        if self.chunk_width:
+            first = int((camera_x - self.margin) // self.chunk_width)
+            last = int((camera_x + SCREEN_WIDTH + self.margin) // self.chunk_width)
+        else:
+            first = last = 0
+        for chunk in [chunk for chunk in self.loaded if chunk < first - 1 or chunk > last + 1]:
+            self.unload(chunk)
+        for chunk in range(max(first, 0), last + 1):
+            if chunk in self.kept and chunk not in self.loaded:
+                self.load(game, chunk)
+
+    def load(self, game, chunk):
+        built = [(kind, game.build_level_entity(kind, data)) for kind, data in self.pending.pop(chunk, ())]
+        self.built += len(built)
+        self.kept[chunk].extend(built)
+        for kind, sprite in self.kept[chunk]:
+            game.add_level_entity(kind, sprite)
+        self.loaded.add(chunk)
+
+    def unload(self, chunk):
+        survivors = [(kind, sprite) for kind, sprite in self.kept[chunk] if sprite.alive()]
+        for _, sprite in survivors:
+            sprite.kill()
+        self.kept[chunk] = survivors
+        self.loaded.discard(chunk)
@@ -0,0 +1,59 @@
+import pygame
+from collections import OrderedDict
+from settings import PIXEL_FONT
+from profiler import PROFILER
+
+class TextCache:
+    """Pixel-font objects keyed by size plus an LRU of rendered text surfaces.
+
+    Rendered surfaces are keyed by (text, size, color, antialias) and evicted
+    least-recently-used first once their pixel memory exceeds max_bytes.
+    """
+    def __init__(self, font_path=PIXEL_FONT, max_bytes=8 * 1024 * 1024):
+        self.font_path = font_path
+        self.max_bytes = max_bytes
+        self.fonts = {}
+        self.surfaces = OrderedDict()
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get_font(self, size):
+        font = self.fonts.get(size)
+        if font is None:
+            font = pygame.font.Font(self.font_path, size)
+            self.fonts[size] = font
+        return font
+
+    def render(self, text, size, color, antialias=True):
+        """Returns a shared, read-only Surface with text rendered in the pixel font."""
+        key = (text, size, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        PROFILER.count('text allocs')
+        surface = self.get_font(size).render(text, antialias, color)
+        self.surfaces[key] = surface
+        self.used_bytes += self._size_of(surface)
+        while self.used_bytes > self.max_bytes and len(self.surfaces) > 1:
+            _, evicted = self.surfaces.popitem(last=False)
+            self.used_bytes -= self._size_of(evicted)
+        return surface
+
+    def _size_of(self, surface):
+        return surface.get_pitch() * surface.get_height()
+
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self):
+        self.surfaces.clear()
+        self.used_bytes = 0
+
+
+TEXT = TextCache()
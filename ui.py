@@ -1,5 +1,6 @@
 import pygame
-from settings import PIXEL_FONT
+from text_cache import TEXT
+from menu_renderer import MENUS
 
 class Button:
     """Simple button class"""
@@ -9,16 +10,17 @@ class Button:
         self.color = color
         self.hover_color = hover_color
         self.text_color = text_color
-        self.font = pygame.font.Font(PIXEL_FONT, font_size)
+        self.font_size = font_size
 
     def draw(self, screen, mouse_pos):
         is_hovered = self.rect.collidepoint(mouse_pos)
         color = self.hover_color if is_hovered else self.color
+        MENUS.track(self.rect, is_hovered)
         
         pygame.draw.rect(screen, color, self.rect)
         pygame.draw.rect(screen, self.text_color, self.rect, 2)
 
-        text_surface = self.font.render(self.text, True, self.text_color)
+        text_surface = TEXT.render(self.text, self.font_size, self.text_color)
         text_rect = text_surface.get_rect(center=self.rect.center)
         screen.blit(text_surface, text_rect)
 